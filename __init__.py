@@ -8,17 +8,23 @@ bl_info = {
     "category": "Development",
 }
 
-import bpy
+try:
+    import bpy
+except ImportError:
+    # imported outside Blender, e.g. to compile plans with plan.py, only the
+    # modules that don't need bpy can be used
+    bpy = None
 
 
 # IMPORT SPECIFICS
 ##################################
 
-from . import   (
-    ritebite,
-    cut,
-    start_end
-)
+if bpy is not None:
+    from . import   (
+        ritebite,
+        cut,
+        start_end
+    )
 
 
 # register
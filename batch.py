@@ -0,0 +1,135 @@
+"""
+Builds and renders many sheets of a workbook without the UI:
+
+    blender -b --python batch.py -- Editing.xlsx "Ep*" Nimona --jobs 2
+
+Every selected sheet is built with final() in this Blender process, saved
+to a temporary .blend and rendered by a pool of at most --jobs background
+Blender processes while the next sheet is being built. Per sheet build and
+render times are printed at the end (and written as JSON with --report).
+--preview renders fast drafts (<name>_preview.mp4) instead.
+"""
+
+import argparse
+import fnmatch
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+def addon_module(name):
+    """
+    Imports a module of the add-on, also when this file is run as a script
+    """
+    if __package__:
+        return importlib.import_module('.' + name, __package__)
+    folder = os.path.dirname(os.path.abspath(__file__))
+    if os.path.dirname(folder) not in sys.path:
+        sys.path.insert(0, os.path.dirname(folder))
+    return importlib.import_module(os.path.basename(folder) + '.' + name)
+
+def select_sheets(excel, patterns):
+    """
+    Sheets matching any of the names / glob patterns. Without patterns every
+    sheet that has a video folder next to the workbook is picked.
+    """
+    names = addon_module('sheets').sheet_names(excel)
+    if patterns:
+        return [n for n in names if any(fnmatch.fnmatchcase(n, p) for p in patterns)]
+    excel_dir = os.path.dirname(excel)
+    return [n for n in names if os.path.isdir(excel_dir + os.sep + n)]
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+def run_batch(excel, patterns, jobs=2, render=True, preview=None, premix=False):
+    """
+    Returns {sheet: {'build': seconds, 'render': seconds, 'output': path}},
+    with 'error' instead for sheets that failed. preview is None for full
+    renders or (percentage, stride) for drafts. premix builds the sheets
+    with their sound pre-mixed into one track.
+    """
+    start_end = addon_module('start_end')
+    render_module = addon_module('render')
+    render_file = render_module.render_file
+    settings = render_module.preview_settings(*preview) if preview else ''
+    excel = os.path.abspath(excel)
+    sheets = select_sheets(excel, patterns)
+    threads = max(1, os.cpu_count() // jobs)
+    report = {}
+    work = tempfile.mkdtemp(prefix='ritebite_batch_')
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            renders = {}
+            for n, sheet in enumerate(sheets):
+                print(f"Building {sheet} ({n+1}/{len(sheets)})")
+                try:
+                    report[sheet] = {'build': timed(start_end.final, excel, sheet, premix)}
+                except Exception as e:
+                    # one broken sheet doesn't stop the batch, and its half
+                    # built strips don't leak into the next sheet
+                    print(f"Failed to build {sheet}\n{e!r}")
+                    report[sheet] = {'error': str(e)}
+                    start_end.clear()
+                    continue
+                if render:
+                    blend = os.path.join(work, f"sheet_{n:03d}.blend")
+                    bpy.ops.wm.save_as_mainfile(filepath=blend, copy=True)
+                    output = bpy.context.scene.render.filepath
+                    if preview:
+                        output = render_module.preview_path(output)
+                    report[sheet]['output'] = output
+                    renders[sheet] = pool.submit(timed, render_file, blend, output, threads, settings)
+            for sheet, future in renders.items():
+                try:
+                    report[sheet]['render'] = future.result()
+                except Exception as e:
+                    print(f"Failed to render {sheet}\n{e}")
+                    report[sheet]['error'] = str(e)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    return report
+
+def print_report(report):
+    for sheet, times in report.items():
+        if 'error' in times:
+            print(f"{sheet:<24} failed: {times['error']}")
+        elif 'render' in times:
+            print(f"{sheet:<24} build {times['build']:8.2f}s  render {times['render']:8.2f}s  {times['output']}")
+        else:
+            print(f"{sheet:<24} build {times['build']:8.2f}s")
+
+def main(argv):
+    # blender passes everything after -- through to the script
+    argv = argv[argv.index('--')+1:] if '--' in argv else argv[1:]
+    parser = argparse.ArgumentParser(prog='blender -b --python batch.py --',
+                                     description='Build and render sheets of a RiteBite workbook')
+    parser.add_argument('workbook')
+    parser.add_argument('sheets', nargs='*', help='sheet names or glob patterns (default: every sheet with a video folder)')
+    parser.add_argument('--jobs', type=int, default=2, help='sheets rendered at the same time')
+    parser.add_argument('--no-render', action='store_true', help='only build the timelines')
+    parser.add_argument('--report', help='write the timings to this JSON file')
+    parser.add_argument('--preview', action='store_true', help='render fast low resolution drafts instead')
+    parser.add_argument('--preview-size', type=int, default=50, help='resolution percentage of the drafts')
+    parser.add_argument('--stride', type=int, default=1, help='render every Nth frame of the drafts')
+    parser.add_argument('--premix', action='store_true', help='pre-mix the sound of each sheet into one track')
+    args = parser.parse_args(argv)
+
+    preview = (args.preview_size, max(1, args.stride)) if args.preview else None
+    report = run_batch(args.workbook, args.sheets, max(1, args.jobs), not args.no_render, preview, args.premix)
+    print_report(report)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 1 if any('error' in t for t in report.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,374 @@
+"""
+Scaling benchmark for the timeline builder:
+
+    python benchmark.py --sizes 10 100 1000 10000 --report bench.json
+    blender -b --python benchmark.py -- --media clip.mov
+
+Synthetic sheets with the given number of rows, spread over the clip,
+text, image, color and sound sections, are built with final() and cut().
+Each size is built cold (sheet cache and strips cleared) and then a second
+time warm, when nothing changed and nothing should be touched. Time, peak
+Python memory, the profile stages and, with the recording stand-in for bpy,
+the number of API calls and property writes are reported, plus how the
+time grows from one size to the next (1.0 is linear).
+
+Outside Blender the recording stand-in is always used. Inside Blender the
+real bpy is used when --media names a movie file for the clip and sound
+rows, otherwise (or with --stand-in) the stand-in replaces it.
+"""
+
+import argparse
+import collections
+import importlib
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+SIZES = (10, 100, 1000, 10000)
+# share of the rows each section gets
+SHARES = (('clip', 0.2), ('text', 0.3), ('image', 0.2), ('color', 0.2), ('sound', 0.1))
+FONTS = ('Arial Bold', 'Arial', 'Arial Italic')
+COLORS = ('ffffffff', 'ffcc00ff', 'ff8080cc')
+
+# recording stand-in for bpy
+##################################
+
+calls = collections.Counter()
+writes = collections.Counter()
+
+class Recorder:
+    """
+    Object whose attribute writes are counted, per class and attribute
+    """
+    def __init__(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        writes[f"{type(self).__name__}.{name}"] += 1
+        object.__setattr__(self, name, value)
+
+class Transform(Recorder):
+    pass
+
+class Proxy(Recorder):
+    pass
+
+class Strip(Recorder):
+    def __init__(self, name, type, channel, frame_start, length):
+        super().__init__(name=name, type=type, channel=channel, frame_start=frame_start,
+                         frame_offset_start=0, frame_final_duration=length, ids={},
+                         volume=1.0, blend_alpha=1.0, fps=25.0, use_proxy=False,
+                         transform=Transform(offset_x=0, offset_y=0, scale_x=1, scale_y=1),
+                         proxy=Proxy(), location=[0.5, 0.5], children=[])
+
+    @property
+    def frame_final_start(self):
+        return self.frame_start + self.frame_offset_start
+
+    @property
+    def frame_final_end(self):
+        return self.frame_final_start + self.frame_final_duration
+
+    @frame_final_end.setter
+    def frame_final_end(self, value):
+        self.frame_final_duration = value - self.frame_final_start
+
+    def __getitem__(self, key):
+        return self.ids[key]
+
+    def __setitem__(self, key, value):
+        writes['Strip[]'] += 1
+        self.ids[key] = value
+
+    def get(self, key, default=None):
+        return self.ids.get(key, default)
+
+    def keyframe_insert(self, data_path, frame):
+        calls['keyframe_insert'] += 1
+
+    def move_to_meta(self, meta):
+        calls['move_to_meta'] += 1
+        meta.children.append(self)
+        list.remove(bpy_stand_in.context.scene.sequence_editor.sequences, self)
+
+class Sequences(list):
+    def add(self, strip):
+        calls[f"sequences.new_{strip.type.lower()}"] += 1
+        self.append(strip)
+        return strip
+
+    def new_movie(self, name, filepath, channel, frame_start, fit_method='FIT'):
+        return self.add(Strip(name, 'MOVIE', channel, frame_start, 1000))
+
+    def new_sound(self, name, filepath, channel, frame_start):
+        return self.add(Strip(name, 'SOUND', channel, frame_start, 1000))
+
+    def new_image(self, name, filepath, channel, frame_start, fit_method='FIT'):
+        return self.add(Strip(name, 'IMAGE', channel, frame_start, 1))
+
+    def new_effect(self, name, type, channel, frame_start, frame_end=0):
+        return self.add(Strip(name, type, channel, frame_start, frame_end - frame_start))
+
+    def new_meta(self, name, channel, frame_start):
+        return self.add(Strip(name, 'META', channel, frame_start, 1))
+
+    def remove(self, strip):
+        calls['sequences.remove'] += 1
+        list.remove(self, strip)
+
+class SequenceEditor:
+    def __init__(self):
+        self.sequences = Sequences()
+
+    @property
+    def sequences_all(self):
+        return list(self.sequences) + [c for s in self.sequences for c in s.children]
+
+class Scene(Recorder):
+    def __init__(self):
+        render = Recorder(image_settings=Recorder(), ffmpeg=Recorder(), filepath='', fps=25, fps_base=1.0)
+        super().__init__(sequence_editor=None, frame_start=1, frame_end=250, render=render)
+
+    def sequence_editor_create(self):
+        calls['sequence_editor_create'] += 1
+        object.__setattr__(self, 'sequence_editor', SequenceEditor())
+
+class Fonts(dict):
+    def load(self, filepath, check_existing=False):
+        calls['fonts.load'] += 1
+        font = self.setdefault(filepath, types.SimpleNamespace(name=filepath, filepath=filepath))
+        return font
+
+class Ops:
+    """
+    bpy.ops stand-in, every operator call is counted and does nothing
+    """
+    def __init__(self, path='ops'):
+        self.path = path
+
+    def __getattr__(self, name):
+        return Ops(f"{self.path}.{name}")
+
+    def __call__(self, *args, **kwargs):
+        calls[self.path] += 1
+        return {'FINISHED'}
+
+def stand_in_bpy():
+    bpy = types.ModuleType('bpy')
+    bpy.context = types.SimpleNamespace(scene=Scene())
+    bpy.data = types.SimpleNamespace(fonts=Fonts())
+    bpy.ops = Ops()
+    bpy.app = types.SimpleNamespace(binary_path='', version=(3, 5, 0), background=True,
+                                    timers=types.SimpleNamespace(register=lambda *a, **k: None))
+    bpy.path = types.SimpleNamespace(abspath=lambda path: path)
+    # enough for the add-on's __init__ to import its UI module
+    bpy.props = types.ModuleType('bpy.props')
+    for name in ('StringProperty', 'IntProperty', 'BoolProperty', 'FloatProperty', 'EnumProperty', 'PointerProperty'):
+        setattr(bpy.props, name, lambda **kwargs: None)
+    bpy.types = types.ModuleType('bpy.types')
+    bpy.types.Operator = bpy.types.Panel = bpy.types.PropertyGroup = object
+    bpy.types.Scene = types.SimpleNamespace()
+    bpy.utils = types.SimpleNamespace(register_class=lambda c: None, unregister_class=lambda c: None)
+    return bpy
+
+bpy_stand_in = None
+
+def install_stand_in():
+    global bpy_stand_in
+    bpy_stand_in = stand_in_bpy()
+    sys.modules['bpy'] = bpy_stand_in
+    sys.modules['bpy.props'] = bpy_stand_in.props
+    sys.modules['bpy.types'] = bpy_stand_in.types
+
+def reset_scene(bpy):
+    if bpy is bpy_stand_in:
+        bpy.context.scene = Scene()
+        bpy.data.fonts.clear()
+    else:
+        sequence_editor = bpy.context.scene.sequence_editor
+        if sequence_editor is not None:
+            for strip in list(sequence_editor.sequences):
+                sequence_editor.sequences.remove(strip)
+
+# synthetic sheets
+##################################
+
+def section_sizes(rows):
+    sizes = {kind: max(1, int(rows * share)) for kind, share in SHARES}
+    sizes['clip'] += rows - sum(sizes.values())
+    return sizes
+
+def synthetic_rows(rows, media):
+    """
+    Sheet rows with every section, overlays overlapping so the channel
+    allocation has work to do
+    """
+    sizes = section_sizes(rows)
+    clip_file = os.path.basename(media) if media else 'clip.mov'
+    sheet = []
+    sheet.append(['clip', 'start', 'end', 'sound', 'effect', 'channel', 'show'])
+    for n in range(sizes['clip']):
+        sheet.append([clip_file, 1 + n % 50, 60 + n % 50, 1, 'NO' if n % 4 else 'FADE', 2, 1])
+    sheet.append([])
+    sheet.append(['text', 'start', 'end', 'font', 'size', 'x', 'y', 'color', 'shadow', 'box',
+                  'box_color', 'bold', 'italic', 'channel', 'show'])
+    for n in range(sizes['text']):
+        text = f"line {n};second line" if n % 3 == 0 else f"title {n}"
+        sheet.append([text, 1 + 20*n, 60 + 20*n, FONTS[n % len(FONTS)], 60, 0.5, 0.2,
+                      COLORS[n % len(COLORS)], 1, n % 2, 'ffffffcc', 1, 0, 10, 1])
+    sheet.append([])
+    sheet.append(['image', 'start', 'end', 'x', 'y', 'scale_x', 'scale_y', 'channel', 'show'])
+    for n in range(sizes['image']):
+        sheet.append([f"image_{n % 10}.png", 1 + 25*n, 80 + 25*n, 0.5, 0.5, 0.3, 0.3, 12, 1])
+    sheet.append([])
+    sheet.append(['color', 'start', 'end', 'x', 'y', 'scale_x', 'scale_y', 'channel', 'show'])
+    for n in range(sizes['color']):
+        sheet.append([COLORS[n % len(COLORS)], 1 + 25*n, 70 + 25*n, 0.5, 0.1, 1, 0.2, 8, 1])
+    sheet.append([])
+    sheet.append(['sound', 'start', 'end', 'sound', 'channel', 'show'])
+    for n in range(sizes['sound']):
+        sheet.append([clip_file, 1 + 100*n, 90 + 100*n, 0.5, 5, 1])
+    return sheet
+
+def cut_rows(rows, media):
+    clip_file = os.path.basename(media) if media else 'clip.mov'
+    sheet = [['clip', 'start', 'end', 'sound', 'show']]
+    sheet += [[clip_file, 1 + n % 50, 60 + n % 50, 1, 1] for n in range(rows)]
+    return sheet
+
+def write_csv(path, rows):
+    import csv
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(rows)
+
+# running
+##################################
+
+def load_addon():
+    """
+    The add-on package this file belongs to, imported by its folder name
+    """
+    folder = os.path.dirname(os.path.abspath(__file__))
+    if os.path.dirname(folder) not in sys.path:
+        sys.path.insert(0, os.path.dirname(folder))
+    return os.path.basename(folder)
+
+def measure(profiling, recording, function, *args):
+    """
+    Time, peak memory, profile stage calls and, when recording, the bpy
+    calls and writes of one function call
+    """
+    calls.clear()
+    writes.clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    function(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    report = profiling.last_report
+    stages = {name: s['calls'] for name, s in report['stages'].items()} if report else {}
+    result = {'seconds': seconds, 'peak_mb': peak / 1024**2, 'stages': stages}
+    if recording:
+        result.update(calls=sum(calls.values()), writes=sum(writes.values()), api=dict(calls))
+    return result
+
+def run_size(package, bpy, rows, work, media):
+    start_end = importlib.import_module(package + '.start_end')
+    cut = importlib.import_module(package + '.cut')
+    cache = importlib.import_module(package + '.cache')
+    profiling = importlib.import_module(package + '.profiling')
+    recording = bpy is bpy_stand_in
+    results = {}
+    for name, builder, make_rows in (('final', start_end.final, synthetic_rows), ('cut', cut.cut, cut_rows)):
+        excel = os.path.join(work, f"{name}_{rows}.csv")
+        sheet = f"{name}_{rows}"
+        os.makedirs(os.path.join(work, sheet), exist_ok=True)
+        if media:
+            target = os.path.join(work, sheet, os.path.basename(media))
+            if not os.path.exists(target):
+                shutil.copy(media, target)
+        write_csv(excel, make_rows(rows, media))
+        cache.clear_cache(excel)
+        reset_scene(bpy)
+        results[name] = {'cold': measure(profiling, recording, builder, excel, sheet),
+                         'warm': measure(profiling, recording, builder, excel, sheet)}
+    return results
+
+def scaling(sizes, results, name, run):
+    """
+    Growth exponent of the time between consecutive sizes
+    """
+    exponents = []
+    for small, big in zip(sizes, sizes[1:]):
+        t0 = results[small][name][run]['seconds']
+        t1 = results[big][name][run]['seconds']
+        exponents.append(math.log(t1 / t0) / math.log(big / small) if t0 > 0 and t1 > 0 else None)
+    return exponents
+
+def print_results(sizes, results):
+    for name in ('final', 'cut'):
+        print(f"\n{name}")
+        print(f"{'rows':>7} {'cold s':>9} {'warm s':>9} {'peak MB':>9} {'calls':>8} {'writes':>8} {'warm calls':>10}")
+        for rows in sizes:
+            cold = results[rows][name]['cold']
+            warm = results[rows][name]['warm']
+            print(f"{rows:>7} {cold['seconds']:>9.3f} {warm['seconds']:>9.3f} {cold['peak_mb']:>9.1f} "
+                  f"{cold.get('calls', '-'):>8} {cold.get('writes', '-'):>8} {warm.get('calls', '-'):>10}")
+        for run in ('cold', 'warm'):
+            exponents = ', '.join('-' if e is None else f"{e:.2f}" for e in scaling(sizes, results, name, run))
+            print(f"{run} scaling: {exponents}")
+
+def main(argv):
+    # blender passes everything after -- through to the script
+    argv = argv[argv.index('--')+1:] if '--' in argv else argv[1:]
+    parser = argparse.ArgumentParser(prog='benchmark.py', description='Scaling benchmark of final() and cut()')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='rows per synthetic sheet')
+    parser.add_argument('--media', help='movie file used by the clip and sound rows (needed with the real bpy)')
+    parser.add_argument('--stand-in', action='store_true', help='use the recording stand-in even inside Blender')
+    parser.add_argument('--report', help='write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    try:
+        import bpy
+        real = not args.stand_in and args.media is not None and bpy.app.binary_path
+    except ImportError:
+        real = False
+    if not real:
+        install_stand_in()
+        import bpy
+    print(f"Using {'Blender ' + bpy.app.version_string if real else 'the recording bpy stand-in'}")
+
+    package = load_addon()
+    fonts = importlib.import_module(package + '.fonts')
+    # the font index is scanned once per process, keep that out of the first size
+    fonts.get_font_file(FONTS[0])
+
+    cwd = os.getcwd()
+    work = tempfile.mkdtemp(prefix='ritebite_bench_')
+    results = {}
+    try:
+        for rows in args.sizes:
+            print(f"Building {rows} rows")
+            results[rows] = run_size(package, bpy, rows, work, os.path.abspath(args.media) if args.media else None)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work, ignore_errors=True)
+
+    print_results(args.sizes, results)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'bpy': 'real' if real else 'stand-in', 'results': results,
+                       'scaling': {name: {run: scaling(args.sizes, results, name, run) for run in ('cold', 'warm')}
+                                   for name in ('final', 'cut')}}, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
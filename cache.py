@@ -0,0 +1,80 @@
+import hashlib
+import logging
+import os
+import pickle
+
+log = logging.getLogger(__name__)
+
+# bump when the parsed row classes change shape or cells parse differently
+CACHE_VERSION = 4
+CACHE_FOLDER = ".ritebite"
+
+# (workbook, sheet, reader) -> (stamp, parsed rows)
+parsed = {}
+
+def workbook_stamp(excel):
+    """
+    mtime and size of the workbook, enough to tell that it was saved again
+    """
+    st = os.stat(excel)
+    return (CACHE_VERSION, st.st_mtime_ns, st.st_size)
+
+def cache_file(excel, sheet, reader):
+    name = f"{os.path.abspath(excel)}|{sheet}|{reader}"
+    digest = hashlib.md5(name.encode('utf-8')).hexdigest()
+    return os.path.join(os.path.dirname(excel), CACHE_FOLDER, f"sheet_{digest}.pickle")
+
+def load_cached(path, stamp):
+    try:
+        with open(path, 'rb') as f:
+            cached_stamp, rows = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if cached_stamp != stamp:
+        return None
+    return rows
+
+def save_cached(path, stamp, rows):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump((stamp, rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.warning(f"Could not write sheet cache {path}\n{e}")
+
+def cached_parse(excel, sheet, reader, parse):
+    """
+    Returns parse(excel, sheet), re-parsing only when the workbook changed
+    since the last call. Results are kept in memory and pickled into the
+    .ritebite folder next to the workbook so they survive a Blender restart.
+    reader names the parse function so final() and cut() get their own
+    entries for the same sheet. The returned rows are shared, don't mutate.
+    """
+    key = (os.path.abspath(excel), sheet, reader)
+    stamp = workbook_stamp(excel)
+    if key in parsed and parsed[key][0] == stamp:
+        return parsed[key][1]
+
+    path = cache_file(excel, sheet, reader)
+    rows = load_cached(path, stamp)
+    if rows is None:
+        log.info(f"Parsing {sheet} from {excel}")
+        rows = parse(excel, sheet)
+        save_cached(path, stamp, rows)
+    parsed[key] = (stamp, rows)
+    return rows
+
+def clear_cache(excel):
+    """
+    Forgets every parsed sheet of a workbook, in memory and on disk
+    """
+    excel = os.path.abspath(excel)
+    for key in [k for k in parsed if k[0] == excel]:
+        del parsed[key]
+    folder = os.path.join(os.path.dirname(excel), CACHE_FOLDER)
+    if os.path.isdir(folder):
+        for name in os.listdir(folder):
+            if name.startswith('sheet_'):
+                os.remove(os.path.join(folder, name))
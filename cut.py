@@ -1,145 +1,154 @@
-import math
-import datetime
-import os
-import shutil
-import csv
-import bpy
-import pandas as pd
-
-
-class Clip:
-    def __init__(self, file, start, end, sound, show):
-        self.file  = file
-        self.start = start
-        self.end   = end
-        self.sound = sound
-        self.show  = show
-
-    def __str__(self):
-        return f"{self.file}({self.start}, {self.end}, {self.sound})"
-
-def clean_sequencer(sequence_context):
-    bpy.ops.sequencer.select_all(sequence_context, action="SELECT")
-    bpy.ops.sequencer.delete(sequence_context)
-
-def find_sequence_editor():
-    for area in bpy.context.window.screen.areas:
-        if area.type == "SEQUENCE_EDITOR":
-            return area
-    return None
-
-def set_up_output_params(folder_path):
-    scene = bpy.context.scene
-    scene.render.image_settings.file_format = "FFMPEG"
-    scene.render.ffmpeg.format = "MPEG4"
-    scene.render.ffmpeg.constant_rate_factor = "PERC_LOSSLESS"
-
-    now = datetime.datetime.now()
-    time = now.strftime("%H-%M-%S")
-    filepath = os.path.join(folder_path, f"stitched_together_{time}.mp4")
-    scene.render.filepath = filepath
-
-
-def clean_proxies(video_folder_path):
-    """
-    This will delete the BL_proxies folder
-    """
-
-    def on_error(function, path, excinfo):
-        print(f"Failed to remove {path}\n{excinfo}")
-
-    bl_proxy_path = os.path.join(video_folder_path, "BL_proxy")
-    if os.path.exists(bl_proxy_path):
-        print(f"Removing the BL_proxies folder in {bl_proxy_path}")
-        shutil.rmtree(bl_proxy_path, ignore_errors=False, onerror=on_error)
-
-
-def trim_the_video(movie, clip_start_offset_frame, clip_frame_count):
-    # trim the start of the clip
-    movie.frame_offset_start = clip_start_offset_frame
-
-    # trim the end of the clip
-    movie.frame_final_duration = clip_frame_count
-
-
-def move_the_clip_into_position(movie, start_frame_pos, clip_start_offset_frame):
-    movie.frame_start = start_frame_pos - clip_start_offset_frame
-
-
-def apply_fade_in_to_clip(clip_transition_overlap):
-    # make sure the clips overlap
-    bpy.context.active_sequence_strip.frame_start -= clip_transition_overlap
-    bpy.ops.sequencer.fades_add(type="IN")
-
-def cut(excel, sheet):
-    """
-    Python code to create short clips from videos and stich them back to back
-    with a transition
-    """
-    excel_dir = os.path.dirname(excel)
-    video_folder_path = excel_dir + os.sep + sheet
-
-    os.chdir(video_folder_path)
-
-    set_up_output_params(video_folder_path)
-    clips = []
-    rows = pd.read_excel(excel,sheet)
-    items = rows.values.tolist()
-    for l in items:
-        print(type(l[0]),type(l[1]),type(l[2]),type(l[3]),type(l[4]))
-        if isinstance(l[0], float) and math.isnan(l[0]):
-            break
-        else:
-            clips.append(Clip(l[0],l[1],l[2],l[3],l[4]))
-
-    for c in clips:
-        print (c.file, c.start, c.end, c.sound, c.show)
-
-    sequence_editor = find_sequence_editor()
-
-    sequence_editor_context = {
-        "area": sequence_editor,
-    }
-    clean_sequencer(sequence_editor_context)
-    clean_proxies(video_folder_path)
-    start_frame_pos = 0
-    for clip in clips:
-        print(clip)
-        if clip.show == 1:
-            start = int(clip.start)
-            end   = int(clip.end)
-            count = end-start+1
-            print(start, end, count)
-            video_name = clip.file
-            # create a full path to the video
-            video_path = os.path.join(video_folder_path, video_name)
-            print(f"Processing video {video_path}")
-            # add video to the sequence editor
-            before = bpy.data.scenes['Scene'].sequence_editor.sequences_all.keys()
-            bpy.ops.sequencer.movie_strip_add(
-                sequence_editor_context,
-                filepath=video_path,
-                directory=video_folder_path + os.sep,
-                channel=1,
-                sound=True)
-            after = bpy.data.scenes['Scene'].sequence_editor.sequences_all.keys()
-            delta = set(after)-set(before)
-            for d in delta:
-                clip_start_offset_frame = start-1
-                movie = bpy.data.scenes['Scene'].sequence_editor.sequences_all[d]
-                trim_the_video(movie, clip_start_offset_frame, count)
-                move_the_clip_into_position(movie, start_frame_pos, clip_start_offset_frame)
-                if movie.type == 'SOUND':
-                    movie.volume = float(clip.sound)
-            start_frame_pos += count
-
-    # Set the final frame
-    if bpy.context.active_sequence_strip:
-        bpy.context.scene.frame_end = bpy.context.active_sequence_strip.frame_final_end
-    print('Done cutting!')
-    # Render the clip sequence
-    # bpy.ops.render.render(animation=True)
-
-
-if __name__ == "__main__":
-    cut()
+import datetime
+import logging
+import os
+import bpy
+from .cache import cached_parse
+from .sheets import read_rows, is_blank
+from .proxies import ProxyStore, proxy_store_path, use_proxy
+from .probe import MediaIndex, media_index_path
+from .render import render_chunked
+from .streamcopy import fast_cut
+from .profiling import stage, start_profile, finish_profile, profile_path
+
+log = logging.getLogger(__name__)
+
+
+class Clip:
+    def __init__(self, file, start, end, sound, show):
+        self.file  = file
+        self.start = start
+        self.end   = end
+        self.sound = sound
+        self.show  = show
+
+    def __str__(self):
+        return f"{self.file}({self.start}, {self.end}, {self.sound})"
+
+def set_up_output_params(folder_path):
+    scene = bpy.context.scene
+    scene.render.image_settings.file_format = "FFMPEG"
+    scene.render.ffmpeg.format = "MPEG4"
+    scene.render.ffmpeg.constant_rate_factor = "PERC_LOSSLESS"
+
+    now = datetime.datetime.now()
+    time = now.strftime("%H-%M-%S")
+    filepath = os.path.join(folder_path, f"stitched_together_{time}.mp4")
+    scene.render.filepath = filepath
+
+
+def trim_the_video(movie, clip_start_offset_frame, clip_frame_count):
+    # trim the start of the clip
+    movie.frame_offset_start = clip_start_offset_frame
+
+    # trim the end of the clip
+    movie.frame_final_duration = clip_frame_count
+
+
+def move_the_clip_into_position(movie, start_frame_pos, clip_start_offset_frame):
+    movie.frame_start = start_frame_pos - clip_start_offset_frame
+
+
+def read_clips(excel, sheet):
+    clips = []
+    with stage('sheet read'):
+        rows = read_rows(excel, sheet)
+        # the first row holds the column names
+        next(rows, None)
+        for l in rows:
+            log.debug(f"{l[:5]}")
+            if is_blank(l[0]):
+                break
+            else:
+                clips.append(Clip(l[0],l[1],l[2],l[3],l[4]))
+    return clips
+
+def cut(excel, sheet):
+    """
+    Python code to create short clips from videos and stich them back to back
+    with a transition
+    """
+    excel_dir = os.path.dirname(excel)
+    video_folder_path = excel_dir + os.sep + sheet
+
+    os.chdir(video_folder_path)
+
+    start_profile('cut')
+    set_up_output_params(video_folder_path)
+    clips = cached_parse(excel, sheet, 'cut', read_clips)
+
+    for c in clips:
+        log.debug(f"{c.file} {c.start} {c.end} {c.sound} {c.show}")
+
+    scene = bpy.context.scene
+    if scene.sequence_editor is None:
+        scene.sequence_editor_create()
+    sequences = scene.sequence_editor.sequences
+    for strip in list(sequences):
+        sequences.remove(strip)
+    with stage('proxies'):
+        proxies = ProxyStore(proxy_store_path(excel))
+        proxies.build([os.path.join(video_folder_path, c.file) for c in clips if c.show == 1])
+    start_frame_pos = 0
+    for clip in clips:
+        log.debug(f"{clip}")
+        if clip.show == 1:
+            start = int(clip.start)
+            end   = int(clip.end)
+            count = end-start+1
+            log.debug(f"{start} {end} {count}")
+            video_name = clip.file
+            # create a full path to the video
+            video_path = os.path.join(video_folder_path, video_name)
+            log.debug(f"Processing video {video_path}")
+            # add video to the sequence editor
+            with stage('add movie'):
+                movies = [sequences.new_movie(video_name, video_path, 2, start_frame_pos, fit_method='FIT')]
+                proxy = proxies.get(video_path)
+                if proxy is not None:
+                    use_proxy(movies[0], proxy)
+            try:
+                with stage('add sound'):
+                    sound = sequences.new_sound(video_name, video_path, 1, start_frame_pos)
+                    sound.volume = float(clip.sound)
+                movies.append(sound)
+            except RuntimeError:
+                log.info(f"{video_path} has no sound")
+            for movie in movies:
+                clip_start_offset_frame = start-1
+                trim_the_video(movie, clip_start_offset_frame, count)
+                move_the_clip_into_position(movie, start_frame_pos, clip_start_offset_frame)
+            start_frame_pos += count
+    # get() marked the proxies of the clips as used
+    proxies.save()
+
+    # Set the final frame
+    if start_frame_pos > 0:
+        scene.frame_end = start_frame_pos
+    log.info('Done cutting!')
+    finish_profile(profile_path(excel, 'cut'))
+    # Render the clip sequence
+    # bpy.ops.render.render(animation=True)
+
+
+def cut_and_render(excel, sheet, workers=None):
+    """
+    cut() and render in one go. When the clips allow it they are stream
+    copied straight to the output, without a timeline or a render.
+    Returns the output path.
+    """
+    excel_dir = os.path.dirname(excel)
+    video_folder_path = excel_dir + os.sep + sheet
+
+    start_profile('quick cut')
+    set_up_output_params(video_folder_path)
+    output = bpy.context.scene.render.filepath
+    clips = cached_parse(excel, sheet, 'cut', read_clips)
+    with stage('probe'):
+        media = MediaIndex(media_index_path(excel))
+        media.probe([os.path.join(video_folder_path, c.file) for c in clips if c.show == 1])
+    copied = fast_cut(clips, video_folder_path, media, output, workers)
+    finish_profile(profile_path(excel, 'quick_cut'))
+    if copied:
+        return output
+    cut(excel, sheet)
+    return render_chunked(output, workers, report=profile_path(excel, 'render'))
@@ -1,928 +1,302 @@
-font_map = {}
-font_map['Arial Regular'] = R'C:\WINDOWS\FONTS\ARIAL.TTF'
-font_map['Arial Narrow'] = R'C:\WINDOWS\FONTS\ARIALN.TTF'
-font_map['Arial Italic'] = R'C:\WINDOWS\FONTS\ARIALI.TTF'
-font_map['Arial Narrow Italic'] = R'C:\WINDOWS\FONTS\ARIALNI.TTF'
-font_map['Arial Bold'] = R'C:\WINDOWS\FONTS\ARIALBD.TTF'
-font_map['Arial Narrow Bold'] = R'C:\WINDOWS\FONTS\ARIALNB.TTF'
-font_map['Arial Bold Italic'] = R'C:\WINDOWS\FONTS\ARIALBI.TTF'
-font_map['Arial Narrow Bold Italic'] = R'C:\WINDOWS\FONTS\ARIALNBI.TTF'
-font_map['Arial Black'] = R'C:\WINDOWS\FONTS\ARIBLK.TTF'
-font_map['Arial Oblique'] = R'C:\WINDOWS\FONTS\ARIAL.TTF'
-font_map['Arial Narrow Oblique'] = R'C:\WINDOWS\FONTS\ARIALN.TTF'
-font_map['Arial Bold Oblique'] = R'C:\WINDOWS\FONTS\ARIALBD.TTF'
-font_map['Arial Narrow Bold Oblique'] = R'C:\WINDOWS\FONTS\ARIALNB.TTF'
-font_map['Arial Black Oblique'] = R'C:\WINDOWS\FONTS\ARIBLK.TTF'
-font_map['Bahnschrift Light'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Light Condensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Light SemiCondensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiLight'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiLight Condensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiLight SemiCondensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Regular'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Condensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiCondensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiBold'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiBold Condensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiBold SemiCondensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Bold'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Bold Condensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Bold SemiCondensed'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Light Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Light Condensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Light SemiCondensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiLight Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiLight Condensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiLight SemiCondensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Condensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiCondensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiBold Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiBold Condensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift SemiBold SemiCondensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Bold Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Bold Condensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Bahnschrift Bold SemiCondensed Oblique'] = R'C:\WINDOWS\FONTS\BAHNSCHRIFT.TTF'
-font_map['Calibri Light'] = R'C:\WINDOWS\FONTS\CALIBRIL.TTF'
-font_map['Calibri Light Italic'] = R'C:\WINDOWS\FONTS\CALIBRILI.TTF'
-font_map['Calibri Regular'] = R'C:\WINDOWS\FONTS\CALIBRI.TTF'
-font_map['Calibri Italic'] = R'C:\WINDOWS\FONTS\CALIBRII.TTF'
-font_map['Calibri Bold'] = R'C:\WINDOWS\FONTS\CALIBRIB.TTF'
-font_map['Calibri Bold Italic'] = R'C:\WINDOWS\FONTS\CALIBRIZ.TTF'
-font_map['Calibri Light Oblique'] = R'C:\WINDOWS\FONTS\CALIBRIL.TTF'
-font_map['Calibri Oblique'] = R'C:\WINDOWS\FONTS\CALIBRI.TTF'
-font_map['Calibri Bold Oblique'] = R'C:\WINDOWS\FONTS\CALIBRIB.TTF'
-font_map['Cambria Regular'] = R'C:\WINDOWS\FONTS\CAMBRIA.TTC'
-font_map['Cambria Italic'] = R'C:\WINDOWS\FONTS\CAMBRIAI.TTF'
-font_map['Cambria Bold'] = R'C:\WINDOWS\FONTS\CAMBRIAB.TTF'
-font_map['Cambria Bold Italic'] = R'C:\WINDOWS\FONTS\CAMBRIAZ.TTF'
-font_map['Cambria Oblique'] = R'C:\WINDOWS\FONTS\CAMBRIA.TTC'
-font_map['Cambria Bold Oblique'] = R'C:\WINDOWS\FONTS\CAMBRIAB.TTF'
-font_map['Cambria Math Regular'] = R'C:\WINDOWS\FONTS\CAMBRIA.TTC'
-font_map['Cambria Math Oblique'] = R'C:\WINDOWS\FONTS\CAMBRIA.TTC'
-font_map['Cambria Math Bold'] = R'C:\WINDOWS\FONTS\CAMBRIA.TTC'
-font_map['Cambria Math Bold Oblique'] = R'C:\WINDOWS\FONTS\CAMBRIA.TTC'
-font_map['Candara Light'] = R'C:\WINDOWS\FONTS\CANDARAL.TTF'
-font_map['Candara Light Italic'] = R'C:\WINDOWS\FONTS\CANDARALI.TTF'
-font_map['Candara Regular'] = R'C:\WINDOWS\FONTS\CANDARA.TTF'
-font_map['Candara Italic'] = R'C:\WINDOWS\FONTS\CANDARAI.TTF'
-font_map['Candara Bold'] = R'C:\WINDOWS\FONTS\CANDARAB.TTF'
-font_map['Candara Bold Italic'] = R'C:\WINDOWS\FONTS\CANDARAZ.TTF'
-font_map['Candara Light Oblique'] = R'C:\WINDOWS\FONTS\CANDARAL.TTF'
-font_map['Candara Oblique'] = R'C:\WINDOWS\FONTS\CANDARA.TTF'
-font_map['Candara Bold Oblique'] = R'C:\WINDOWS\FONTS\CANDARAB.TTF'
-font_map['Comic Sans MS Regular'] = R'C:\WINDOWS\FONTS\COMIC.TTF'
-font_map['Comic Sans MS Italic'] = R'C:\WINDOWS\FONTS\COMICI.TTF'
-font_map['Comic Sans MS Bold'] = R'C:\WINDOWS\FONTS\COMICBD.TTF'
-font_map['Comic Sans MS Bold Italic'] = R'C:\WINDOWS\FONTS\COMICZ.TTF'
-font_map['Comic Sans MS Oblique'] = R'C:\WINDOWS\FONTS\COMIC.TTF'
-font_map['Comic Sans MS Bold Oblique'] = R'C:\WINDOWS\FONTS\COMICBD.TTF'
-font_map['Consolas Regular'] = R'C:\WINDOWS\FONTS\CONSOLA.TTF'
-font_map['Consolas Italic'] = R'C:\WINDOWS\FONTS\CONSOLAI.TTF'
-font_map['Consolas Bold'] = R'C:\WINDOWS\FONTS\CONSOLAB.TTF'
-font_map['Consolas Bold Italic'] = R'C:\WINDOWS\FONTS\CONSOLAZ.TTF'
-font_map['Consolas Oblique'] = R'C:\WINDOWS\FONTS\CONSOLA.TTF'
-font_map['Consolas Bold Oblique'] = R'C:\WINDOWS\FONTS\CONSOLAB.TTF'
-font_map['Constantia Regular'] = R'C:\WINDOWS\FONTS\CONSTAN.TTF'
-font_map['Constantia Italic'] = R'C:\WINDOWS\FONTS\CONSTANI.TTF'
-font_map['Constantia Bold'] = R'C:\WINDOWS\FONTS\CONSTANB.TTF'
-font_map['Constantia Bold Italic'] = R'C:\WINDOWS\FONTS\CONSTANZ.TTF'
-font_map['Constantia Oblique'] = R'C:\WINDOWS\FONTS\CONSTAN.TTF'
-font_map['Constantia Bold Oblique'] = R'C:\WINDOWS\FONTS\CONSTANB.TTF'
-font_map['Corbel Light'] = R'C:\WINDOWS\FONTS\CORBELL.TTF'
-font_map['Corbel Light Italic'] = R'C:\WINDOWS\FONTS\CORBELLI.TTF'
-font_map['Corbel Regular'] = R'C:\WINDOWS\FONTS\CORBEL.TTF'
-font_map['Corbel Italic'] = R'C:\WINDOWS\FONTS\CORBELI.TTF'
-font_map['Corbel Bold'] = R'C:\WINDOWS\FONTS\CORBELB.TTF'
-font_map['Corbel Bold Italic'] = R'C:\WINDOWS\FONTS\CORBELZ.TTF'
-font_map['Corbel Light Oblique'] = R'C:\WINDOWS\FONTS\CORBELL.TTF'
-font_map['Corbel Oblique'] = R'C:\WINDOWS\FONTS\CORBEL.TTF'
-font_map['Corbel Bold Oblique'] = R'C:\WINDOWS\FONTS\CORBELB.TTF'
-font_map['Courier New Regular'] = R'C:\WINDOWS\FONTS\COUR.TTF'
-font_map['Courier New Italic'] = R'C:\WINDOWS\FONTS\COURI.TTF'
-font_map['Courier New Bold'] = R'C:\WINDOWS\FONTS\COURBD.TTF'
-font_map['Courier New Bold Italic'] = R'C:\WINDOWS\FONTS\COURBI.TTF'
-font_map['Courier New Oblique'] = R'C:\WINDOWS\FONTS\COUR.TTF'
-font_map['Courier New Bold Oblique'] = R'C:\WINDOWS\FONTS\COURBD.TTF'
-font_map['Ebrima Regular'] = R'C:\WINDOWS\FONTS\EBRIMA.TTF'
-font_map['Ebrima Bold'] = R'C:\WINDOWS\FONTS\EBRIMABD.TTF'
-font_map['Ebrima Oblique'] = R'C:\WINDOWS\FONTS\EBRIMA.TTF'
-font_map['Ebrima Bold Oblique'] = R'C:\WINDOWS\FONTS\EBRIMABD.TTF'
-font_map['Franklin Gothic Medium'] = R'C:\WINDOWS\FONTS\FRAMD.TTF'
-font_map['Franklin Gothic Cond Medium'] = R'C:\WINDOWS\FONTS\FRAMDCN.TTF'
-font_map['Franklin Gothic Medium Italic'] = R'C:\WINDOWS\FONTS\FRAMDIT.TTF'
-font_map['Franklin Gothic Demi'] = R'C:\WINDOWS\FONTS\FRADM.TTF'
-font_map['Franklin Gothic Cond Demi'] = R'C:\WINDOWS\FONTS\FRADMCN.TTF'
-font_map['Franklin Gothic Demi Italic'] = R'C:\WINDOWS\FONTS\FRADMIT.TTF'
-font_map['Franklin Gothic Heavy'] = R'C:\WINDOWS\FONTS\FRAHV.TTF'
-font_map['Franklin Gothic Heavy Italic'] = R'C:\WINDOWS\FONTS\FRAHVIT.TTF'
-font_map['Franklin Gothic Medium Oblique'] = R'C:\WINDOWS\FONTS\FRAMD.TTF'
-font_map['Franklin Gothic Cond Medium Oblique'] = R'C:\WINDOWS\FONTS\FRAMDCN.TTF'
-font_map['Franklin Gothic Demi Oblique'] = R'C:\WINDOWS\FONTS\FRADM.TTF'
-font_map['Franklin Gothic Cond Demi Oblique'] = R'C:\WINDOWS\FONTS\FRADMCN.TTF'
-font_map['Franklin Gothic Heavy Oblique'] = R'C:\WINDOWS\FONTS\FRAHV.TTF'
-font_map['Gabriola Regular'] = R'C:\WINDOWS\FONTS\GABRIOLA.TTF'
-font_map['Gabriola Oblique'] = R'C:\WINDOWS\FONTS\GABRIOLA.TTF'
-font_map['Gabriola Bold'] = R'C:\WINDOWS\FONTS\GABRIOLA.TTF'
-font_map['Gabriola Bold Oblique'] = R'C:\WINDOWS\FONTS\GABRIOLA.TTF'
-font_map['Gadugi Regular'] = R'C:\WINDOWS\FONTS\GADUGI.TTF'
-font_map['Gadugi Bold'] = R'C:\WINDOWS\FONTS\GADUGIB.TTF'
-font_map['Gadugi Oblique'] = R'C:\WINDOWS\FONTS\GADUGI.TTF'
-font_map['Gadugi Bold Oblique'] = R'C:\WINDOWS\FONTS\GADUGIB.TTF'
-font_map['Georgia Regular'] = R'C:\WINDOWS\FONTS\GEORGIA.TTF'
-font_map['Georgia Italic'] = R'C:\WINDOWS\FONTS\GEORGIAI.TTF'
-font_map['Georgia Bold'] = R'C:\WINDOWS\FONTS\GEORGIAB.TTF'
-font_map['Georgia Bold Italic'] = R'C:\WINDOWS\FONTS\GEORGIAZ.TTF'
-font_map['Georgia Oblique'] = R'C:\WINDOWS\FONTS\GEORGIA.TTF'
-font_map['Georgia Bold Oblique'] = R'C:\WINDOWS\FONTS\GEORGIAB.TTF'
-font_map['Impact Regular'] = R'C:\WINDOWS\FONTS\IMPACT.TTF'
-font_map['Impact Oblique'] = R'C:\WINDOWS\FONTS\IMPACT.TTF'
-font_map['Impact Bold'] = R'C:\WINDOWS\FONTS\IMPACT.TTF'
-font_map['Impact Bold Oblique'] = R'C:\WINDOWS\FONTS\IMPACT.TTF'
-font_map['Ink Free Regular'] = R'C:\WINDOWS\FONTS\INKFREE.TTF'
-font_map['Ink Free Oblique'] = R'C:\WINDOWS\FONTS\INKFREE.TTF'
-font_map['Ink Free Bold'] = R'C:\WINDOWS\FONTS\INKFREE.TTF'
-font_map['Ink Free Bold Oblique'] = R'C:\WINDOWS\FONTS\INKFREE.TTF'
-font_map['Javanese Text Regular'] = R'C:\WINDOWS\FONTS\JAVATEXT.TTF'
-font_map['Javanese Text Oblique'] = R'C:\WINDOWS\FONTS\JAVATEXT.TTF'
-font_map['Javanese Text Bold'] = R'C:\WINDOWS\FONTS\JAVATEXT.TTF'
-font_map['Javanese Text Bold Oblique'] = R'C:\WINDOWS\FONTS\JAVATEXT.TTF'
-font_map['Leelawadee UI Semilight'] = R'C:\WINDOWS\FONTS\LEELUISL.TTF'
-font_map['Leelawadee UI Regular'] = R'C:\WINDOWS\FONTS\LEELAWUI.TTF'
-font_map['Leelawadee UI Bold'] = R'C:\WINDOWS\FONTS\LEELAUIB.TTF'
-font_map['Leelawadee UI Semilight Oblique'] = R'C:\WINDOWS\FONTS\LEELUISL.TTF'
-font_map['Leelawadee UI Oblique'] = R'C:\WINDOWS\FONTS\LEELAWUI.TTF'
-font_map['Leelawadee UI Bold Oblique'] = R'C:\WINDOWS\FONTS\LEELAUIB.TTF'
-font_map['Lucida Console Regular'] = R'C:\WINDOWS\FONTS\LUCON.TTF'
-font_map['Lucida Console Oblique'] = R'C:\WINDOWS\FONTS\LUCON.TTF'
-font_map['Lucida Console Bold'] = R'C:\WINDOWS\FONTS\LUCON.TTF'
-font_map['Lucida Console Bold Oblique'] = R'C:\WINDOWS\FONTS\LUCON.TTF'
-font_map['Lucida Sans Unicode Regular'] = R'C:\WINDOWS\FONTS\L_10646.TTF'
-font_map['Lucida Sans Unicode Oblique'] = R'C:\WINDOWS\FONTS\L_10646.TTF'
-font_map['Lucida Sans Unicode Bold'] = R'C:\WINDOWS\FONTS\L_10646.TTF'
-font_map['Lucida Sans Unicode Bold Oblique'] = R'C:\WINDOWS\FONTS\L_10646.TTF'
-font_map['Malgun Gothic Semilight'] = R'C:\WINDOWS\FONTS\MALGUNSL.TTF'
-font_map['Malgun Gothic Regular'] = R'C:\WINDOWS\FONTS\MALGUN.TTF'
-font_map['Malgun Gothic Bold'] = R'C:\WINDOWS\FONTS\MALGUNBD.TTF'
-font_map['Malgun Gothic Semilight Oblique'] = R'C:\WINDOWS\FONTS\MALGUNSL.TTF'
-font_map['Malgun Gothic Oblique'] = R'C:\WINDOWS\FONTS\MALGUN.TTF'
-font_map['Malgun Gothic Bold Oblique'] = R'C:\WINDOWS\FONTS\MALGUNBD.TTF'
-font_map['Microsoft Himalaya Regular'] = R'C:\WINDOWS\FONTS\HIMALAYA.TTF'
-font_map['Microsoft Himalaya Oblique'] = R'C:\WINDOWS\FONTS\HIMALAYA.TTF'
-font_map['Microsoft Himalaya Bold'] = R'C:\WINDOWS\FONTS\HIMALAYA.TTF'
-font_map['Microsoft Himalaya Bold Oblique'] = R'C:\WINDOWS\FONTS\HIMALAYA.TTF'
-font_map['Microsoft JhengHei Light'] = R'C:\WINDOWS\FONTS\MSJHL.TTC'
-font_map['Microsoft JhengHei Regular'] = R'C:\WINDOWS\FONTS\MSJH.TTC'
-font_map['Microsoft JhengHei Bold'] = R'C:\WINDOWS\FONTS\MSJHBD.TTC'
-font_map['Microsoft JhengHei Light Oblique'] = R'C:\WINDOWS\FONTS\MSJHL.TTC'
-font_map['Microsoft JhengHei Oblique'] = R'C:\WINDOWS\FONTS\MSJH.TTC'
-font_map['Microsoft JhengHei Bold Oblique'] = R'C:\WINDOWS\FONTS\MSJHBD.TTC'
-font_map['Microsoft JhengHei UI Light'] = R'C:\WINDOWS\FONTS\MSJHL.TTC'
-font_map['Microsoft JhengHei UI Regular'] = R'C:\WINDOWS\FONTS\MSJH.TTC'
-font_map['Microsoft JhengHei UI Bold'] = R'C:\WINDOWS\FONTS\MSJHBD.TTC'
-font_map['Microsoft JhengHei UI Light Oblique'] = R'C:\WINDOWS\FONTS\MSJHL.TTC'
-font_map['Microsoft JhengHei UI Oblique'] = R'C:\WINDOWS\FONTS\MSJH.TTC'
-font_map['Microsoft JhengHei UI Bold Oblique'] = R'C:\WINDOWS\FONTS\MSJHBD.TTC'
-font_map['Microsoft New Tai Lue Regular'] = R'C:\WINDOWS\FONTS\NTAILU.TTF'
-font_map['Microsoft New Tai Lue Bold'] = R'C:\WINDOWS\FONTS\NTAILUB.TTF'
-font_map['Microsoft New Tai Lue Oblique'] = R'C:\WINDOWS\FONTS\NTAILU.TTF'
-font_map['Microsoft New Tai Lue Bold Oblique'] = R'C:\WINDOWS\FONTS\NTAILUB.TTF'
-font_map['Microsoft PhagsPa Regular'] = R'C:\WINDOWS\FONTS\PHAGSPA.TTF'
-font_map['Microsoft PhagsPa Bold'] = R'C:\WINDOWS\FONTS\PHAGSPAB.TTF'
-font_map['Microsoft PhagsPa Oblique'] = R'C:\WINDOWS\FONTS\PHAGSPA.TTF'
-font_map['Microsoft PhagsPa Bold Oblique'] = R'C:\WINDOWS\FONTS\PHAGSPAB.TTF'
-font_map['Microsoft Sans Serif Regular'] = R'C:\WINDOWS\FONTS\MICROSS.TTF'
-font_map['Microsoft Sans Serif Oblique'] = R'C:\WINDOWS\FONTS\MICROSS.TTF'
-font_map['Microsoft Sans Serif Bold'] = R'C:\WINDOWS\FONTS\MICROSS.TTF'
-font_map['Microsoft Sans Serif Bold Oblique'] = R'C:\WINDOWS\FONTS\MICROSS.TTF'
-font_map['Microsoft Tai Le Regular'] = R'C:\WINDOWS\FONTS\TAILE.TTF'
-font_map['Microsoft Tai Le Bold'] = R'C:\WINDOWS\FONTS\TAILEB.TTF'
-font_map['Microsoft Tai Le Oblique'] = R'C:\WINDOWS\FONTS\TAILE.TTF'
-font_map['Microsoft Tai Le Bold Oblique'] = R'C:\WINDOWS\FONTS\TAILEB.TTF'
-font_map['Microsoft YaHei Light'] = R'C:\WINDOWS\FONTS\MSYHL.TTC'
-font_map['Microsoft YaHei Regular'] = R'C:\WINDOWS\FONTS\MSYH.TTC'
-font_map['Microsoft YaHei Bold'] = R'C:\WINDOWS\FONTS\MSYHBD.TTC'
-font_map['Microsoft YaHei Light Oblique'] = R'C:\WINDOWS\FONTS\MSYHL.TTC'
-font_map['Microsoft YaHei Oblique'] = R'C:\WINDOWS\FONTS\MSYH.TTC'
-font_map['Microsoft YaHei Bold Oblique'] = R'C:\WINDOWS\FONTS\MSYHBD.TTC'
-font_map['Microsoft YaHei UI Light'] = R'C:\WINDOWS\FONTS\MSYHL.TTC'
-font_map['Microsoft YaHei UI Regular'] = R'C:\WINDOWS\FONTS\MSYH.TTC'
-font_map['Microsoft YaHei UI Bold'] = R'C:\WINDOWS\FONTS\MSYHBD.TTC'
-font_map['Microsoft YaHei UI Light Oblique'] = R'C:\WINDOWS\FONTS\MSYHL.TTC'
-font_map['Microsoft YaHei UI Oblique'] = R'C:\WINDOWS\FONTS\MSYH.TTC'
-font_map['Microsoft YaHei UI Bold Oblique'] = R'C:\WINDOWS\FONTS\MSYHBD.TTC'
-font_map['Microsoft Yi Baiti Regular'] = R'C:\WINDOWS\FONTS\MSYI.TTF'
-font_map['Microsoft Yi Baiti Oblique'] = R'C:\WINDOWS\FONTS\MSYI.TTF'
-font_map['Microsoft Yi Baiti Bold'] = R'C:\WINDOWS\FONTS\MSYI.TTF'
-font_map['Microsoft Yi Baiti Bold Oblique'] = R'C:\WINDOWS\FONTS\MSYI.TTF'
-font_map['MingLiU-ExtB Regular'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['MingLiU-ExtB Oblique'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['MingLiU-ExtB Bold'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['MingLiU-ExtB Bold Oblique'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['PMingLiU-ExtB Regular'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['PMingLiU-ExtB Oblique'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['PMingLiU-ExtB Bold'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['PMingLiU-ExtB Bold Oblique'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['MingLiU_HKSCS-ExtB Regular'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['MingLiU_HKSCS-ExtB Oblique'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['MingLiU_HKSCS-ExtB Bold'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['MingLiU_HKSCS-ExtB Bold Oblique'] = R'C:\WINDOWS\FONTS\MINGLIUB.TTC'
-font_map['Mongolian Baiti Regular'] = R'C:\WINDOWS\FONTS\MONBAITI.TTF'
-font_map['Mongolian Baiti Oblique'] = R'C:\WINDOWS\FONTS\MONBAITI.TTF'
-font_map['Mongolian Baiti Bold'] = R'C:\WINDOWS\FONTS\MONBAITI.TTF'
-font_map['Mongolian Baiti Bold Oblique'] = R'C:\WINDOWS\FONTS\MONBAITI.TTF'
-font_map['MS Gothic Regular'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS Gothic Oblique'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS Gothic Bold'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS Gothic Bold Oblique'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS UI Gothic Regular'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS UI Gothic Oblique'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS UI Gothic Bold'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS UI Gothic Bold Oblique'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS PGothic Regular'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS PGothic Oblique'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS PGothic Bold'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MS PGothic Bold Oblique'] = R'C:\WINDOWS\FONTS\MSGOTHIC.TTC'
-font_map['MV Boli Regular'] = R'C:\WINDOWS\FONTS\MVBOLI.TTF'
-font_map['MV Boli Oblique'] = R'C:\WINDOWS\FONTS\MVBOLI.TTF'
-font_map['MV Boli Bold'] = R'C:\WINDOWS\FONTS\MVBOLI.TTF'
-font_map['MV Boli Bold Oblique'] = R'C:\WINDOWS\FONTS\MVBOLI.TTF'
-font_map['Myanmar Text Regular'] = R'C:\WINDOWS\FONTS\MMRTEXT.TTF'
-font_map['Myanmar Text Bold'] = R'C:\WINDOWS\FONTS\MMRTEXTB.TTF'
-font_map['Myanmar Text Oblique'] = R'C:\WINDOWS\FONTS\MMRTEXT.TTF'
-font_map['Myanmar Text Bold Oblique'] = R'C:\WINDOWS\FONTS\MMRTEXTB.TTF'
-font_map['Nirmala UI Semilight'] = R'C:\WINDOWS\FONTS\NIRMALAS.TTF'
-font_map['Nirmala UI Regular'] = R'C:\WINDOWS\FONTS\NIRMALA.TTF'
-font_map['Nirmala UI Bold'] = R'C:\WINDOWS\FONTS\NIRMALAB.TTF'
-font_map['Nirmala UI Semilight Oblique'] = R'C:\WINDOWS\FONTS\NIRMALAS.TTF'
-font_map['Nirmala UI Oblique'] = R'C:\WINDOWS\FONTS\NIRMALA.TTF'
-font_map['Nirmala UI Bold Oblique'] = R'C:\WINDOWS\FONTS\NIRMALAB.TTF'
-font_map['Palatino Linotype Regular'] = R'C:\WINDOWS\FONTS\PALA.TTF'
-font_map['Palatino Linotype Italic'] = R'C:\WINDOWS\FONTS\PALAI.TTF'
-font_map['Palatino Linotype Bold'] = R'C:\WINDOWS\FONTS\PALAB.TTF'
-font_map['Palatino Linotype Bold Italic'] = R'C:\WINDOWS\FONTS\PALABI.TTF'
-font_map['Palatino Linotype Oblique'] = R'C:\WINDOWS\FONTS\PALA.TTF'
-font_map['Palatino Linotype Bold Oblique'] = R'C:\WINDOWS\FONTS\PALAB.TTF'
-font_map['Segoe MDL2 Assets Regular'] = R'C:\WINDOWS\FONTS\SEGMDL2.TTF'
-font_map['Segoe MDL2 Assets Oblique'] = R'C:\WINDOWS\FONTS\SEGMDL2.TTF'
-font_map['Segoe MDL2 Assets Bold'] = R'C:\WINDOWS\FONTS\SEGMDL2.TTF'
-font_map['Segoe MDL2 Assets Bold Oblique'] = R'C:\WINDOWS\FONTS\SEGMDL2.TTF'
-font_map['Segoe Print Regular'] = R'C:\WINDOWS\FONTS\SEGOEPR.TTF'
-font_map['Segoe Print Bold'] = R'C:\WINDOWS\FONTS\SEGOEPRB.TTF'
-font_map['Segoe Print Oblique'] = R'C:\WINDOWS\FONTS\SEGOEPR.TTF'
-font_map['Segoe Print Bold Oblique'] = R'C:\WINDOWS\FONTS\SEGOEPRB.TTF'
-font_map['Segoe Script Regular'] = R'C:\WINDOWS\FONTS\SEGOESC.TTF'
-font_map['Segoe Script Bold'] = R'C:\WINDOWS\FONTS\SEGOESCB.TTF'
-font_map['Segoe Script Oblique'] = R'C:\WINDOWS\FONTS\SEGOESC.TTF'
-font_map['Segoe Script Bold Oblique'] = R'C:\WINDOWS\FONTS\SEGOESCB.TTF'
-font_map['Segoe UI Light'] = R'C:\WINDOWS\FONTS\SEGOEUIL.TTF'
-font_map['Segoe UI Light Italic'] = R'C:\WINDOWS\FONTS\SEGUILI.TTF'
-font_map['Segoe UI Semilight'] = R'C:\WINDOWS\FONTS\SEGOEUISL.TTF'
-font_map['Segoe UI Semilight Italic'] = R'C:\WINDOWS\FONTS\SEGUISLI.TTF'
-font_map['Segoe UI Regular'] = R'C:\WINDOWS\FONTS\SEGOEUI.TTF'
-font_map['Segoe UI Italic'] = R'C:\WINDOWS\FONTS\SEGOEUII.TTF'
-font_map['Segoe UI Semibold'] = R'C:\WINDOWS\FONTS\SEGUISB.TTF'
-font_map['Segoe UI Semibold Italic'] = R'C:\WINDOWS\FONTS\SEGUISBI.TTF'
-font_map['Segoe UI Bold'] = R'C:\WINDOWS\FONTS\SEGOEUIB.TTF'
-font_map['Segoe UI Bold Italic'] = R'C:\WINDOWS\FONTS\SEGOEUIZ.TTF'
-font_map['Segoe UI Black'] = R'C:\WINDOWS\FONTS\SEGUIBL.TTF'
-font_map['Segoe UI Black Italic'] = R'C:\WINDOWS\FONTS\SEGUIBLI.TTF'
-font_map['Segoe UI Light Oblique'] = R'C:\WINDOWS\FONTS\SEGOEUIL.TTF'
-font_map['Segoe UI Semilight Oblique'] = R'C:\WINDOWS\FONTS\SEGOEUISL.TTF'
-font_map['Segoe UI Oblique'] = R'C:\WINDOWS\FONTS\SEGOEUI.TTF'
-font_map['Segoe UI Semibold Oblique'] = R'C:\WINDOWS\FONTS\SEGUISB.TTF'
-font_map['Segoe UI Bold Oblique'] = R'C:\WINDOWS\FONTS\SEGOEUIB.TTF'
-font_map['Segoe UI Black Oblique'] = R'C:\WINDOWS\FONTS\SEGUIBL.TTF'
-font_map['Segoe UI Emoji Regular'] = R'C:\WINDOWS\FONTS\SEGUIEMJ.TTF'
-font_map['Segoe UI Emoji Oblique'] = R'C:\WINDOWS\FONTS\SEGUIEMJ.TTF'
-font_map['Segoe UI Emoji Bold'] = R'C:\WINDOWS\FONTS\SEGUIEMJ.TTF'
-font_map['Segoe UI Emoji Bold Oblique'] = R'C:\WINDOWS\FONTS\SEGUIEMJ.TTF'
-font_map['Segoe UI Historic Regular'] = R'C:\WINDOWS\FONTS\SEGUIHIS.TTF'
-font_map['Segoe UI Historic Oblique'] = R'C:\WINDOWS\FONTS\SEGUIHIS.TTF'
-font_map['Segoe UI Historic Bold'] = R'C:\WINDOWS\FONTS\SEGUIHIS.TTF'
-font_map['Segoe UI Historic Bold Oblique'] = R'C:\WINDOWS\FONTS\SEGUIHIS.TTF'
-font_map['Segoe UI Symbol Regular'] = R'C:\WINDOWS\FONTS\SEGUISYM.TTF'
-font_map['Segoe UI Symbol Oblique'] = R'C:\WINDOWS\FONTS\SEGUISYM.TTF'
-font_map['Segoe UI Symbol Bold'] = R'C:\WINDOWS\FONTS\SEGUISYM.TTF'
-font_map['Segoe UI Symbol Bold Oblique'] = R'C:\WINDOWS\FONTS\SEGUISYM.TTF'
-font_map['SimSun Regular'] = R'C:\WINDOWS\FONTS\SIMSUN.TTC'
-font_map['SimSun Oblique'] = R'C:\WINDOWS\FONTS\SIMSUN.TTC'
-font_map['SimSun Bold'] = R'C:\WINDOWS\FONTS\SIMSUN.TTC'
-font_map['SimSun Bold Oblique'] = R'C:\WINDOWS\FONTS\SIMSUN.TTC'
-font_map['NSimSun Regular'] = R'C:\WINDOWS\FONTS\SIMSUN.TTC'
-font_map['NSimSun Oblique'] = R'C:\WINDOWS\FONTS\SIMSUN.TTC'
-font_map['NSimSun Bold'] = R'C:\WINDOWS\FONTS\SIMSUN.TTC'
-font_map['NSimSun Bold Oblique'] = R'C:\WINDOWS\FONTS\SIMSUN.TTC'
-font_map['SimSun-ExtB Regular'] = R'C:\WINDOWS\FONTS\SIMSUNB.TTF'
-font_map['SimSun-ExtB Oblique'] = R'C:\WINDOWS\FONTS\SIMSUNB.TTF'
-font_map['SimSun-ExtB Bold'] = R'C:\WINDOWS\FONTS\SIMSUNB.TTF'
-font_map['SimSun-ExtB Bold Oblique'] = R'C:\WINDOWS\FONTS\SIMSUNB.TTF'
-font_map['Sitka Small Regular'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Small Italic'] = R'C:\WINDOWS\FONTS\SITKAI.TTC'
-font_map['Sitka Small Bold'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Small Bold Italic'] = R'C:\WINDOWS\FONTS\SITKAZ.TTC'
-font_map['Sitka Small Oblique'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Small Bold Oblique'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Text Regular'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Text Italic'] = R'C:\WINDOWS\FONTS\SITKAI.TTC'
-font_map['Sitka Text Bold'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Text Bold Italic'] = R'C:\WINDOWS\FONTS\SITKAZ.TTC'
-font_map['Sitka Text Oblique'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Text Bold Oblique'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Subheading Regular'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Subheading Italic'] = R'C:\WINDOWS\FONTS\SITKAI.TTC'
-font_map['Sitka Subheading Bold'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Subheading Bold Italic'] = R'C:\WINDOWS\FONTS\SITKAZ.TTC'
-font_map['Sitka Subheading Oblique'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Subheading Bold Oblique'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Heading Regular'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Heading Italic'] = R'C:\WINDOWS\FONTS\SITKAI.TTC'
-font_map['Sitka Heading Bold'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Heading Bold Italic'] = R'C:\WINDOWS\FONTS\SITKAZ.TTC'
-font_map['Sitka Heading Oblique'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Heading Bold Oblique'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Display Regular'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Display Italic'] = R'C:\WINDOWS\FONTS\SITKAI.TTC'
-font_map['Sitka Display Bold'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Display Bold Italic'] = R'C:\WINDOWS\FONTS\SITKAZ.TTC'
-font_map['Sitka Display Oblique'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Display Bold Oblique'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Banner Regular'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Banner Italic'] = R'C:\WINDOWS\FONTS\SITKAI.TTC'
-font_map['Sitka Banner Bold'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sitka Banner Bold Italic'] = R'C:\WINDOWS\FONTS\SITKAZ.TTC'
-font_map['Sitka Banner Oblique'] = R'C:\WINDOWS\FONTS\SITKA.TTC'
-font_map['Sitka Banner Bold Oblique'] = R'C:\WINDOWS\FONTS\SITKAB.TTC'
-font_map['Sylfaen Regular'] = R'C:\WINDOWS\FONTS\SYLFAEN.TTF'
-font_map['Sylfaen Oblique'] = R'C:\WINDOWS\FONTS\SYLFAEN.TTF'
-font_map['Sylfaen Bold'] = R'C:\WINDOWS\FONTS\SYLFAEN.TTF'
-font_map['Sylfaen Bold Oblique'] = R'C:\WINDOWS\FONTS\SYLFAEN.TTF'
-font_map['Symbol Regular'] = R'C:\WINDOWS\FONTS\SYMBOL.TTF'
-font_map['Symbol Oblique'] = R'C:\WINDOWS\FONTS\SYMBOL.TTF'
-font_map['Symbol Bold'] = R'C:\WINDOWS\FONTS\SYMBOL.TTF'
-font_map['Symbol Bold Oblique'] = R'C:\WINDOWS\FONTS\SYMBOL.TTF'
-font_map['Tahoma Regular'] = R'C:\WINDOWS\FONTS\TAHOMA.TTF'
-font_map['Tahoma Bold'] = R'C:\WINDOWS\FONTS\TAHOMABD.TTF'
-font_map['Tahoma Oblique'] = R'C:\WINDOWS\FONTS\TAHOMA.TTF'
-font_map['Tahoma Bold Oblique'] = R'C:\WINDOWS\FONTS\TAHOMABD.TTF'
-font_map['Times New Roman Regular'] = R'C:\WINDOWS\FONTS\TIMES.TTF'
-font_map['Times New Roman Italic'] = R'C:\WINDOWS\FONTS\TIMESI.TTF'
-font_map['Times New Roman Bold'] = R'C:\WINDOWS\FONTS\TIMESBD.TTF'
-font_map['Times New Roman Bold Italic'] = R'C:\WINDOWS\FONTS\TIMESBI.TTF'
-font_map['Times New Roman Oblique'] = R'C:\WINDOWS\FONTS\TIMES.TTF'
-font_map['Times New Roman Bold Oblique'] = R'C:\WINDOWS\FONTS\TIMESBD.TTF'
-font_map['Trebuchet MS Regular'] = R'C:\WINDOWS\FONTS\TREBUC.TTF'
-font_map['Trebuchet MS Italic'] = R'C:\WINDOWS\FONTS\TREBUCIT.TTF'
-font_map['Trebuchet MS Bold'] = R'C:\WINDOWS\FONTS\TREBUCBD.TTF'
-font_map['Trebuchet MS Bold Italic'] = R'C:\WINDOWS\FONTS\TREBUCBI.TTF'
-font_map['Trebuchet MS Oblique'] = R'C:\WINDOWS\FONTS\TREBUC.TTF'
-font_map['Trebuchet MS Bold Oblique'] = R'C:\WINDOWS\FONTS\TREBUCBD.TTF'
-font_map['Verdana Regular'] = R'C:\WINDOWS\FONTS\VERDANA.TTF'
-font_map['Verdana Italic'] = R'C:\WINDOWS\FONTS\VERDANAI.TTF'
-font_map['Verdana Bold'] = R'C:\WINDOWS\FONTS\VERDANAB.TTF'
-font_map['Verdana Bold Italic'] = R'C:\WINDOWS\FONTS\VERDANAZ.TTF'
-font_map['Verdana Oblique'] = R'C:\WINDOWS\FONTS\VERDANA.TTF'
-font_map['Verdana Bold Oblique'] = R'C:\WINDOWS\FONTS\VERDANAB.TTF'
-font_map['Webdings Regular'] = R'C:\WINDOWS\FONTS\WEBDINGS.TTF'
-font_map['Webdings Oblique'] = R'C:\WINDOWS\FONTS\WEBDINGS.TTF'
-font_map['Webdings Bold'] = R'C:\WINDOWS\FONTS\WEBDINGS.TTF'
-font_map['Webdings Bold Oblique'] = R'C:\WINDOWS\FONTS\WEBDINGS.TTF'
-font_map['Wingdings Regular'] = R'C:\WINDOWS\FONTS\WINGDING.TTF'
-font_map['Wingdings Oblique'] = R'C:\WINDOWS\FONTS\WINGDING.TTF'
-font_map['Wingdings Bold'] = R'C:\WINDOWS\FONTS\WINGDING.TTF'
-font_map['Wingdings Bold Oblique'] = R'C:\WINDOWS\FONTS\WINGDING.TTF'
-font_map['Yu Gothic Light'] = R'C:\WINDOWS\FONTS\YUGOTHL.TTC'
-font_map['Yu Gothic Regular'] = R'C:\WINDOWS\FONTS\YUGOTHR.TTC'
-font_map['Yu Gothic Medium'] = R'C:\WINDOWS\FONTS\YUGOTHM.TTC'
-font_map['Yu Gothic Bold'] = R'C:\WINDOWS\FONTS\YUGOTHB.TTC'
-font_map['Yu Gothic Light Oblique'] = R'C:\WINDOWS\FONTS\YUGOTHL.TTC'
-font_map['Yu Gothic Oblique'] = R'C:\WINDOWS\FONTS\YUGOTHR.TTC'
-font_map['Yu Gothic Medium Oblique'] = R'C:\WINDOWS\FONTS\YUGOTHM.TTC'
-font_map['Yu Gothic Bold Oblique'] = R'C:\WINDOWS\FONTS\YUGOTHB.TTC'
-font_map['Yu Gothic UI Light'] = R'C:\WINDOWS\FONTS\YUGOTHL.TTC'
-font_map['Yu Gothic UI Semilight'] = R'C:\WINDOWS\FONTS\YUGOTHR.TTC'
-font_map['Yu Gothic UI Regular'] = R'C:\WINDOWS\FONTS\YUGOTHM.TTC'
-font_map['Yu Gothic UI Semibold'] = R'C:\WINDOWS\FONTS\YUGOTHB.TTC'
-font_map['Yu Gothic UI Bold'] = R'C:\WINDOWS\FONTS\YUGOTHB.TTC'
-font_map['Yu Gothic UI Light Oblique'] = R'C:\WINDOWS\FONTS\YUGOTHL.TTC'
-font_map['Yu Gothic UI Semilight Oblique'] = R'C:\WINDOWS\FONTS\YUGOTHR.TTC'
-font_map['Yu Gothic UI Oblique'] = R'C:\WINDOWS\FONTS\YUGOTHM.TTC'
-font_map['Yu Gothic UI Semibold Oblique'] = R'C:\WINDOWS\FONTS\YUGOTHB.TTC'
-font_map['Yu Gothic UI Bold Oblique'] = R'C:\WINDOWS\FONTS\YUGOTHB.TTC'
-font_map['HoloLens MDL2 Assets Regular'] = R'C:\WINDOWS\FONTS\HOLOMDL2.TTF'
-font_map['HoloLens MDL2 Assets Oblique'] = R'C:\WINDOWS\FONTS\HOLOMDL2.TTF'
-font_map['HoloLens MDL2 Assets Bold'] = R'C:\WINDOWS\FONTS\HOLOMDL2.TTF'
-font_map['HoloLens MDL2 Assets Bold Oblique'] = R'C:\WINDOWS\FONTS\HOLOMDL2.TTF'
-font_map['Agency FB Regular'] = R'C:\WINDOWS\FONTS\AGENCYR.TTF'
-font_map['Agency FB Bold'] = R'C:\WINDOWS\FONTS\AGENCYB.TTF'
-font_map['Agency FB Oblique'] = R'C:\WINDOWS\FONTS\AGENCYR.TTF'
-font_map['Agency FB Bold Oblique'] = R'C:\WINDOWS\FONTS\AGENCYB.TTF'
-font_map['Algerian Regular'] = R'C:\WINDOWS\FONTS\ALGER.TTF'
-font_map['Algerian Oblique'] = R'C:\WINDOWS\FONTS\ALGER.TTF'
-font_map['Algerian Bold'] = R'C:\WINDOWS\FONTS\ALGER.TTF'
-font_map['Algerian Bold Oblique'] = R'C:\WINDOWS\FONTS\ALGER.TTF'
-font_map['Book Antiqua Regular'] = R'C:\WINDOWS\FONTS\BKANT.TTF'
-font_map['Book Antiqua Italic'] = R'C:\WINDOWS\FONTS\ANTQUAI.TTF'
-font_map['Book Antiqua Bold'] = R'C:\WINDOWS\FONTS\ANTQUAB.TTF'
-font_map['Book Antiqua Bold Italic'] = R'C:\WINDOWS\FONTS\ANTQUABI.TTF'
-font_map['Book Antiqua Oblique'] = R'C:\WINDOWS\FONTS\BKANT.TTF'
-font_map['Book Antiqua Bold Oblique'] = R'C:\WINDOWS\FONTS\ANTQUAB.TTF'
-font_map['Arial Rounded MT Bold'] = R'C:\WINDOWS\FONTS\ARLRDBD.TTF'
-font_map['Arial Rounded MT Bold Oblique'] = R'C:\WINDOWS\FONTS\ARLRDBD.TTF'
-font_map['Baskerville Old Face Regular'] = R'C:\WINDOWS\FONTS\BASKVILL.TTF'
-font_map['Baskerville Old Face Oblique'] = R'C:\WINDOWS\FONTS\BASKVILL.TTF'
-font_map['Baskerville Old Face Bold'] = R'C:\WINDOWS\FONTS\BASKVILL.TTF'
-font_map['Baskerville Old Face Bold Oblique'] = R'C:\WINDOWS\FONTS\BASKVILL.TTF'
-font_map['Bauhaus 93 Regular'] = R'C:\WINDOWS\FONTS\BAUHS93.TTF'
-font_map['Bauhaus 93 Oblique'] = R'C:\WINDOWS\FONTS\BAUHS93.TTF'
-font_map['Bauhaus 93 Bold'] = R'C:\WINDOWS\FONTS\BAUHS93.TTF'
-font_map['Bauhaus 93 Bold Oblique'] = R'C:\WINDOWS\FONTS\BAUHS93.TTF'
-font_map['Bell MT Regular'] = R'C:\WINDOWS\FONTS\BELL.TTF'
-font_map['Bell MT Italic'] = R'C:\WINDOWS\FONTS\BELLI.TTF'
-font_map['Bell MT Bold'] = R'C:\WINDOWS\FONTS\BELLB.TTF'
-font_map['Bell MT Oblique'] = R'C:\WINDOWS\FONTS\BELL.TTF'
-font_map['Bell MT Bold Oblique'] = R'C:\WINDOWS\FONTS\BELLB.TTF'
-font_map['Bell MT Italic Bold'] = R'C:\WINDOWS\FONTS\BELLI.TTF'
-font_map['Bernard MT Condensed'] = R'C:\WINDOWS\FONTS\BERNHC.TTF'
-font_map['Bernard MT Condensed Oblique'] = R'C:\WINDOWS\FONTS\BERNHC.TTF'
-font_map['Bernard MT Condensed Bold'] = R'C:\WINDOWS\FONTS\BERNHC.TTF'
-font_map['Bernard MT Condensed Bold Oblique'] = R'C:\WINDOWS\FONTS\BERNHC.TTF'
-font_map['Bodoni MT Regular'] = R'C:\WINDOWS\FONTS\BOD_R.TTF'
-font_map['Bodoni MT Condensed'] = R'C:\WINDOWS\FONTS\BOD_CR.TTF'
-font_map['Bodoni MT Italic'] = R'C:\WINDOWS\FONTS\BOD_I.TTF'
-font_map['Bodoni MT Condensed Italic'] = R'C:\WINDOWS\FONTS\BOD_CI.TTF'
-font_map['Bodoni MT Bold'] = R'C:\WINDOWS\FONTS\BOD_B.TTF'
-font_map['Bodoni MT Condensed Bold'] = R'C:\WINDOWS\FONTS\BOD_CB.TTF'
-font_map['Bodoni MT Bold Italic'] = R'C:\WINDOWS\FONTS\BOD_BI.TTF'
-font_map['Bodoni MT Condensed Bold Italic'] = R'C:\WINDOWS\FONTS\BOD_CBI.TTF'
-font_map['Bodoni MT Black'] = R'C:\WINDOWS\FONTS\BOD_BLAR.TTF'
-font_map['Bodoni MT Black Italic'] = R'C:\WINDOWS\FONTS\BOD_BLAI.TTF'
-font_map['Bodoni MT Oblique'] = R'C:\WINDOWS\FONTS\BOD_R.TTF'
-font_map['Bodoni MT Condensed Oblique'] = R'C:\WINDOWS\FONTS\BOD_CR.TTF'
-font_map['Bodoni MT Bold Oblique'] = R'C:\WINDOWS\FONTS\BOD_B.TTF'
-font_map['Bodoni MT Condensed Bold Oblique'] = R'C:\WINDOWS\FONTS\BOD_CB.TTF'
-font_map['Bodoni MT Black Oblique'] = R'C:\WINDOWS\FONTS\BOD_BLAR.TTF'
-font_map['Bodoni MT Poster Compressed Light'] = R'C:\WINDOWS\FONTS\BOD_PSTC.TTF'
-font_map['Bodoni MT Poster Compressed Light Oblique'] = R'C:\WINDOWS\FONTS\BOD_PSTC.TTF'
-font_map['Bookman Old Style Regular'] = R'C:\WINDOWS\FONTS\BOOKOS.TTF'
-font_map['Bookman Old Style Italic'] = R'C:\WINDOWS\FONTS\BOOKOSI.TTF'
-font_map['Bookman Old Style Bold'] = R'C:\WINDOWS\FONTS\BOOKOSB.TTF'
-font_map['Bookman Old Style Bold Italic'] = R'C:\WINDOWS\FONTS\BOOKOSBI.TTF'
-font_map['Bookman Old Style Oblique'] = R'C:\WINDOWS\FONTS\BOOKOS.TTF'
-font_map['Bookman Old Style Bold Oblique'] = R'C:\WINDOWS\FONTS\BOOKOSB.TTF'
-font_map['Bradley Hand ITC Regular'] = R'C:\WINDOWS\FONTS\BRADHITC.TTF'
-font_map['Bradley Hand ITC Oblique'] = R'C:\WINDOWS\FONTS\BRADHITC.TTF'
-font_map['Bradley Hand ITC Bold'] = R'C:\WINDOWS\FONTS\BRADHITC.TTF'
-font_map['Bradley Hand ITC Bold Oblique'] = R'C:\WINDOWS\FONTS\BRADHITC.TTF'
-font_map['Britannic Bold'] = R'C:\WINDOWS\FONTS\BRITANIC.TTF'
-font_map['Britannic Bold Oblique'] = R'C:\WINDOWS\FONTS\BRITANIC.TTF'
-font_map['Berlin Sans FB Regular'] = R'C:\WINDOWS\FONTS\BRLNSR.TTF'
-font_map['Berlin Sans FB Demi Bold'] = R'C:\WINDOWS\FONTS\BRLNSDB.TTF'
-font_map['Berlin Sans FB Bold'] = R'C:\WINDOWS\FONTS\BRLNSB.TTF'
-font_map['Berlin Sans FB Oblique'] = R'C:\WINDOWS\FONTS\BRLNSR.TTF'
-font_map['Berlin Sans FB Demi Bold Oblique'] = R'C:\WINDOWS\FONTS\BRLNSDB.TTF'
-font_map['Berlin Sans FB Bold Oblique'] = R'C:\WINDOWS\FONTS\BRLNSB.TTF'
-font_map['Broadway Regular'] = R'C:\WINDOWS\FONTS\BROADW.TTF'
-font_map['Broadway Oblique'] = R'C:\WINDOWS\FONTS\BROADW.TTF'
-font_map['Broadway Bold'] = R'C:\WINDOWS\FONTS\BROADW.TTF'
-font_map['Broadway Bold Oblique'] = R'C:\WINDOWS\FONTS\BROADW.TTF'
-font_map['Brush Script MT Italic'] = R'C:\WINDOWS\FONTS\BRUSHSCI.TTF'
-font_map['Brush Script MT Italic Bold'] = R'C:\WINDOWS\FONTS\BRUSHSCI.TTF'
-font_map['Bookshelf Symbol 7 Regular'] = R'C:\WINDOWS\FONTS\BSSYM7.TTF'
-font_map['Bookshelf Symbol 7 Oblique'] = R'C:\WINDOWS\FONTS\BSSYM7.TTF'
-font_map['Bookshelf Symbol 7 Bold'] = R'C:\WINDOWS\FONTS\BSSYM7.TTF'
-font_map['Bookshelf Symbol 7 Bold Oblique'] = R'C:\WINDOWS\FONTS\BSSYM7.TTF'
-font_map['Californian FB Regular'] = R'C:\WINDOWS\FONTS\CALIFR.TTF'
-font_map['Californian FB Italic'] = R'C:\WINDOWS\FONTS\CALIFI.TTF'
-font_map['Californian FB Bold'] = R'C:\WINDOWS\FONTS\CALIFB.TTF'
-font_map['Californian FB Oblique'] = R'C:\WINDOWS\FONTS\CALIFR.TTF'
-font_map['Californian FB Bold Oblique'] = R'C:\WINDOWS\FONTS\CALIFB.TTF'
-font_map['Californian FB Italic Bold'] = R'C:\WINDOWS\FONTS\CALIFI.TTF'
-font_map['Calisto MT Regular'] = R'C:\WINDOWS\FONTS\CALIST.TTF'
-font_map['Calisto MT Italic'] = R'C:\WINDOWS\FONTS\CALISTI.TTF'
-font_map['Calisto MT Bold'] = R'C:\WINDOWS\FONTS\CALISTB.TTF'
-font_map['Calisto MT Bold Italic'] = R'C:\WINDOWS\FONTS\CALISTBI.TTF'
-font_map['Calisto MT Oblique'] = R'C:\WINDOWS\FONTS\CALIST.TTF'
-font_map['Calisto MT Bold Oblique'] = R'C:\WINDOWS\FONTS\CALISTB.TTF'
-font_map['Castellar Regular'] = R'C:\WINDOWS\FONTS\CASTELAR.TTF'
-font_map['Castellar Oblique'] = R'C:\WINDOWS\FONTS\CASTELAR.TTF'
-font_map['Castellar Bold'] = R'C:\WINDOWS\FONTS\CASTELAR.TTF'
-font_map['Castellar Bold Oblique'] = R'C:\WINDOWS\FONTS\CASTELAR.TTF'
-font_map['Century Schoolbook Regular'] = R'C:\WINDOWS\FONTS\CENSCBK.TTF'
-font_map['Century Schoolbook Italic'] = R'C:\WINDOWS\FONTS\SCHLBKI.TTF'
-font_map['Century Schoolbook Bold'] = R'C:\WINDOWS\FONTS\SCHLBKB.TTF'
-font_map['Century Schoolbook Bold Italic'] = R'C:\WINDOWS\FONTS\SCHLBKBI.TTF'
-font_map['Century Schoolbook Oblique'] = R'C:\WINDOWS\FONTS\CENSCBK.TTF'
-font_map['Century Schoolbook Bold Oblique'] = R'C:\WINDOWS\FONTS\SCHLBKB.TTF'
-font_map['Centaur Regular'] = R'C:\WINDOWS\FONTS\CENTAUR.TTF'
-font_map['Centaur Oblique'] = R'C:\WINDOWS\FONTS\CENTAUR.TTF'
-font_map['Centaur Bold'] = R'C:\WINDOWS\FONTS\CENTAUR.TTF'
-font_map['Centaur Bold Oblique'] = R'C:\WINDOWS\FONTS\CENTAUR.TTF'
-font_map['Century Regular'] = R'C:\WINDOWS\FONTS\CENTURY.TTF'
-font_map['Century Oblique'] = R'C:\WINDOWS\FONTS\CENTURY.TTF'
-font_map['Century Bold'] = R'C:\WINDOWS\FONTS\CENTURY.TTF'
-font_map['Century Bold Oblique'] = R'C:\WINDOWS\FONTS\CENTURY.TTF'
-font_map['Chiller Regular'] = R'C:\WINDOWS\FONTS\CHILLER.TTF'
-font_map['Chiller Oblique'] = R'C:\WINDOWS\FONTS\CHILLER.TTF'
-font_map['Chiller Bold'] = R'C:\WINDOWS\FONTS\CHILLER.TTF'
-font_map['Chiller Bold Oblique'] = R'C:\WINDOWS\FONTS\CHILLER.TTF'
-font_map['Colonna MT Regular'] = R'C:\WINDOWS\FONTS\COLONNA.TTF'
-font_map['Colonna MT Oblique'] = R'C:\WINDOWS\FONTS\COLONNA.TTF'
-font_map['Colonna MT Bold'] = R'C:\WINDOWS\FONTS\COLONNA.TTF'
-font_map['Colonna MT Bold Oblique'] = R'C:\WINDOWS\FONTS\COLONNA.TTF'
-font_map['Cooper Black'] = R'C:\WINDOWS\FONTS\COOPBL.TTF'
-font_map['Cooper Black Oblique'] = R'C:\WINDOWS\FONTS\COOPBL.TTF'
-font_map['Copperplate Gothic Light'] = R'C:\WINDOWS\FONTS\COPRGTL.TTF'
-font_map['Copperplate Gothic Bold'] = R'C:\WINDOWS\FONTS\COPRGTB.TTF'
-font_map['Copperplate Gothic Light Oblique'] = R'C:\WINDOWS\FONTS\COPRGTL.TTF'
-font_map['Copperplate Gothic Bold Oblique'] = R'C:\WINDOWS\FONTS\COPRGTB.TTF'
-font_map['Curlz MT Regular'] = R'C:\WINDOWS\FONTS\CURLZ___.TTF'
-font_map['Curlz MT Oblique'] = R'C:\WINDOWS\FONTS\CURLZ___.TTF'
-font_map['Curlz MT Bold'] = R'C:\WINDOWS\FONTS\CURLZ___.TTF'
-font_map['Curlz MT Bold Oblique'] = R'C:\WINDOWS\FONTS\CURLZ___.TTF'
-font_map['Dubai Light'] = R'C:\WINDOWS\FONTS\DUBAI-LIGHT.TTF'
-font_map['Dubai Regular'] = R'C:\WINDOWS\FONTS\DUBAI-REGULAR.TTF'
-font_map['Dubai Medium'] = R'C:\WINDOWS\FONTS\DUBAI-MEDIUM.TTF'
-font_map['Dubai Bold'] = R'C:\WINDOWS\FONTS\DUBAI-BOLD.TTF'
-font_map['Dubai Light Oblique'] = R'C:\WINDOWS\FONTS\DUBAI-LIGHT.TTF'
-font_map['Dubai Oblique'] = R'C:\WINDOWS\FONTS\DUBAI-REGULAR.TTF'
-font_map['Dubai Medium Oblique'] = R'C:\WINDOWS\FONTS\DUBAI-MEDIUM.TTF'
-font_map['Dubai Bold Oblique'] = R'C:\WINDOWS\FONTS\DUBAI-BOLD.TTF'
-font_map['Elephant Regular'] = R'C:\WINDOWS\FONTS\ELEPHNT.TTF'
-font_map['Elephant Italic'] = R'C:\WINDOWS\FONTS\ELEPHNTI.TTF'
-font_map['Elephant Oblique'] = R'C:\WINDOWS\FONTS\ELEPHNT.TTF'
-font_map['Elephant Bold'] = R'C:\WINDOWS\FONTS\ELEPHNT.TTF'
-font_map['Elephant Bold Oblique'] = R'C:\WINDOWS\FONTS\ELEPHNT.TTF'
-font_map['Elephant Italic Bold'] = R'C:\WINDOWS\FONTS\ELEPHNTI.TTF'
-font_map['Engravers MT Regular'] = R'C:\WINDOWS\FONTS\ENGR.TTF'
-font_map['Engravers MT Oblique'] = R'C:\WINDOWS\FONTS\ENGR.TTF'
-font_map['Engravers MT Bold'] = R'C:\WINDOWS\FONTS\ENGR.TTF'
-font_map['Engravers MT Bold Oblique'] = R'C:\WINDOWS\FONTS\ENGR.TTF'
-font_map['Eras ITC Light'] = R'C:\WINDOWS\FONTS\ERASLGHT.TTF'
-font_map['Eras ITC Medium'] = R'C:\WINDOWS\FONTS\ERASMD.TTF'
-font_map['Eras ITC Demi'] = R'C:\WINDOWS\FONTS\ERASDEMI.TTF'
-font_map['Eras ITC Bold'] = R'C:\WINDOWS\FONTS\ERASBD.TTF'
-font_map['Eras ITC Light Oblique'] = R'C:\WINDOWS\FONTS\ERASLGHT.TTF'
-font_map['Eras ITC Medium Oblique'] = R'C:\WINDOWS\FONTS\ERASMD.TTF'
-font_map['Eras ITC Demi Oblique'] = R'C:\WINDOWS\FONTS\ERASDEMI.TTF'
-font_map['Eras ITC Bold Oblique'] = R'C:\WINDOWS\FONTS\ERASBD.TTF'
-font_map['Felix Titling Regular'] = R'C:\WINDOWS\FONTS\FELIXTI.TTF'
-font_map['Felix Titling Oblique'] = R'C:\WINDOWS\FONTS\FELIXTI.TTF'
-font_map['Felix Titling Bold'] = R'C:\WINDOWS\FONTS\FELIXTI.TTF'
-font_map['Felix Titling Bold Oblique'] = R'C:\WINDOWS\FONTS\FELIXTI.TTF'
-font_map['Forte Regular'] = R'C:\WINDOWS\FONTS\FORTE.TTF'
-font_map['Forte Oblique'] = R'C:\WINDOWS\FONTS\FORTE.TTF'
-font_map['Forte Bold'] = R'C:\WINDOWS\FONTS\FORTE.TTF'
-font_map['Forte Bold Oblique'] = R'C:\WINDOWS\FONTS\FORTE.TTF'
-font_map['Franklin Gothic Book Regular'] = R'C:\WINDOWS\FONTS\FRABK.TTF'
-font_map['Franklin Gothic Book Italic'] = R'C:\WINDOWS\FONTS\FRABKIT.TTF'
-font_map['Franklin Gothic Book Oblique'] = R'C:\WINDOWS\FONTS\FRABK.TTF'
-font_map['Franklin Gothic Book Bold'] = R'C:\WINDOWS\FONTS\FRABK.TTF'
-font_map['Franklin Gothic Book Bold Oblique'] = R'C:\WINDOWS\FONTS\FRABK.TTF'
-font_map['Franklin Gothic Book Italic Bold'] = R'C:\WINDOWS\FONTS\FRABKIT.TTF'
-font_map['Freestyle Script Regular'] = R'C:\WINDOWS\FONTS\FREESCPT.TTF'
-font_map['Freestyle Script Oblique'] = R'C:\WINDOWS\FONTS\FREESCPT.TTF'
-font_map['Freestyle Script Bold'] = R'C:\WINDOWS\FONTS\FREESCPT.TTF'
-font_map['Freestyle Script Bold Oblique'] = R'C:\WINDOWS\FONTS\FREESCPT.TTF'
-font_map['French Script MT Regular'] = R'C:\WINDOWS\FONTS\FRSCRIPT.TTF'
-font_map['French Script MT Oblique'] = R'C:\WINDOWS\FONTS\FRSCRIPT.TTF'
-font_map['French Script MT Bold'] = R'C:\WINDOWS\FONTS\FRSCRIPT.TTF'
-font_map['French Script MT Bold Oblique'] = R'C:\WINDOWS\FONTS\FRSCRIPT.TTF'
-font_map['Footlight MT Light'] = R'C:\WINDOWS\FONTS\FTLTLT.TTF'
-font_map['Footlight MT Light Oblique'] = R'C:\WINDOWS\FONTS\FTLTLT.TTF'
-font_map['Garamond Regular'] = R'C:\WINDOWS\FONTS\GARA.TTF'
-font_map['Garamond Italic'] = R'C:\WINDOWS\FONTS\GARAIT.TTF'
-font_map['Garamond Bold'] = R'C:\WINDOWS\FONTS\GARABD.TTF'
-font_map['Garamond Oblique'] = R'C:\WINDOWS\FONTS\GARA.TTF'
-font_map['Garamond Bold Oblique'] = R'C:\WINDOWS\FONTS\GARABD.TTF'
-font_map['Garamond Italic Bold'] = R'C:\WINDOWS\FONTS\GARAIT.TTF'
-font_map['Gigi Regular'] = R'C:\WINDOWS\FONTS\GIGI.TTF'
-font_map['Gigi Oblique'] = R'C:\WINDOWS\FONTS\GIGI.TTF'
-font_map['Gigi Bold'] = R'C:\WINDOWS\FONTS\GIGI.TTF'
-font_map['Gigi Bold Oblique'] = R'C:\WINDOWS\FONTS\GIGI.TTF'
-font_map['Gill Sans MT Regular'] = R'C:\WINDOWS\FONTS\GIL_____.TTF'
-font_map['Gill Sans MT Condensed'] = R'C:\WINDOWS\FONTS\GILC____.TTF'
-font_map['Gill Sans MT Italic'] = R'C:\WINDOWS\FONTS\GILI____.TTF'
-font_map['Gill Sans MT Bold'] = R'C:\WINDOWS\FONTS\GILB____.TTF'
-font_map['Gill Sans MT Ext Condensed Bold'] = R'C:\WINDOWS\FONTS\GLSNECB.TTF'
-font_map['Gill Sans MT Bold Italic'] = R'C:\WINDOWS\FONTS\GILBI___.TTF'
-font_map['Gill Sans MT Oblique'] = R'C:\WINDOWS\FONTS\GIL_____.TTF'
-font_map['Gill Sans MT Condensed Oblique'] = R'C:\WINDOWS\FONTS\GILC____.TTF'
-font_map['Gill Sans MT Condensed Bold'] = R'C:\WINDOWS\FONTS\GILC____.TTF'
-font_map['Gill Sans MT Bold Oblique'] = R'C:\WINDOWS\FONTS\GILB____.TTF'
-font_map['Gill Sans MT Ext Condensed Bold Oblique'] = R'C:\WINDOWS\FONTS\GLSNECB.TTF'
-font_map['Gill Sans MT Condensed Bold Oblique'] = R'C:\WINDOWS\FONTS\GILC____.TTF'
-font_map['Gill Sans Ultra Bold'] = R'C:\WINDOWS\FONTS\GILSANUB.TTF'
-font_map['Gill Sans Condensed Ultra Bold'] = R'C:\WINDOWS\FONTS\GILLUBCD.TTF'
-font_map['Gill Sans Ultra Bold Oblique'] = R'C:\WINDOWS\FONTS\GILSANUB.TTF'
-font_map['Gill Sans Condensed Ultra Bold Oblique'] = R'C:\WINDOWS\FONTS\GILLUBCD.TTF'
-font_map['Gloucester MT Extra Condensed'] = R'C:\WINDOWS\FONTS\GLECB.TTF'
-font_map['Gloucester MT Extra Condensed Oblique'] = R'C:\WINDOWS\FONTS\GLECB.TTF'
-font_map['Gloucester MT Extra Condensed Bold'] = R'C:\WINDOWS\FONTS\GLECB.TTF'
-font_map['Gloucester MT Extra Condensed Bold Oblique'] = R'C:\WINDOWS\FONTS\GLECB.TTF'
-font_map['Century Gothic Regular'] = R'C:\WINDOWS\FONTS\GOTHIC.TTF'
-font_map['Century Gothic Italic'] = R'C:\WINDOWS\FONTS\GOTHICI.TTF'
-font_map['Century Gothic Bold'] = R'C:\WINDOWS\FONTS\GOTHICB.TTF'
-font_map['Century Gothic Bold Italic'] = R'C:\WINDOWS\FONTS\GOTHICBI.TTF'
-font_map['Century Gothic Oblique'] = R'C:\WINDOWS\FONTS\GOTHIC.TTF'
-font_map['Century Gothic Bold Oblique'] = R'C:\WINDOWS\FONTS\GOTHICB.TTF'
-font_map['Goudy Old Style Regular'] = R'C:\WINDOWS\FONTS\GOUDOS.TTF'
-font_map['Goudy Old Style Italic'] = R'C:\WINDOWS\FONTS\GOUDOSI.TTF'
-font_map['Goudy Old Style Bold'] = R'C:\WINDOWS\FONTS\GOUDOSB.TTF'
-font_map['Goudy Old Style Oblique'] = R'C:\WINDOWS\FONTS\GOUDOS.TTF'
-font_map['Goudy Old Style Bold Oblique'] = R'C:\WINDOWS\FONTS\GOUDOSB.TTF'
-font_map['Goudy Old Style Italic Bold'] = R'C:\WINDOWS\FONTS\GOUDOSI.TTF'
-font_map['Goudy Stout Regular'] = R'C:\WINDOWS\FONTS\GOUDYSTO.TTF'
-font_map['Goudy Stout Oblique'] = R'C:\WINDOWS\FONTS\GOUDYSTO.TTF'
-font_map['Goudy Stout Bold'] = R'C:\WINDOWS\FONTS\GOUDYSTO.TTF'
-font_map['Goudy Stout Bold Oblique'] = R'C:\WINDOWS\FONTS\GOUDYSTO.TTF'
-font_map['Harlow Solid SemiExpanded Italic'] = R'C:\WINDOWS\FONTS\HARLOWSI.TTF'
-font_map['Harlow Solid SemiExpanded Italic Bold'] = R'C:\WINDOWS\FONTS\HARLOWSI.TTF'
-font_map['Harrington Regular'] = R'C:\WINDOWS\FONTS\HARNGTON.TTF'
-font_map['Harrington Oblique'] = R'C:\WINDOWS\FONTS\HARNGTON.TTF'
-font_map['Harrington Bold'] = R'C:\WINDOWS\FONTS\HARNGTON.TTF'
-font_map['Harrington Bold Oblique'] = R'C:\WINDOWS\FONTS\HARNGTON.TTF'
-font_map['Haettenschweiler Regular'] = R'C:\WINDOWS\FONTS\HATTEN.TTF'
-font_map['Haettenschweiler Oblique'] = R'C:\WINDOWS\FONTS\HATTEN.TTF'
-font_map['Haettenschweiler Bold'] = R'C:\WINDOWS\FONTS\HATTEN.TTF'
-font_map['Haettenschweiler Bold Oblique'] = R'C:\WINDOWS\FONTS\HATTEN.TTF'
-font_map['High Tower Text Regular'] = R'C:\WINDOWS\FONTS\HTOWERT.TTF'
-font_map['High Tower Text Italic'] = R'C:\WINDOWS\FONTS\HTOWERTI.TTF'
-font_map['High Tower Text Oblique'] = R'C:\WINDOWS\FONTS\HTOWERT.TTF'
-font_map['High Tower Text Bold'] = R'C:\WINDOWS\FONTS\HTOWERT.TTF'
-font_map['High Tower Text Bold Oblique'] = R'C:\WINDOWS\FONTS\HTOWERT.TTF'
-font_map['High Tower Text Italic Bold'] = R'C:\WINDOWS\FONTS\HTOWERTI.TTF'
-font_map['Imprint MT Shadow Regular'] = R'C:\WINDOWS\FONTS\IMPRISHA.TTF'
-font_map['Imprint MT Shadow Oblique'] = R'C:\WINDOWS\FONTS\IMPRISHA.TTF'
-font_map['Imprint MT Shadow Bold'] = R'C:\WINDOWS\FONTS\IMPRISHA.TTF'
-font_map['Imprint MT Shadow Bold Oblique'] = R'C:\WINDOWS\FONTS\IMPRISHA.TTF'
-font_map['Informal Roman Regular'] = R'C:\WINDOWS\FONTS\INFROMAN.TTF'
-font_map['Informal Roman Oblique'] = R'C:\WINDOWS\FONTS\INFROMAN.TTF'
-font_map['Informal Roman Bold'] = R'C:\WINDOWS\FONTS\INFROMAN.TTF'
-font_map['Informal Roman Bold Oblique'] = R'C:\WINDOWS\FONTS\INFROMAN.TTF'
-font_map['Blackadder ITC Regular'] = R'C:\WINDOWS\FONTS\ITCBLKAD.TTF'
-font_map['Blackadder ITC Oblique'] = R'C:\WINDOWS\FONTS\ITCBLKAD.TTF'
-font_map['Blackadder ITC Bold'] = R'C:\WINDOWS\FONTS\ITCBLKAD.TTF'
-font_map['Blackadder ITC Bold Oblique'] = R'C:\WINDOWS\FONTS\ITCBLKAD.TTF'
-font_map['Edwardian Script ITC Regular'] = R'C:\WINDOWS\FONTS\ITCEDSCR.TTF'
-font_map['Edwardian Script ITC Oblique'] = R'C:\WINDOWS\FONTS\ITCEDSCR.TTF'
-font_map['Edwardian Script ITC Bold'] = R'C:\WINDOWS\FONTS\ITCEDSCR.TTF'
-font_map['Edwardian Script ITC Bold Oblique'] = R'C:\WINDOWS\FONTS\ITCEDSCR.TTF'
-font_map['Kristen ITC Regular'] = R'C:\WINDOWS\FONTS\ITCKRIST.TTF'
-font_map['Kristen ITC Oblique'] = R'C:\WINDOWS\FONTS\ITCKRIST.TTF'
-font_map['Kristen ITC Bold'] = R'C:\WINDOWS\FONTS\ITCKRIST.TTF'
-font_map['Kristen ITC Bold Oblique'] = R'C:\WINDOWS\FONTS\ITCKRIST.TTF'
-font_map['Jokerman Regular'] = R'C:\WINDOWS\FONTS\JOKERMAN.TTF'
-font_map['Jokerman Oblique'] = R'C:\WINDOWS\FONTS\JOKERMAN.TTF'
-font_map['Jokerman Bold'] = R'C:\WINDOWS\FONTS\JOKERMAN.TTF'
-font_map['Jokerman Bold Oblique'] = R'C:\WINDOWS\FONTS\JOKERMAN.TTF'
-font_map['Juice ITC Regular'] = R'C:\WINDOWS\FONTS\JUICE___.TTF'
-font_map['Juice ITC Oblique'] = R'C:\WINDOWS\FONTS\JUICE___.TTF'
-font_map['Juice ITC Bold'] = R'C:\WINDOWS\FONTS\JUICE___.TTF'
-font_map['Juice ITC Bold Oblique'] = R'C:\WINDOWS\FONTS\JUICE___.TTF'
-font_map['Kunstler Script Regular'] = R'C:\WINDOWS\FONTS\KUNSTLER.TTF'
-font_map['Kunstler Script Oblique'] = R'C:\WINDOWS\FONTS\KUNSTLER.TTF'
-font_map['Kunstler Script Bold'] = R'C:\WINDOWS\FONTS\KUNSTLER.TTF'
-font_map['Kunstler Script Bold Oblique'] = R'C:\WINDOWS\FONTS\KUNSTLER.TTF'
-font_map['Wide Latin Regular'] = R'C:\WINDOWS\FONTS\LATINWD.TTF'
-font_map['Wide Latin Oblique'] = R'C:\WINDOWS\FONTS\LATINWD.TTF'
-font_map['Wide Latin Bold'] = R'C:\WINDOWS\FONTS\LATINWD.TTF'
-font_map['Wide Latin Bold Oblique'] = R'C:\WINDOWS\FONTS\LATINWD.TTF'
-font_map['Lucida Bright Regular'] = R'C:\WINDOWS\FONTS\LBRITE.TTF'
-font_map['Lucida Bright Italic'] = R'C:\WINDOWS\FONTS\LBRITEI.TTF'
-font_map['Lucida Bright Demibold'] = R'C:\WINDOWS\FONTS\LBRITED.TTF'
-font_map['Lucida Bright Demibold Italic'] = R'C:\WINDOWS\FONTS\LBRITEDI.TTF'
-font_map['Lucida Bright Oblique'] = R'C:\WINDOWS\FONTS\LBRITE.TTF'
-font_map['Lucida Bright Demibold Oblique'] = R'C:\WINDOWS\FONTS\LBRITED.TTF'
-font_map['Lucida Calligraphy Italic'] = R'C:\WINDOWS\FONTS\LCALLIG.TTF'
-font_map['Lucida Calligraphy Italic Bold'] = R'C:\WINDOWS\FONTS\LCALLIG.TTF'
-font_map['Leelawadee Regular'] = R'C:\WINDOWS\FONTS\LEELAWAD.TTF'
-font_map['Leelawadee Bold'] = R'C:\WINDOWS\FONTS\LEELAWDB.TTF'
-font_map['Leelawadee Oblique'] = R'C:\WINDOWS\FONTS\LEELAWAD.TTF'
-font_map['Leelawadee Bold Oblique'] = R'C:\WINDOWS\FONTS\LEELAWDB.TTF'
-font_map['Lucida Fax Regular'] = R'C:\WINDOWS\FONTS\LFAX.TTF'
-font_map['Lucida Fax Italic'] = R'C:\WINDOWS\FONTS\LFAXI.TTF'
-font_map['Lucida Fax Demibold'] = R'C:\WINDOWS\FONTS\LFAXD.TTF'
-font_map['Lucida Fax Demibold Italic'] = R'C:\WINDOWS\FONTS\LFAXDI.TTF'
-font_map['Lucida Fax Oblique'] = R'C:\WINDOWS\FONTS\LFAX.TTF'
-font_map['Lucida Fax Demibold Oblique'] = R'C:\WINDOWS\FONTS\LFAXD.TTF'
-font_map['Lucida Handwriting Italic'] = R'C:\WINDOWS\FONTS\LHANDW.TTF'
-font_map['Lucida Handwriting Italic Bold'] = R'C:\WINDOWS\FONTS\LHANDW.TTF'
-font_map['Lucida Sans Regular'] = R'C:\WINDOWS\FONTS\LSANS.TTF'
-font_map['Lucida Sans Italic'] = R'C:\WINDOWS\FONTS\LSANSI.TTF'
-font_map['Lucida Sans Demibold Roman'] = R'C:\WINDOWS\FONTS\LSANSD.TTF'
-font_map['Lucida Sans Demibold Italic'] = R'C:\WINDOWS\FONTS\LSANSDI.TTF'
-font_map['Lucida Sans Oblique'] = R'C:\WINDOWS\FONTS\LSANS.TTF'
-font_map['Lucida Sans Demibold Oblique'] = R'C:\WINDOWS\FONTS\LSANSD.TTF'
-font_map['Lucida Sans Typewriter Regular'] = R'C:\WINDOWS\FONTS\LTYPE.TTF'
-font_map['Lucida Sans Typewriter Oblique'] = R'C:\WINDOWS\FONTS\LTYPEO.TTF'
-font_map['Lucida Sans Typewriter Bold'] = R'C:\WINDOWS\FONTS\LTYPEB.TTF'
-font_map['Lucida Sans Typewriter Bold Oblique'] = R'C:\WINDOWS\FONTS\LTYPEBO.TTF'
-font_map['Magneto Bold'] = R'C:\WINDOWS\FONTS\MAGNETOB.TTF'
-font_map['Magneto Bold Oblique'] = R'C:\WINDOWS\FONTS\MAGNETOB.TTF'
-font_map['Maiandra GD Regular'] = R'C:\WINDOWS\FONTS\MAIAN.TTF'
-font_map['Maiandra GD Oblique'] = R'C:\WINDOWS\FONTS\MAIAN.TTF'
-font_map['Maiandra GD Bold'] = R'C:\WINDOWS\FONTS\MAIAN.TTF'
-font_map['Maiandra GD Bold Oblique'] = R'C:\WINDOWS\FONTS\MAIAN.TTF'
-font_map['Matura MT Script Capitals Regular'] = R'C:\WINDOWS\FONTS\MATURASC.TTF'
-font_map['Matura MT Script Capitals Oblique'] = R'C:\WINDOWS\FONTS\MATURASC.TTF'
-font_map['Matura MT Script Capitals Bold'] = R'C:\WINDOWS\FONTS\MATURASC.TTF'
-font_map['Matura MT Script Capitals Bold Oblique'] = R'C:\WINDOWS\FONTS\MATURASC.TTF'
-font_map['Mistral Regular'] = R'C:\WINDOWS\FONTS\MISTRAL.TTF'
-font_map['Mistral Oblique'] = R'C:\WINDOWS\FONTS\MISTRAL.TTF'
-font_map['Mistral Bold'] = R'C:\WINDOWS\FONTS\MISTRAL.TTF'
-font_map['Mistral Bold Oblique'] = R'C:\WINDOWS\FONTS\MISTRAL.TTF'
-font_map['Modern No. 20 Regular'] = R'C:\WINDOWS\FONTS\MOD20.TTF'
-font_map['Modern No. 20 Oblique'] = R'C:\WINDOWS\FONTS\MOD20.TTF'
-font_map['Modern No. 20 Bold'] = R'C:\WINDOWS\FONTS\MOD20.TTF'
-font_map['Modern No. 20 Bold Oblique'] = R'C:\WINDOWS\FONTS\MOD20.TTF'
-font_map['Microsoft Uighur Regular'] = R'C:\WINDOWS\FONTS\MSUIGHUR.TTF'
-font_map['Microsoft Uighur Bold'] = R'C:\WINDOWS\FONTS\MSUIGHUB.TTF'
-font_map['Microsoft Uighur Oblique'] = R'C:\WINDOWS\FONTS\MSUIGHUR.TTF'
-font_map['Microsoft Uighur Bold Oblique'] = R'C:\WINDOWS\FONTS\MSUIGHUB.TTF'
-font_map['Monotype Corsiva Regular'] = R'C:\WINDOWS\FONTS\MTCORSVA.TTF'
-font_map['Monotype Corsiva Bold'] = R'C:\WINDOWS\FONTS\MTCORSVA.TTF'
-font_map['MT Extra Regular'] = R'C:\WINDOWS\FONTS\MTEXTRA.TTF'
-font_map['MT Extra Oblique'] = R'C:\WINDOWS\FONTS\MTEXTRA.TTF'
-font_map['MT Extra Bold'] = R'C:\WINDOWS\FONTS\MTEXTRA.TTF'
-font_map['MT Extra Bold Oblique'] = R'C:\WINDOWS\FONTS\MTEXTRA.TTF'
-font_map['Niagara Engraved Regular'] = R'C:\WINDOWS\FONTS\NIAGENG.TTF'
-font_map['Niagara Engraved Oblique'] = R'C:\WINDOWS\FONTS\NIAGENG.TTF'
-font_map['Niagara Engraved Bold'] = R'C:\WINDOWS\FONTS\NIAGENG.TTF'
-font_map['Niagara Engraved Bold Oblique'] = R'C:\WINDOWS\FONTS\NIAGENG.TTF'
-font_map['Niagara Solid Regular'] = R'C:\WINDOWS\FONTS\NIAGSOL.TTF'
-font_map['Niagara Solid Oblique'] = R'C:\WINDOWS\FONTS\NIAGSOL.TTF'
-font_map['Niagara Solid Bold'] = R'C:\WINDOWS\FONTS\NIAGSOL.TTF'
-font_map['Niagara Solid Bold Oblique'] = R'C:\WINDOWS\FONTS\NIAGSOL.TTF'
-font_map['OCR A Extended'] = R'C:\WINDOWS\FONTS\OCRAEXT.TTF'
-font_map['OCR A Extended Oblique'] = R'C:\WINDOWS\FONTS\OCRAEXT.TTF'
-font_map['OCR A Extended Bold'] = R'C:\WINDOWS\FONTS\OCRAEXT.TTF'
-font_map['OCR A Extended Bold Oblique'] = R'C:\WINDOWS\FONTS\OCRAEXT.TTF'
-font_map['Old English Text MT Regular'] = R'C:\WINDOWS\FONTS\OLDENGL.TTF'
-font_map['Old English Text MT Oblique'] = R'C:\WINDOWS\FONTS\OLDENGL.TTF'
-font_map['Old English Text MT Bold'] = R'C:\WINDOWS\FONTS\OLDENGL.TTF'
-font_map['Old English Text MT Bold Oblique'] = R'C:\WINDOWS\FONTS\OLDENGL.TTF'
-font_map['Onyx Regular'] = R'C:\WINDOWS\FONTS\ONYX.TTF'
-font_map['Onyx Oblique'] = R'C:\WINDOWS\FONTS\ONYX.TTF'
-font_map['Onyx Bold'] = R'C:\WINDOWS\FONTS\ONYX.TTF'
-font_map['Onyx Bold Oblique'] = R'C:\WINDOWS\FONTS\ONYX.TTF'
-font_map['MS Outlook Regular'] = R'C:\WINDOWS\FONTS\OUTLOOK.TTF'
-font_map['MS Outlook Oblique'] = R'C:\WINDOWS\FONTS\OUTLOOK.TTF'
-font_map['MS Outlook Bold'] = R'C:\WINDOWS\FONTS\OUTLOOK.TTF'
-font_map['MS Outlook Bold Oblique'] = R'C:\WINDOWS\FONTS\OUTLOOK.TTF'
-font_map['Palace Script MT Regular'] = R'C:\WINDOWS\FONTS\PALSCRI.TTF'
-font_map['Palace Script MT Bold'] = R'C:\WINDOWS\FONTS\PALSCRI.TTF'
-font_map['Papyrus Regular'] = R'C:\WINDOWS\FONTS\PAPYRUS.TTF'
-font_map['Papyrus Oblique'] = R'C:\WINDOWS\FONTS\PAPYRUS.TTF'
-font_map['Papyrus Bold'] = R'C:\WINDOWS\FONTS\PAPYRUS.TTF'
-font_map['Papyrus Bold Oblique'] = R'C:\WINDOWS\FONTS\PAPYRUS.TTF'
-font_map['Parchment Regular'] = R'C:\WINDOWS\FONTS\PARCHM.TTF'
-font_map['Parchment Oblique'] = R'C:\WINDOWS\FONTS\PARCHM.TTF'
-font_map['Parchment Bold'] = R'C:\WINDOWS\FONTS\PARCHM.TTF'
-font_map['Parchment Bold Oblique'] = R'C:\WINDOWS\FONTS\PARCHM.TTF'
-font_map['Perpetua Regular'] = R'C:\WINDOWS\FONTS\PER_____.TTF'
-font_map['Perpetua Italic'] = R'C:\WINDOWS\FONTS\PERI____.TTF'
-font_map['Perpetua Bold'] = R'C:\WINDOWS\FONTS\PERB____.TTF'
-font_map['Perpetua Bold Italic'] = R'C:\WINDOWS\FONTS\PERBI___.TTF'
-font_map['Perpetua Oblique'] = R'C:\WINDOWS\FONTS\PER_____.TTF'
-font_map['Perpetua Bold Oblique'] = R'C:\WINDOWS\FONTS\PERB____.TTF'
-font_map['Perpetua Titling MT Light'] = R'C:\WINDOWS\FONTS\PERTILI.TTF'
-font_map['Perpetua Titling MT Bold'] = R'C:\WINDOWS\FONTS\PERTIBD.TTF'
-font_map['Perpetua Titling MT Light Oblique'] = R'C:\WINDOWS\FONTS\PERTILI.TTF'
-font_map['Perpetua Titling MT Bold Oblique'] = R'C:\WINDOWS\FONTS\PERTIBD.TTF'
-font_map['Playbill Regular'] = R'C:\WINDOWS\FONTS\PLAYBILL.TTF'
-font_map['Playbill Oblique'] = R'C:\WINDOWS\FONTS\PLAYBILL.TTF'
-font_map['Playbill Bold'] = R'C:\WINDOWS\FONTS\PLAYBILL.TTF'
-font_map['Playbill Bold Oblique'] = R'C:\WINDOWS\FONTS\PLAYBILL.TTF'
-font_map['Poor Richard Regular'] = R'C:\WINDOWS\FONTS\POORICH.TTF'
-font_map['Poor Richard Oblique'] = R'C:\WINDOWS\FONTS\POORICH.TTF'
-font_map['Poor Richard Bold'] = R'C:\WINDOWS\FONTS\POORICH.TTF'
-font_map['Poor Richard Bold Oblique'] = R'C:\WINDOWS\FONTS\POORICH.TTF'
-font_map['Pristina Regular'] = R'C:\WINDOWS\FONTS\PRISTINA.TTF'
-font_map['Pristina Oblique'] = R'C:\WINDOWS\FONTS\PRISTINA.TTF'
-font_map['Pristina Bold'] = R'C:\WINDOWS\FONTS\PRISTINA.TTF'
-font_map['Pristina Bold Oblique'] = R'C:\WINDOWS\FONTS\PRISTINA.TTF'
-font_map['Rage Italic'] = R'C:\WINDOWS\FONTS\RAGE.TTF'
-font_map['Rage Italic Bold'] = R'C:\WINDOWS\FONTS\RAGE.TTF'
-font_map['Ravie Regular'] = R'C:\WINDOWS\FONTS\RAVIE.TTF'
-font_map['Ravie Oblique'] = R'C:\WINDOWS\FONTS\RAVIE.TTF'
-font_map['Ravie Bold'] = R'C:\WINDOWS\FONTS\RAVIE.TTF'
-font_map['Ravie Bold Oblique'] = R'C:\WINDOWS\FONTS\RAVIE.TTF'
-font_map['MS Reference Sans Serif Regular'] = R'C:\WINDOWS\FONTS\REFSAN.TTF'
-font_map['MS Reference Sans Serif Oblique'] = R'C:\WINDOWS\FONTS\REFSAN.TTF'
-font_map['MS Reference Sans Serif Bold'] = R'C:\WINDOWS\FONTS\REFSAN.TTF'
-font_map['MS Reference Sans Serif Bold Oblique'] = R'C:\WINDOWS\FONTS\REFSAN.TTF'
-font_map['MS Reference Specialty Regular'] = R'C:\WINDOWS\FONTS\REFSPCL.TTF'
-font_map['MS Reference Specialty Oblique'] = R'C:\WINDOWS\FONTS\REFSPCL.TTF'
-font_map['MS Reference Specialty Bold'] = R'C:\WINDOWS\FONTS\REFSPCL.TTF'
-font_map['MS Reference Specialty Bold Oblique'] = R'C:\WINDOWS\FONTS\REFSPCL.TTF'
-font_map['Rockwell Regular'] = R'C:\WINDOWS\FONTS\ROCK.TTF'
-font_map['Rockwell Condensed'] = R'C:\WINDOWS\FONTS\ROCC____.TTF'
-font_map['Rockwell Italic'] = R'C:\WINDOWS\FONTS\ROCKI.TTF'
-font_map['Rockwell Bold'] = R'C:\WINDOWS\FONTS\ROCKB.TTF'
-font_map['Rockwell Condensed Bold'] = R'C:\WINDOWS\FONTS\ROCCB___.TTF'
-font_map['Rockwell Bold Italic'] = R'C:\WINDOWS\FONTS\ROCKBI.TTF'
-font_map['Rockwell Extra Bold'] = R'C:\WINDOWS\FONTS\ROCKEB.TTF'
-font_map['Rockwell Oblique'] = R'C:\WINDOWS\FONTS\ROCK.TTF'
-font_map['Rockwell Condensed Oblique'] = R'C:\WINDOWS\FONTS\ROCC____.TTF'
-font_map['Rockwell Bold Oblique'] = R'C:\WINDOWS\FONTS\ROCKB.TTF'
-font_map['Rockwell Condensed Bold Oblique'] = R'C:\WINDOWS\FONTS\ROCCB___.TTF'
-font_map['Rockwell Extra Bold Oblique'] = R'C:\WINDOWS\FONTS\ROCKEB.TTF'
-font_map['Script MT Bold'] = R'C:\WINDOWS\FONTS\SCRIPTBL.TTF'
-font_map['Script MT Bold Oblique'] = R'C:\WINDOWS\FONTS\SCRIPTBL.TTF'
-font_map['Showcard Gothic Regular'] = R'C:\WINDOWS\FONTS\SHOWG.TTF'
-font_map['Showcard Gothic Oblique'] = R'C:\WINDOWS\FONTS\SHOWG.TTF'
-font_map['Showcard Gothic Bold'] = R'C:\WINDOWS\FONTS\SHOWG.TTF'
-font_map['Showcard Gothic Bold Oblique'] = R'C:\WINDOWS\FONTS\SHOWG.TTF'
-font_map['Snap ITC Regular'] = R'C:\WINDOWS\FONTS\SNAP____.TTF'
-font_map['Snap ITC Oblique'] = R'C:\WINDOWS\FONTS\SNAP____.TTF'
-font_map['Snap ITC Bold'] = R'C:\WINDOWS\FONTS\SNAP____.TTF'
-font_map['Snap ITC Bold Oblique'] = R'C:\WINDOWS\FONTS\SNAP____.TTF'
-font_map['Stencil Regular'] = R'C:\WINDOWS\FONTS\STENCIL.TTF'
-font_map['Stencil Oblique'] = R'C:\WINDOWS\FONTS\STENCIL.TTF'
-font_map['Stencil Bold'] = R'C:\WINDOWS\FONTS\STENCIL.TTF'
-font_map['Stencil Bold Oblique'] = R'C:\WINDOWS\FONTS\STENCIL.TTF'
-font_map['Tw Cen MT Regular'] = R'C:\WINDOWS\FONTS\TCM_____.TTF'
-font_map['Tw Cen MT Condensed'] = R'C:\WINDOWS\FONTS\TCCM____.TTF'
-font_map['Tw Cen MT Italic'] = R'C:\WINDOWS\FONTS\TCMI____.TTF'
-font_map['Tw Cen MT Bold'] = R'C:\WINDOWS\FONTS\TCB_____.TTF'
-font_map['Tw Cen MT Condensed Bold'] = R'C:\WINDOWS\FONTS\TCCB____.TTF'
-font_map['Tw Cen MT Bold Italic'] = R'C:\WINDOWS\FONTS\TCBI____.TTF'
-font_map['Tw Cen MT Condensed Extra Bold'] = R'C:\WINDOWS\FONTS\TCCEB.TTF'
-font_map['Tw Cen MT Oblique'] = R'C:\WINDOWS\FONTS\TCM_____.TTF'
-font_map['Tw Cen MT Condensed Oblique'] = R'C:\WINDOWS\FONTS\TCCM____.TTF'
-font_map['Tw Cen MT Bold Oblique'] = R'C:\WINDOWS\FONTS\TCB_____.TTF'
-font_map['Tw Cen MT Condensed Bold Oblique'] = R'C:\WINDOWS\FONTS\TCCB____.TTF'
-font_map['Tw Cen MT Condensed Extra Bold Oblique'] = R'C:\WINDOWS\FONTS\TCCEB.TTF'
-font_map['Tempus Sans ITC Regular'] = R'C:\WINDOWS\FONTS\TEMPSITC.TTF'
-font_map['Tempus Sans ITC Oblique'] = R'C:\WINDOWS\FONTS\TEMPSITC.TTF'
-font_map['Tempus Sans ITC Bold'] = R'C:\WINDOWS\FONTS\TEMPSITC.TTF'
-font_map['Tempus Sans ITC Bold Oblique'] = R'C:\WINDOWS\FONTS\TEMPSITC.TTF'
-font_map['Viner Hand ITC Regular'] = R'C:\WINDOWS\FONTS\VINERITC.TTF'
-font_map['Viner Hand ITC Oblique'] = R'C:\WINDOWS\FONTS\VINERITC.TTF'
-font_map['Viner Hand ITC Bold'] = R'C:\WINDOWS\FONTS\VINERITC.TTF'
-font_map['Viner Hand ITC Bold Oblique'] = R'C:\WINDOWS\FONTS\VINERITC.TTF'
-font_map['Vivaldi Italic'] = R'C:\WINDOWS\FONTS\VIVALDII.TTF'
-font_map['Vivaldi Italic Bold'] = R'C:\WINDOWS\FONTS\VIVALDII.TTF'
-font_map['Vladimir Script Regular'] = R'C:\WINDOWS\FONTS\VLADIMIR.TTF'
-font_map['Vladimir Script Oblique'] = R'C:\WINDOWS\FONTS\VLADIMIR.TTF'
-font_map['Vladimir Script Bold'] = R'C:\WINDOWS\FONTS\VLADIMIR.TTF'
-font_map['Vladimir Script Bold Oblique'] = R'C:\WINDOWS\FONTS\VLADIMIR.TTF'
-font_map['Wingdings 2 Regular'] = R'C:\WINDOWS\FONTS\WINGDNG2.TTF'
-font_map['Wingdings 2 Oblique'] = R'C:\WINDOWS\FONTS\WINGDNG2.TTF'
-font_map['Wingdings 2 Bold'] = R'C:\WINDOWS\FONTS\WINGDNG2.TTF'
-font_map['Wingdings 2 Bold Oblique'] = R'C:\WINDOWS\FONTS\WINGDNG2.TTF'
-font_map['Wingdings 3 Regular'] = R'C:\WINDOWS\FONTS\WINGDNG3.TTF'
-font_map['Wingdings 3 Oblique'] = R'C:\WINDOWS\FONTS\WINGDNG3.TTF'
-font_map['Wingdings 3 Bold'] = R'C:\WINDOWS\FONTS\WINGDNG3.TTF'
-font_map['Wingdings 3 Bold Oblique'] = R'C:\WINDOWS\FONTS\WINGDNG3.TTF'
-font_map['Aparajita Regular'] = R'C:\WINDOWS\FONTS\APARAJ.TTF'
-font_map['Aparajita Italic'] = R'C:\WINDOWS\FONTS\APARAJI.TTF'
-font_map['Aparajita Bold'] = R'C:\WINDOWS\FONTS\APARAJB.TTF'
-font_map['Aparajita Bold Italic'] = R'C:\WINDOWS\FONTS\APARAJBI.TTF'
-font_map['Aparajita Oblique'] = R'C:\WINDOWS\FONTS\APARAJ.TTF'
-font_map['Aparajita Bold Oblique'] = R'C:\WINDOWS\FONTS\APARAJB.TTF'
-font_map['Kokila Regular'] = R'C:\WINDOWS\FONTS\KOKILA.TTF'
-font_map['Kokila Italic'] = R'C:\WINDOWS\FONTS\KOKILAI.TTF'
-font_map['Kokila Bold'] = R'C:\WINDOWS\FONTS\KOKILAB.TTF'
-font_map['Kokila Bold Italic'] = R'C:\WINDOWS\FONTS\KOKILABI.TTF'
-font_map['Kokila Oblique'] = R'C:\WINDOWS\FONTS\KOKILA.TTF'
-font_map['Kokila Bold Oblique'] = R'C:\WINDOWS\FONTS\KOKILAB.TTF'
-font_map['Mangal Regular'] = R'C:\WINDOWS\FONTS\MANGAL.TTF'
-font_map['Mangal Bold'] = R'C:\WINDOWS\FONTS\MANGALB.TTF'
-font_map['Mangal Oblique'] = R'C:\WINDOWS\FONTS\MANGAL.TTF'
-font_map['Mangal Bold Oblique'] = R'C:\WINDOWS\FONTS\MANGALB.TTF'
-font_map['Sanskrit Text Regular'] = R'C:\WINDOWS\FONTS\SANSKR.TTF'
-font_map['Sanskrit Text Oblique'] = R'C:\WINDOWS\FONTS\SANSKR.TTF'
-font_map['Sanskrit Text Bold'] = R'C:\WINDOWS\FONTS\SANSKR.TTF'
-font_map['Sanskrit Text Bold Oblique'] = R'C:\WINDOWS\FONTS\SANSKR.TTF'
-font_map['Utsaah Regular'] = R'C:\WINDOWS\FONTS\UTSAAH.TTF'
-font_map['Utsaah Italic'] = R'C:\WINDOWS\FONTS\UTSAAHI.TTF'
-font_map['Utsaah Bold'] = R'C:\WINDOWS\FONTS\UTSAAHB.TTF'
-font_map['Utsaah Bold Italic'] = R'C:\WINDOWS\FONTS\UTSAAHBI.TTF'
-font_map['Utsaah Oblique'] = R'C:\WINDOWS\FONTS\UTSAAH.TTF'
-font_map['Utsaah Bold Oblique'] = R'C:\WINDOWS\FONTS\UTSAAHB.TTF'
-font_map['Tera Special Regular'] = R'C:\WINDOWS\FONTS\TSPECIAL1.TTF'
-font_map['Tera Special Oblique'] = R'C:\WINDOWS\FONTS\TSPECIAL1.TTF'
-font_map['Tera Special Bold'] = R'C:\WINDOWS\FONTS\TSPECIAL1.TTF'
-font_map['Tera Special Bold Oblique'] = R'C:\WINDOWS\FONTS\TSPECIAL1.TTF'
-font_map['Droid Sans Mono Slashed Regular'] = R'C:\WINDOWS\FONTS\DROIDSANSMONOSLASHED.TTF'
-font_map['Droid Sans Mono Slashed Oblique'] = R'C:\WINDOWS\FONTS\DROIDSANSMONOSLASHED.TTF'
-font_map['Droid Sans Mono Slashed Bold'] = R'C:\WINDOWS\FONTS\DROIDSANSMONOSLASHED.TTF'
-font_map['Droid Sans Mono Slashed Bold Oblique'] = R'C:\WINDOWS\FONTS\DROIDSANSMONOSLASHED.TTF'
-font_map['Nunito Regular'] = R'C:\WINDOWS\FONTS\NUNITO-REGULAR.TTF'
-font_map['Nunito Bold'] = R'C:\WINDOWS\FONTS\NUNITO-BOLD.TTF'
-font_map['Nunito Oblique'] = R'C:\WINDOWS\FONTS\NUNITO-REGULAR.TTF'
-font_map['Nunito Bold Oblique'] = R'C:\WINDOWS\FONTS\NUNITO-BOLD.TTF'
-font_map['Marlett Regular'] = R'C:\WINDOWS\FONTS\MARLETT.TTF'
-font_map['Marlett Oblique'] = R'C:\WINDOWS\FONTS\MARLETT.TTF'
-font_map['Marlett Bold'] = R'C:\WINDOWS\FONTS\MARLETT.TTF'
-font_map['Marlett Bold Oblique'] = R'C:\WINDOWS\FONTS\MARLETT.TTF'
-
-def get_font_file(font):
-    global font_map
-    if font in font_map:
-        return font_map[font]
-    else:
-        print(font, 'font not found')
-        return font_map['Arial Regular']
+"""
+Font lookup for the 'font' column of text rows ("Arial Bold Italic").
+
+The configured font directories are scanned and the family / style names
+are read from the 'name' table of every TrueType / OpenType file. The
+result is kept in a small JSON index in the user cache folder. A
+directory is only listed again when its mtime changes and a file is only
+parsed again when its mtime or size changes. Lookups are lazy: nothing is
+scanned until the first get_font_file() call, and the folder mtimes are
+checked again every RECHECK_SECONDS so fonts installed while Blender runs
+are found.
+"""
+
+import difflib
+import json
+import logging
+import os
+import re
+import struct
+import sys
+import time
+
+log = logging.getLogger(__name__)
+
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc', '.otc')
+FALLBACK_FONT = 'Arial Regular'
+# Blender's own font, what bpy.data.fonts.load() gets when nothing matches
+BUILTIN_FONT = '<builtin>'
+
+# seconds between checks of the font folders for new or removed fonts
+RECHECK_SECONDS = 2.0
+
+extra_font_dirs = []
+index = None
+checked = 0.0
+lookups = {}
+# names already warned about
+missing = set()
+
+def system_font_dirs():
+    home = os.path.expanduser('~')
+    if sys.platform == 'win32':
+        windir = os.environ.get('WINDIR', R'C:\WINDOWS')
+        local = os.environ.get('LOCALAPPDATA', os.path.join(home, 'AppData', 'Local'))
+        return [os.path.join(windir, 'Fonts'), os.path.join(local, 'Microsoft', 'Windows', 'Fonts')]
+    if sys.platform == 'darwin':
+        return ['/System/Library/Fonts', '/Library/Fonts', os.path.join(home, 'Library', 'Fonts')]
+    return ['/usr/share/fonts', '/usr/local/share/fonts', os.path.join(home, '.fonts'),
+            os.path.join(home, '.local', 'share', 'fonts')]
+
+def font_dirs():
+    """
+    Directories to scan: RITEBITE_FONT_DIRS (os.pathsep separated), the
+    folders added with add_font_dir() and the system font folders
+    """
+    configured = [d for d in os.environ.get('RITEBITE_FONT_DIRS', '').split(os.pathsep) if d]
+    return configured + extra_font_dirs + system_font_dirs()
+
+def add_font_dir(folder):
+    """
+    Makes the fonts of folder (e.g. the fonts folder next to the workbook)
+    available, they win over system fonts with the same name
+    """
+    global index
+    folder = os.path.abspath(folder)
+    if folder not in extra_font_dirs:
+        extra_font_dirs.insert(0, folder)
+        index = None
+        lookups.clear()
+
+def index_path():
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'ritebite', 'fonts.json')
+
+# sfnt parsing
+##################################
+
+def font_offsets(data):
+    """
+    Offsets of the fonts in a file, a collection (.ttc) holds several
+    """
+    if data[:4] == b'ttcf':
+        count = struct.unpack_from('>I', data, 8)[0]
+        return list(struct.unpack_from(f'>{count}I', data, 12))
+    return [0]
+
+def read_tables(data, offset=0):
+    """
+    tag -> (offset, length) of the tables of the font at offset
+    """
+    count = struct.unpack_from('>H', data, offset + 4)[0]
+    tables = {}
+    for n in range(count):
+        tag, _, table_offset, length = struct.unpack_from('>4sIII', data, offset + 12 + 16*n)
+        tables[tag.decode('latin-1')] = (table_offset, length)
+    return tables
+
+def read_names(data, offset=0):
+    """
+    (family, style, full name) from the 'name' table, preferring the
+    typographic family / style and English Windows strings
+    """
+    table = read_tables(data, offset).get('name')
+    if table is None:
+        return None
+    base = table[0]
+    _, count, strings = struct.unpack_from('>HHH', data, base)
+    found = {}
+    for n in range(count):
+        platform, encoding, language, name_id, length, string_offset = struct.unpack_from('>6H', data, base + 6 + 12*n)
+        if name_id not in (1, 2, 4, 16, 17):
+            continue
+        raw = data[base + strings + string_offset:base + strings + string_offset + length]
+        if platform == 3 and encoding in (0, 1, 10):
+            rank = 0 if language == 0x409 else 1
+            text = raw.decode('utf-16-be', errors='replace')
+        elif platform == 1 and encoding == 0:
+            rank = 2
+            text = raw.decode('latin-1')
+        else:
+            continue
+        if name_id not in found or rank < found[name_id][0]:
+            found[name_id] = (rank, text)
+    family = (found.get(16) or found.get(1) or (0, None))[1]
+    style = (found.get(17) or found.get(2) or (0, 'Regular'))[1]
+    if family is None:
+        return None
+    full = (found.get(4) or (0, f"{family} {style}"))[1]
+    return family, style, full
+
+def scan_font_file(path):
+    """
+    [[family, style, full name, font number], ...] of a font file
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        faces = []
+        for number, offset in enumerate(font_offsets(data)):
+            names = read_names(data, offset)
+            if names is not None:
+                faces.append([*names, number])
+        return faces
+    except (OSError, struct.error) as e:
+        log.warning(f"Can't read font {path}\n{e}")
+        return []
+
+# index
+##################################
+
+def scan_dir(folder, old, dirs):
+    """
+    Adds folder and its sub folders to dirs, reusing the entries of old for
+    folders whose mtime didn't change and files whose mtime/size didn't
+    """
+    try:
+        mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        return
+    previous = old.get(folder)
+    if previous is not None and previous['mtime'] == mtime:
+        entry = {'mtime': mtime, 'subdirs': previous['subdirs'], 'files': dict(previous['files'])}
+        # a file rewritten in place doesn't touch the folder mtime
+        for name, (file_mtime, size, faces) in list(entry['files'].items()):
+            try:
+                st = os.stat(os.path.join(folder, name))
+            except OSError:
+                # removed since the folder was scanned
+                del entry['files'][name]
+                continue
+            if [st.st_mtime_ns, st.st_size] != [file_mtime, size]:
+                entry['files'][name] = [st.st_mtime_ns, st.st_size, scan_font_file(os.path.join(folder, name))]
+    else:
+        old_files = previous['files'] if previous is not None else {}
+        entry = {'mtime': mtime, 'subdirs': [], 'files': {}}
+        try:
+            names = sorted(os.listdir(folder))
+        except OSError:
+            names = []
+        for name in names:
+            path = os.path.join(folder, name)
+            if os.path.isdir(path):
+                entry['subdirs'].append(name)
+            elif name.lower().endswith(FONT_EXTENSIONS):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    # broken links and files removed while listing
+                    continue
+                cached = old_files.get(name)
+                if cached is not None and cached[:2] == [st.st_mtime_ns, st.st_size]:
+                    entry['files'][name] = cached
+                else:
+                    entry['files'][name] = [st.st_mtime_ns, st.st_size, scan_font_file(path)]
+    dirs[folder] = entry
+    for sub in entry['subdirs']:
+        scan_dir(os.path.join(folder, sub), old, dirs)
+
+def load_index():
+    """
+    Scans the font directories against the saved index and returns
+    {'dirs': {...}, 'names': {normalized name: path}}
+    """
+    path = index_path()
+    try:
+        with open(path, encoding='utf-8') as f:
+            old = json.load(f)
+    except (OSError, ValueError):
+        old = {}
+    dirs = {}
+    for folder in font_dirs():
+        scan_dir(os.path.abspath(folder), old, dirs)
+    if dirs != old:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(dirs, f, separators=(',', ':'))
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            log.warning(f"Could not write font index {path}\n{e}")
+
+    names = {}
+    # earlier directories win, so walk them last
+    for folder in reversed(list(dirs)):
+        for name, (_, _, faces) in dirs[folder]['files'].items():
+            for family, style, full, number in faces:
+                font_file = os.path.join(folder, name)
+                for key in (f"{family} {style}", full, family if style == 'Regular' else None):
+                    if key:
+                        names[normalize(key)] = font_file
+    return {'dirs': dirs, 'names': names}
+
+def normalize(name):
+    """
+    'Arial  Bold-Oblique' -> 'arial bold italic', 'Nunito Regular' -> 'nunito'
+    """
+    words = re.findall(r'[a-z0-9]+', name.lower())
+    words = ['italic' if w == 'oblique' else w for w in words if w not in ('regular', 'normal', 'book', 'roman')]
+    return ' '.join(words)
+
+def index_changed(current):
+    """
+    True when a scanned font folder changed or a configured one appeared
+    since current was built
+    """
+    for folder, entry in current['dirs'].items():
+        try:
+            if os.stat(folder).st_mtime_ns != entry['mtime']:
+                return True
+        except OSError:
+            return True
+    return any(os.path.abspath(d) not in current['dirs'] and os.path.isdir(d) for d in font_dirs())
+
+def current_index():
+    """
+    The font index, scanned again when the font folders changed
+    """
+    global index, checked
+    now = time.monotonic()
+    if index is not None and now - checked >= RECHECK_SECONDS:
+        checked = now
+        if index_changed(index):
+            log.info("The font folders changed, scanning them again")
+            index = None
+            lookups.clear()
+    if index is None:
+        index = load_index()
+        checked = now
+    return index
+
+def find_font(font):
+    """
+    Path of the font file best matching a "Family Style" name, None when
+    nothing is close
+    """
+    names = current_index()['names']
+    if font in lookups:
+        return lookups[font]
+    key = normalize(font)
+    # like the old font map, an oblique (and then bold) face without its
+    # own file falls back to the plain one, the strip fakes the style
+    candidates = [key, key.replace(' italic', ''), key.replace(' italic', '').replace(' bold', '')]
+    path = next((names[k] for k in candidates if k in names), None)
+    if path is None:
+        close = difflib.get_close_matches(key, names.keys(), n=1, cutoff=0.8)
+        if close:
+            path = names[close[0]]
+    lookups[font] = path
+    return path
+
+def get_font_file(font):
+    path = find_font(font)
+    if path is None:
+        # one bad font cell is used by many rows, say it once
+        if font not in missing:
+            missing.add(font)
+            log.warning(f"{font} font not found")
+        path = find_font(FALLBACK_FONT) or BUILTIN_FONT
+    return path
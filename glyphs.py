@@ -0,0 +1,179 @@
+"""
+Text measuring from the glyph metrics of the font files, used to size the
+box behind grouped text rows. The advance of every mapped character and
+the line metrics are read from the 'cmap', 'hmtx', 'hhea' and 'head'
+tables once per font file and kept in the user cache folder next to the
+font index, checked against the file mtime and size. Scaled metrics are
+kept in memory per font and size.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+
+from .fonts import font_offsets, read_tables, index_path, BUILTIN_FONT
+
+log = logging.getLogger(__name__)
+
+METRICS_VERSION = 1
+# rough metrics of Blender's own font, also used when a font file can't be read
+BUILTIN_METRICS = {'units': 1000, 'ascent': 928, 'descent': -236, 'gap': 0, 'default': 600, 'advances': {}}
+
+# font file -> unit metrics, and (font file, size) -> FontMetrics
+unit_metrics = {}
+metrics = {}
+
+def metrics_file(path):
+    digest = hashlib.md5(os.path.abspath(path).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(os.path.dirname(index_path()), 'glyphs', f"{os.path.basename(path)}_{digest}.json")
+
+def read_cmap(data, table):
+    """
+    {codepoint: glyph} from the best unicode subtable of a 'cmap' table
+    """
+    base = table[0]
+    count = struct.unpack_from('>H', data, base + 2)[0]
+    subtables = {}
+    for n in range(count):
+        platform, encoding, offset = struct.unpack_from('>HHI', data, base + 4 + 8*n)
+        subtables[(platform, encoding)] = base + offset
+    # full unicode first, then the BMP ones
+    for key in ((3, 10), (0, 4), (0, 6), (3, 1), (0, 3), (0, 1), (0, 0)):
+        offset = subtables.get(key)
+        if offset is None:
+            continue
+        kind = struct.unpack_from('>H', data, offset)[0]
+        if kind == 12:
+            groups = struct.unpack_from('>I', data, offset + 12)[0]
+            cmap = {}
+            for n in range(groups):
+                start, end, glyph = struct.unpack_from('>III', data, offset + 16 + 12*n)
+                for code in range(start, end + 1):
+                    cmap[code] = glyph + code - start
+            return cmap
+        if kind == 4:
+            segments = struct.unpack_from('>H', data, offset + 6)[0] // 2
+            ends = struct.unpack_from(f'>{segments}H', data, offset + 14)
+            starts = struct.unpack_from(f'>{segments}H', data, offset + 16 + 2*segments)
+            deltas = struct.unpack_from(f'>{segments}h', data, offset + 16 + 4*segments)
+            range_base = offset + 16 + 6*segments
+            ranges = struct.unpack_from(f'>{segments}H', data, range_base)
+            cmap = {}
+            for n in range(segments):
+                for code in range(starts[n], min(ends[n], 0xFFFE) + 1):
+                    if ranges[n] == 0:
+                        glyph = (code + deltas[n]) & 0xFFFF
+                    else:
+                        # idRangeOffset counts from its own slot into glyphIdArray
+                        at = range_base + 2*n + ranges[n] + 2*(code - starts[n])
+                        glyph = struct.unpack_from('>H', data, at)[0]
+                        if glyph:
+                            glyph = (glyph + deltas[n]) & 0xFFFF
+                    if glyph:
+                        cmap[code] = glyph
+            return cmap
+    return {}
+
+def read_metrics(path, number=0):
+    """
+    Unit metrics of face number of a font file: units per em, ascent,
+    descent, line gap, the advance of every mapped character and the
+    default advance
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    offset = font_offsets(data)[number]
+    tables = read_tables(data, offset)
+    units = struct.unpack_from('>H', data, tables['head'][0] + 18)[0]
+    hhea = tables['hhea'][0]
+    ascent, descent, gap = struct.unpack_from('>hhh', data, hhea + 4)
+    long_metrics = struct.unpack_from('>H', data, hhea + 34)[0]
+    widths = struct.unpack_from(f'>{2*long_metrics}H', data, tables['hmtx'][0])[::2]
+    advances = {}
+    for code, glyph in read_cmap(data, tables['cmap']).items():
+        # glyphs past the long metrics share the last advance
+        advances[str(code)] = widths[min(glyph, long_metrics - 1)]
+    space = advances.get(str(ord(' ')), units // 4)
+    return {'units': units, 'ascent': ascent, 'descent': descent, 'gap': gap,
+            'default': advances.get(str(ord('x')), space), 'advances': advances}
+
+def load_metrics(path):
+    """
+    Unit metrics of a font file, read from the disk cache when the file
+    didn't change since it was measured
+    """
+    if path == BUILTIN_FONT:
+        return BUILTIN_METRICS
+    if path in unit_metrics:
+        return unit_metrics[path]
+    try:
+        st = os.stat(path)
+    except OSError:
+        log.warning(f"Can't measure text with {path}, it is gone")
+        return BUILTIN_METRICS
+    stamp = [METRICS_VERSION, st.st_mtime_ns, st.st_size]
+    cache = metrics_file(path)
+    try:
+        with open(cache, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['stamp'] == stamp:
+            unit_metrics[path] = cached['metrics']
+            return unit_metrics[path]
+    except (OSError, ValueError, KeyError):
+        pass
+    try:
+        found = read_metrics(path)
+    except (OSError, KeyError, IndexError, struct.error) as e:
+        log.warning(f"Can't read the glyph metrics of {path}\n{e}")
+        return BUILTIN_METRICS
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        with open(cache + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'stamp': stamp, 'metrics': found}, f, separators=(',', ':'))
+        os.replace(cache + '.tmp', cache)
+    except OSError as e:
+        log.warning(f"Could not write glyph metrics {cache}\n{e}")
+    unit_metrics[path] = found
+    return found
+
+class FontMetrics:
+    """
+    Metrics of a font file at a font size, in pixels
+    """
+    __slots__ = ('scale', 'advances', 'default', 'ascent', 'descent', 'line_height')
+
+    def __init__(self, units, size):
+        self.scale = size / units['units']
+        self.advances = units['advances']
+        self.default = units['default']
+        self.ascent = units['ascent'] * self.scale
+        self.descent = -units['descent'] * self.scale
+        self.line_height = self.ascent + self.descent + units['gap'] * self.scale
+
+    def width(self, line):
+        advances = self.advances
+        return sum(advances.get(str(ord(ch)), self.default) for ch in line) * self.scale
+
+    def measure(self, text):
+        """
+        (width, height) of text, lines split on newlines
+        """
+        lines = text.split('\n')
+        width = max(self.width(line) for line in lines)
+        height = self.ascent + self.descent + (len(lines) - 1) * self.line_height
+        return width, height
+
+def get_metrics(path, size):
+    key = (path, size)
+    found = metrics.get(key)
+    if found is None:
+        found = metrics[key] = FontMetrics(load_metrics(path), size)
+    return found
+
+def measure_text(path, size, text):
+    """
+    (width, height) in pixels of text set in the font file at path
+    """
+    return get_metrics(path, size).measure(text)
@@ -0,0 +1,181 @@
+"""
+Interval index over the strips of a Timeline, one interval tree per
+channel. It answers "what is on screen at frame N" and "does this range
+collide with anything" quickly, and allocate_channels() uses the same
+frame ranges to give every overlay row a free channel in one pass before
+any strip is built, instead of relying on the sequencer to shuffle
+overlapping strips around.
+"""
+
+import numpy as np
+
+# the sequencer has channels 1..128
+MAX_CHANNEL = 128
+OVERLAYS = ('sound', 'color', 'text', 'image')
+
+class IntervalTree:
+    """
+    Static centered interval tree over inclusive [start, end] ranges, each
+    carrying a value
+    """
+    __slots__ = ('center', 'left', 'right', 'by_start', 'by_end')
+
+    def __init__(self, intervals):
+        intervals = list(intervals)
+        self.left = self.right = None
+        self.by_start = self.by_end = []
+        self.center = 0
+        if not intervals:
+            return
+        points = sorted(p for start, end, _ in intervals for p in (start, end))
+        self.center = points[len(points)//2]
+        here, left, right = [], [], []
+        for interval in intervals:
+            if interval[1] < self.center:
+                left.append(interval)
+            elif interval[0] > self.center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        self.by_start = sorted(here, key=lambda i: i[0])
+        self.by_end = sorted(here, key=lambda i: -i[1])
+        if left:
+            self.left = IntervalTree(left)
+        if right:
+            self.right = IntervalTree(right)
+
+    def at(self, frame):
+        """
+        Values of every interval containing frame
+        """
+        node = self
+        found = []
+        while node is not None:
+            if frame < node.center:
+                for start, end, value in node.by_start:
+                    if start > frame:
+                        break
+                    found.append(value)
+                node = node.left
+            elif frame > node.center:
+                for start, end, value in node.by_end:
+                    if end < frame:
+                        break
+                    found.append(value)
+                node = node.right
+            else:
+                found += [value for _, _, value in node.by_start]
+                break
+        return found
+
+    def overlapping(self, start, end):
+        """
+        Values of every interval sharing a frame with [start, end]
+        """
+        found = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            for s, e, value in node.by_start:
+                if s > end:
+                    break
+                if e >= start:
+                    found.append(value)
+            if start < node.center:
+                stack.append(node.left)
+            if end > node.center:
+                stack.append(node.right)
+        return found
+
+def overlay_rows(timeline):
+    """
+    (kind, row, start, end, channel) of every visible overlay row
+    """
+    rows = []
+    for kind, section in timeline.sections().items():
+        if kind not in OVERLAYS or not len(section):
+            continue
+        shown = np.flatnonzero(section['show'].astype(bool))
+        for row, start, end, channel in zip(shown.tolist(), section['start'][shown].tolist(),
+                                             section['end'][shown].tolist(), section['channel'][shown].tolist()):
+            rows.append((kind, row, start, end, channel))
+    return rows
+
+class TimelineIndex:
+    """
+    Per channel interval trees of the visible overlay rows of a Timeline
+    """
+    def __init__(self, timeline):
+        channels = {}
+        for kind, row, start, end, channel in overlay_rows(timeline):
+            channels.setdefault(channel, []).append((start, end, (kind, row)))
+        self.trees = {channel: IntervalTree(intervals) for channel, intervals in channels.items()}
+
+    def at(self, frame):
+        """
+        [(channel, kind, row), ...] visible at frame, bottom channel first
+        """
+        return [(channel, kind, row) for channel in sorted(self.trees) for kind, row in self.trees[channel].at(frame)]
+
+    def is_free(self, channel, start, end, ignore=None):
+        """
+        True when nothing on channel shares a frame with [start, end], the
+        (kind, row) ignore aside
+        """
+        tree = self.trees.get(channel)
+        return tree is None or all(value == ignore for value in tree.overlapping(start, end))
+
+    def conflicts(self):
+        """
+        [(channel, (kind, row), (kind, row)), ...] for rows that share a
+        channel and a frame
+        """
+        pairs = set()
+        for channel, tree in self.trees.items():
+            for start, end, value in tree_intervals(tree):
+                for other in tree.overlapping(start, end):
+                    if other != value:
+                        pairs.add((channel,) + tuple(sorted((value, other))))
+        return sorted(pairs)
+
+def tree_intervals(tree):
+    if tree is None:
+        return []
+    return tree.by_start + tree_intervals(tree.left) + tree_intervals(tree.right)
+
+def allocate_channels(timeline):
+    """
+    Returns a copy of timeline where no two visible overlay rows share a
+    channel and a frame, plus [(kind, row, old channel, new channel)] for
+    the rows that had to move. Rows keep their sheet channel when it is
+    free and are otherwise moved up to the next free one, so they stay
+    above what they were meant to cover. The channel the clips' meta strip
+    sits on is kept free.
+    """
+    busy_until = {}
+    clips = timeline.clips.visible()
+    if len(clips):
+        busy_until[int(clips['channel'].min())] = float('inf')
+
+    rows = overlay_rows(timeline)
+    rows.sort(key=lambda r: (r[2], r[4]))
+    channels = {kind: section['channel'].copy() for kind, section in timeline.sections().items() if kind in OVERLAYS}
+    moves = []
+    # rows come in start order, so a channel is free for a row when
+    # everything already placed on it ended before the row starts
+    for kind, row, start, end, channel in rows:
+        chosen = channel
+        while busy_until.get(chosen, float('-inf')) >= start:
+            chosen += 1
+        if chosen > MAX_CHANNEL:
+            raise ValueError(f"{kind} row {row+1} (frames {start}-{end}) has no free channel left")
+        busy_until[chosen] = end
+        if chosen != channel:
+            channels[kind][row] = chosen
+            moves.append((kind, row, channel, chosen))
+
+    sections = {kind: section.replace(channel=channels[kind]) if kind in channels else section
+                for kind, section in timeline.sections().items()}
+    return type(timeline)(*sections.values()), moves
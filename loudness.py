@@ -0,0 +1,203 @@
+"""
+Integrated loudness of the sound a sheet uses, EBU R128 style: K-weighted
+400ms blocks, gated at -70 LUFS and 10 LU under the ungated level. A
+'sound' cell of 'auto' gets the gain that brings its clip or sound row to
+TARGET_LUFS.
+
+Measurements are kept per file and trimmed range in .ritebite/loudness.json,
+checked against the file mtime and size like the media index, and new
+ones run in a process pool since the analysis is NumPy bound (on threads
+inside Blender).
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+
+import numpy as np
+
+from .cache import CACHE_FOLDER
+from .probe import file_stamp
+from .proxies import FFMPEG
+from .timeline import Timeline
+from .workers import run_jobs
+
+log = logging.getLogger(__name__)
+
+TARGET_LUFS = float(os.environ.get('RITEBITE_TARGET_LUFS', -16.0))
+# an auto gain never boosts more than this, quiet room tone stays quiet
+MAX_GAIN = 4.0
+SAMPLE_RATE = 48000
+# 100ms sub-blocks, four of them make a 400ms gating block
+SUB_BLOCK = SAMPLE_RATE // 10
+ABSOLUTE_GATE = -70.0
+RELATIVE_GATE = -10.0
+# the two BS.1770 K-weighting biquads at 48kHz, (b, a)
+K_FILTERS = (([1.53512485958697, -2.69169618940638, 1.19839281085285], [1.0, -1.69065929318241, 0.73248077421585]),
+             ([1.0, -2.0, 1.0], [1.0, -1.99004745483398, 0.99007225036621]))
+
+def loudness_index_path(excel):
+    return os.path.join(os.path.dirname(excel), CACHE_FOLDER, 'loudness.json')
+
+def k_weights(count):
+    """
+    Power gain of the K-weighting at the rfft bins of count samples
+    """
+    z = np.exp(-1j * np.pi * np.arange(count // 2 + 1) / (count / 2))
+    power = np.ones(len(z))
+    for b, a in K_FILTERS:
+        # coefficients are in powers of z^-1
+        power *= np.abs(np.polyval(b[::-1], z) / np.polyval(a[::-1], z)) ** 2
+    return power
+
+def integrated_loudness(samples):
+    """
+    LUFS of float samples shaped (samples, channels) at SAMPLE_RATE, None
+    when everything is gated away (silence, or under 400ms of sound). The
+    K-weighting is applied to each 100ms sub-block in the frequency domain.
+    """
+    count = len(samples) // SUB_BLOCK
+    if count < 4:
+        return None
+    blocks = samples[:count * SUB_BLOCK].reshape(count, SUB_BLOCK, -1)
+    spectrum = np.abs(np.fft.rfft(blocks, axis=1)) ** 2
+    # Parseval: mean square of a block from its spectrum, one sided bins count twice
+    spectrum[:, 1:-1] *= 2
+    power = np.einsum('bfc,f->bc', spectrum, k_weights(SUB_BLOCK)) / SUB_BLOCK ** 2
+    # 400ms blocks overlapping by 75%, summed over channels (all weighted 1.0)
+    window = np.convolve(power.sum(axis=1), np.ones(4) / 4, mode='valid')
+    with np.errstate(divide='ignore'):
+        levels = -0.691 + 10 * np.log10(window)
+    gated = window[levels > ABSOLUTE_GATE]
+    if not len(gated):
+        return None
+    relative = -0.691 + 10 * np.log10(gated.mean()) + RELATIVE_GATE
+    gated = window[levels > max(ABSOLUTE_GATE, relative)]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+def measure(path, offset, duration, channels):
+    """
+    LUFS of duration seconds of path from offset. Runs in a worker process.
+    """
+    cmd = [FFMPEG, '-v', 'error', '-ss', f"{offset:.3f}", '-t', f"{duration:.3f}", '-i', path,
+           '-vn', '-map', '0:a:0', '-f', 'f32le', '-ac', str(channels), '-ar', str(SAMPLE_RATE), '-']
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return integrated_loudness(np.frombuffer(result.stdout, dtype=np.float32).reshape(-1, channels))
+
+def range_key(offset, duration):
+    return f"{offset:.3f}:{duration:.3f}"
+
+def gain_for(lufs, target=TARGET_LUFS):
+    """
+    Linear gain taking lufs to target, 1.0 for silence
+    """
+    if lufs is None:
+        return 1.0
+    return min(10 ** ((target - lufs) / 20), MAX_GAIN)
+
+class LoudnessIndex:
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def ranges(self, path):
+        """
+        {range key: lufs} measured for a file, empty when it changed since
+        """
+        entry = self.entries.get(os.path.abspath(path))
+        try:
+            if entry is None or entry['stamp'] != file_stamp(path):
+                return {}
+        except OSError:
+            return {}
+        return entry['ranges']
+
+    def get(self, path, offset, duration):
+        """
+        (measured, lufs) of a range of a file
+        """
+        ranges = self.ranges(path)
+        key = range_key(offset, duration)
+        return key in ranges, ranges.get(key)
+
+    def measure(self, requests, workers=None):
+        """
+        Measures every (path, offset, duration, channels) of requests not
+        in the index yet, one worker per file range
+        """
+        missing = sorted({r for r in requests if os.path.exists(r[0]) and not self.get(*r[:3])[0]})
+        if not missing:
+            return
+        if shutil.which(FFMPEG) is None:
+            log.warning(f"{FFMPEG} not found, can't measure the loudness of {len(missing)} sounds")
+            return
+
+        for (path, offset, duration, channels), lufs, error in run_jobs(measure, missing, subprocess.CalledProcessError, workers):
+            if error is not None:
+                log.warning(f"Failed to measure {path}\n{error.stderr}")
+                continue
+            path = os.path.abspath(path)
+            entry = self.entries.get(path)
+            stamp = file_stamp(path)
+            if entry is None or entry['stamp'] != stamp:
+                entry = self.entries[path] = {'stamp': stamp, 'ranges': {}}
+            entry['ranges'][range_key(offset, duration)] = lufs
+        self.save()
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log.warning(f"Could not write loudness index {self.path}\n{e}")
+
+def channel_count(info):
+    if info is None or not info['audio']:
+        return 2
+    return min(info['audio'][0]['channels'] or 2, 2)
+
+def auto_gain(timeline, video_folder_path, media, index, fps, target=TARGET_LUFS):
+    """
+    Copy of timeline with every 'auto' (NaN) sound cell of its clips and
+    sound rows replaced by the gain that takes the trimmed range to target.
+    Clip ranges and sound rows are frames of the scene, which runs at fps.
+    """
+    clips, audios = timeline.clips, timeline.audios
+    clip_auto = np.isnan(np.asarray(clips['sound'], dtype=np.float64))
+    audio_auto = np.isnan(np.asarray(audios['sound'], dtype=np.float64))
+    if not clip_auto.any() and not audio_auto.any():
+        return timeline
+
+    requests = []
+    for n in np.flatnonzero(clip_auto).tolist():
+        path = os.path.join(video_folder_path, clips['file'][n])
+        info = media.get(path) if media is not None else None
+        start, end = int(clips['start'][n]), int(clips['end'][n])
+        requests.append((n, 'clip', (path, (start - 1) / fps, (end - start + 1) / fps, channel_count(info))))
+    for n in np.flatnonzero(audio_auto).tolist():
+        path = audios['file'][n]
+        info = media.get(path) if media is not None else None
+        start, end = int(audios['start'][n]), int(audios['end'][n])
+        requests.append((n, 'sound', (path, 0.0, (end - start + 1) / fps, channel_count(info))))
+    index.measure([request for _, _, request in requests])
+
+    gains = {'clip': np.asarray(clips['sound'], dtype=np.float64).copy(),
+             'sound': np.asarray(audios['sound'], dtype=np.float64).copy()}
+    for n, kind, request in requests:
+        measured, lufs = index.get(*request[:3])
+        if not measured:
+            log.warning(f"No loudness for {request[0]}, its auto sound stays at 1")
+        gains[kind][n] = gain_for(lufs, target)
+        log.debug(f"{kind} row {n+1}: {lufs} LUFS, gain {gains[kind][n]:.3f}")
+    return Timeline(clips.replace(sound=gains['clip']), timeline.texts, timeline.images,
+                    timeline.colors, audios.replace(sound=gains['sound']))
@@ -0,0 +1,212 @@
+"""
+Peak files of the sound a sheet uses: the min/max envelope of every file
+at PEAK_RATE bins a second, written once as .npy files and memory-mapped
+when read, so drawing a waveform or lining two sources up never decodes
+the source again. A minute of sound is 24KB of peaks.
+
+estimate_offset() cross-correlates two envelopes to find where one source
+sits in another, e.g. where a 'sound' row's music starts under a clip
+that recorded it:
+
+    python -m RiteBite.peaks Editing.xlsx Nimona --align DSC_0108.MOV music.mp3
+"""
+
+import argparse
+import glob
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .cache import CACHE_FOLDER, cached_parse
+from .plan import read_sheet, DEFAULT_FPS
+from .probe import MediaIndex, media_index_path, file_stamp
+from .proxies import FFMPEG
+from .workers import read_chunks
+
+# run as python -m RiteBite.peaks this module is __main__, keep it under the
+# add-on's logger so it gets its format and RITEBITE_LOG_LEVEL
+log = logging.getLogger(f"{__package__}.peaks" if __name__ == "__main__" else __name__)
+
+SAMPLE_RATE = 48000
+PEAK_RATE = 100
+BIN = SAMPLE_RATE // PEAK_RATE
+# seconds of sound decoded and reduced at a time
+CHUNK_SECONDS = 60
+
+def peaks_folder(excel):
+    return os.path.join(os.path.dirname(excel), CACHE_FOLDER, 'peaks')
+
+def peak_prefix(folder, path):
+    digest = hashlib.md5(os.path.abspath(path).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(folder, f"{os.path.basename(path)}_{digest}")
+
+def peak_file(folder, path):
+    # the stamp is part of the name, a changed source simply has no peaks yet
+    mtime, size = file_stamp(path)
+    return f"{peak_prefix(folder, path)}_{mtime}_{size}.npy"
+
+def decode_chunks(path):
+    """
+    The sound of path mixed to mono float32 at SAMPLE_RATE, CHUNK_SECONDS
+    at a time
+    """
+    cmd = [FFMPEG, '-v', 'error', '-i', path, '-vn', '-map', '0:a:0',
+           '-f', 'f32le', '-ac', '1', '-ar', str(SAMPLE_RATE), '-']
+    for data in read_chunks(cmd, 4 * SAMPLE_RATE * CHUNK_SECONDS):
+        yield np.frombuffer(data[:len(data) // 4 * 4], dtype=np.float32)
+
+def reduce_peaks(samples):
+    """
+    (bins, 2) int16 min and max of every BIN samples, the last bin padded
+    with silence
+    """
+    pad = -len(samples) % BIN
+    if pad:
+        samples = np.concatenate([samples, np.zeros(pad, dtype=samples.dtype)])
+    bins = samples.reshape(-1, BIN)
+    peaks = np.stack([bins.min(axis=1), bins.max(axis=1)], axis=1)
+    return (np.clip(peaks, -1.0, 1.0) * 32767).astype(np.int16)
+
+def build_peak_file(folder, path):
+    """
+    Decodes path once and writes its peak file, returns the file name
+    """
+    chunks = [reduce_peaks(samples) for samples in decode_chunks(path)]
+    peaks = np.concatenate(chunks) if chunks else np.zeros((0, 2), dtype=np.int16)
+    target = peak_file(folder, path)
+    os.makedirs(folder, exist_ok=True)
+    tmp = target + '.tmp.npy'
+    out = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.int16, shape=peaks.shape)
+    out[:] = peaks
+    out.flush()
+    del out
+    os.replace(tmp, target)
+    # peaks of older versions of the file
+    for old in glob.glob(glob.escape(peak_prefix(folder, path)) + '_*.npy'):
+        if old != target:
+            os.remove(old)
+    return target
+
+def build_peaks(folder, paths, workers=None):
+    """
+    Writes the peak files of paths that have none yet, each one an ffmpeg
+    decode in a pool of workers
+    """
+    missing = sorted({os.path.abspath(p) for p in paths if os.path.exists(p) and not os.path.exists(peak_file(folder, p))})
+    if not missing:
+        return
+    if shutil.which(FFMPEG) is None:
+        log.warning(f"{FFMPEG} not found, can't build peaks of {len(missing)} files")
+        return
+
+    def build_one(path):
+        try:
+            build_peak_file(folder, path)
+            log.info(f"Built peaks of {path}")
+        except (OSError, subprocess.CalledProcessError) as e:
+            # files without sound end up here too
+            log.warning(f"Failed to build peaks of {path}\n{getattr(e, 'stderr', None) or e}")
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        list(pool.map(build_one, missing))
+
+def load_peaks(folder, path):
+    """
+    Memory-mapped (bins, 2) int16 min/max peaks of path, None when it has
+    no current peak file
+    """
+    try:
+        return np.load(peak_file(folder, path), mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+
+def envelope(peaks, start=0.0, end=None):
+    """
+    Amplitude 0..1 of every bin of peaks between start and end seconds
+    """
+    first = int(start * PEAK_RATE)
+    last = None if end is None else int(end * PEAK_RATE)
+    window = np.asarray(peaks[first:last], dtype=np.float32)
+    return (window[:, 1] - window[:, 0]) / 65534
+
+def estimate_offset(reference, other):
+    """
+    (seconds, score) placing envelope other inside envelope reference:
+    other lines up best when it starts seconds into reference (negative
+    when it starts before). score is the normalized correlation there,
+    close to 1 for a confident match.
+    """
+    if len(reference) < 2 or len(other) < 2:
+        return 0.0, 0.0
+    a = reference - reference.mean()
+    b = other - other.mean()
+    size = 1 << int(np.ceil(np.log2(len(a) + len(b))))
+    correlation = np.fft.irfft(np.fft.rfft(a, size) * np.conj(np.fft.rfft(b, size)), size)
+    # lags 0..len(a)-1, then the negative ones -len(b)+1..-1
+    lags = np.concatenate([np.arange(len(a)), np.arange(-len(b) + 1, 0)])
+    correlation = np.concatenate([correlation[:len(a)], correlation[size - len(b) + 1:]])
+    best = int(np.argmax(correlation))
+    norm = np.sqrt((a * a).sum() * (b * b).sum())
+    score = float(correlation[best] / norm) if norm else 0.0
+    return float(lags[best]) / PEAK_RATE, score
+
+def align(folder, reference_path, path, workers=None):
+    """
+    estimate_offset() of two files, building their peaks when needed.
+    None when either has no sound.
+    """
+    build_peaks(folder, [reference_path, path], workers)
+    reference = load_peaks(folder, reference_path)
+    other = load_peaks(folder, path)
+    if reference is None or other is None:
+        return None
+    return estimate_offset(envelope(reference), envelope(other))
+
+def sheet_files(excel, sheet):
+    """
+    Every clip and sound file a sheet refers to
+    """
+    video_folder_path = os.path.dirname(excel) + os.sep + sheet
+    timeline = cached_parse(excel, sheet, 'final', read_sheet)
+    clips = [os.path.join(video_folder_path, f) for f in timeline.clips['file']]
+    return sorted(set(clips + list(timeline.audios['file'])))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m RiteBite.peaks',
+                                     description='Build the peak files of a sheet and line sources up')
+    parser.add_argument('workbook')
+    parser.add_argument('sheet')
+    parser.add_argument('--align', nargs=2, metavar=('REFERENCE', 'OTHER'),
+                        help='files in the sheet folder, prints where OTHER starts in REFERENCE')
+    parser.add_argument('--workers', type=int, help='files decoded at the same time')
+    args = parser.parse_args(argv)
+
+    excel = os.path.abspath(args.workbook)
+    folder = peaks_folder(excel)
+    video_folder_path = os.path.dirname(excel) + os.sep + args.sheet
+    if args.align:
+        reference, other = (os.path.join(video_folder_path, f) for f in args.align)
+        result = align(folder, reference, other, args.workers)
+        if result is None:
+            log.error("Both files need sound to be aligned")
+            return 1
+        seconds, score = result
+        # frames of the reference clip, the rows that place it count those
+        media = MediaIndex(media_index_path(excel))
+        media.probe([reference])
+        info = media.get(reference)
+        fps = info['fps'] if info is not None and info['fps'] else DEFAULT_FPS
+        print(f"{args.align[1]} starts {seconds:+.2f}s ({seconds * fps:+.0f} frames at {fps:g}fps) "
+              f"into {args.align[0]}, score {score:.2f}")
+        return 0
+    build_peaks(folder, sheet_files(excel, args.sheet), args.workers)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
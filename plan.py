@@ -0,0 +1,391 @@
+"""
+Offline compiler from a sheet to a timeline plan. A plan is plain JSON:
+every strip final() builds, with its channel, frame range, trim, fade,
+resolved font file, proxy and decoded colors already worked out, keyed by
+the row identity the strips are tagged with. Nothing here imports bpy, so
+plans can be compiled outside Blender, in parallel, cached and diffed:
+
+    python -m RiteBite.plan Editing.xlsx Nimona -o nimona.json
+
+start_end.apply_plan() turns a plan into strips in one pass.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+
+import numpy as np
+
+from .cache import cached_parse
+from .fonts import get_font_file, add_font_dir
+from .glyphs import measure_text
+from .intervals import allocate_channels, TimelineIndex, MAX_CHANNEL
+from .loudness import LoudnessIndex, loudness_index_path, auto_gain
+from .profiling import stage
+from .probe import MediaIndex, media_index_path
+from .proxies import ProxyStore, proxy_store_path
+from .sheets import read_rows
+from .timeline import (Timeline, Section, Text, Image, Color, Clip, Audio, to_pixels_x, to_pixels_y,
+    FRAME_WIDTH, FRAME_HEIGHT)
+from .sections import (to_table, split_sections, read_columns,
+    CLIP_COLUMNS, TEXT_COLUMNS, IMAGE_COLUMNS, COLOR_COLUMNS, SOUND_COLUMNS)
+
+# run as python -m RiteBite.plan this module is __main__, keep it under the
+# add-on's logger so it gets its format and RITEBITE_LOG_LEVEL
+log = logging.getLogger(f"{__package__}.plan" if __name__ == "__main__" else __name__)
+
+PLAN_VERSION = 2
+# frames a fade lasts when a clip couldn't be probed, the old fades_add default
+DEFAULT_FPS = 50
+# space around grouped text inside its box, in font sizes
+BOX_PADDING = 0.3
+
+# sheet parsing
+##################################
+
+def getClips(table, first, stop):
+    return Section(Clip, read_columns(table, 'clip', first, stop, CLIP_COLUMNS))
+
+def getTexts(table, first, stop):
+    c = read_columns(table, 'text', first, stop, TEXT_COLUMNS)
+    c['group'] = [';' in text for text in c['text']]
+    c['text'] = [text.replace(';', '\n') for text in c['text']]
+    c['y'] = 1.0 - np.asarray(c['y'])
+    return Section(Text, c)
+
+def getImages(table, first, stop, video_path):
+    c = read_columns(table, 'image', first, stop, IMAGE_COLUMNS)
+    c['file'] = [video_path + os.sep + f for f in c['file']]
+    c['x'] = to_pixels_x(np.asarray(c['x']))
+    c['y'] = to_pixels_y(np.asarray(c['y']))
+    return Section(Image, c)
+
+def getAudios(table, first, stop, video_path):
+    c = read_columns(table, 'sound', first, stop, SOUND_COLUMNS)
+    c['file'] = [video_path + os.sep + f for f in c['file']]
+    return Section(Audio, c)
+
+def getColors(table, first, stop):
+    c = read_columns(table, 'color', first, stop, COLOR_COLUMNS)
+    c['x'] = to_pixels_x(np.asarray(c['x']))
+    c['y'] = to_pixels_y(np.asarray(c['y']))
+    return Section(Color, c)
+
+def read_sheet(excel, sheet):
+    """
+    Parses a sheet into a Timeline of its clip, text, image, color and
+    sound rows
+    """
+    video_path = os.path.dirname(excel) + os.sep + sheet
+    timeline = Timeline()
+    with stage('sheet read'):
+        table = to_table(read_rows(excel, sheet))
+    with stage('parse'):
+        for kind, first, stop in split_sections(table):
+            if kind == 'clip':
+                timeline.add(kind, getClips(table, first, stop))
+            elif kind == 'text':
+                timeline.add(kind, getTexts(table, first, stop))
+            elif kind == 'image':
+                timeline.add(kind, getImages(table, first, stop, video_path))
+            elif kind == 'color':
+                timeline.add(kind, getColors(table, first, stop))
+            elif kind == 'sound':
+                timeline.add(kind, getAudios(table, first, stop, video_path))
+    return timeline
+
+# strip entries
+##################################
+
+def hex_color(value, channels):
+    """
+    'ff8000ff' -> [r, g, b, a] in 0..1, channels picks rgb or rgba
+    """
+    return [float(int(value[i:i+2], 16))/256 for i in range(0, 2*channels, 2)]
+
+def entry_hash(entry):
+    """
+    Digest of everything a strip is built from, used to spot edited rows
+    """
+    fields = json.dumps(entry, sort_keys=True)
+    return hashlib.md5(fields.encode('utf-8')).hexdigest()
+
+def clip_range(clip, info):
+    """
+    Source frame range of a clip, clamped to the length ffprobe reported
+    """
+    start = int(clip.start)
+    end   = int(clip.end)
+    if info is not None and info['frames'] and end > info['frames']:
+        log.warning(f"{clip.file} has {info['frames']} frames, clip end {end} is past it")
+        end = info['frames']
+    return start, end, end-start+1
+
+def footage_fps(clips, video_folder_path, media=None):
+    """
+    Frame rate of the first visible clip that was probed, the scene is set
+    to it the way movie_strip_add(use_framerate=True) did. None when no
+    clip was probed.
+    """
+    if media is None:
+        return None
+    for clip in clips:
+        if clip.show != True:
+            continue
+        info = media.get(os.path.join(video_folder_path, clip.file))
+        if info is not None and info['fps']:
+            return info['fps']
+    return None
+
+def clip_entries(clips, video_folder_path, media=None, proxies=None, fps=None):
+    """
+    Movie and sound entries of the visible clips chained back to back, a
+    clip with a transition starts a fade length early over the previous
+    one. Trims and fades are in frames of the scene, which runs at fps.
+    Returns the entries and the frame the last clip ends on.
+    """
+    fade_length = int(round(fps or DEFAULT_FPS))
+    position = 0
+    entries = []
+    for clip in clips:
+        if clip.show != True:
+            continue
+        path = os.path.join(video_folder_path, clip.file)
+        info = media.get(path) if media is not None else None
+        start, end, count = clip_range(clip, info)
+        fade = fade_length if clip.effect != 'NO' else 0
+        offset = start-1
+        frame_start = position - offset - fade
+        trim = {'frame_offset_start': offset, 'frame_final_duration': count, 'frame_start': frame_start}
+        # the sound goes on the clip channel and the picture right above it,
+        # the same layout movie_strip_add uses
+        entries.append({'type': 'MOVIE', 'name': clip.file, 'filepath': path, 'channel': clip.channel+1,
+                        'frame_start': position, 'props': trim, 'fade': fade,
+                        'proxy': proxies.get(path) if proxies is not None else None})
+        if info is None or info['audio']:
+            entries.append({'type': 'SOUND', 'name': clip.file, 'filepath': path, 'channel': clip.channel,
+                            'frame_start': position, 'props': {'volume': float(clip.sound), **trim}, 'fade': fade,
+                            # without a probe we only find out when the strip is made
+                            'optional': info is None})
+        position = frame_start + offset + count
+    return entries, position
+
+def sound_entry(audio):
+    return {'type': 'SOUND', 'name': os.path.basename(audio.file), 'filepath': audio.file,
+            'channel': audio.channel, 'frame_start': audio.start, 'end': audio.end+1,
+            'props': {'frame_final_duration': audio.end-audio.start+1, 'volume': audio.sound}}
+
+def color_entry(color):
+    return {'type': 'COLOR', 'name': 'color', 'channel': color.channel,
+            'frame_start': color.start, 'frame_end': color.end, 'end': color.end,
+            'props': {'channel': color.channel, 'frame_start': color.start, 'frame_final_end': color.end,
+                      'transform.scale_x': color.scale_x, 'transform.scale_y': color.scale_y,
+                      'transform.offset_x': color.x, 'transform.offset_y': color.y,
+                      'color': hex_color(color.color, 3)}}
+
+def text_entry(text):
+    return {'type': 'TEXT', 'name': 'text', 'channel': text.channel,
+            'frame_start': text.start, 'frame_end': text.end, 'end': text.end+1,
+            'font': get_font_file(text.font),
+            'props': {'channel': text.channel, 'frame_start': text.start,
+                      'frame_final_duration': text.end-text.start+1,
+                      'text': text.text, 'font_size': text.size, 'location': [text.x, text.y],
+                      # a grouped text gets one box around all its lines instead
+                      'use_shadow': text.shadow, 'use_box': text.box and not text.group,
+                      'box_color': hex_color(text.box_color, 4), 'color': hex_color(text.color, 4),
+                      'use_bold': text.bold, 'use_italic': text.italic}}
+
+def box_entry(text, channel):
+    """
+    Color strip behind a grouped text, sized from the glyph metrics of its
+    font. Text strips keep Blender's centred, bottom aligned layout, so the
+    box is centred on x and rises from y. The alpha of the box color
+    becomes the strip's blend_alpha, color strips have no alpha of their own.
+    """
+    width, height = measure_text(get_font_file(text.font), text.size, text.text)
+    pad = BOX_PADDING * text.size
+    width, height = width + 2*pad, height + 2*pad
+    # the text y is measured from the bottom, the box is placed by its centre
+    y = 1.0 - text.y - (height/2 - pad)/FRAME_HEIGHT
+    entry = color_entry(Color(text.box_color, text.start, text.end+1, float(to_pixels_x(text.x)), float(to_pixels_y(y)),
+                              width/FRAME_WIDTH, height/FRAME_HEIGHT, channel, True))
+    entry['props']['blend_alpha'] = hex_color(text.box_color, 4)[3]
+    return entry
+
+def box_channel(index, placed, text, row, keep):
+    """
+    Channel of the box of grouped text row, directly under the text. When
+    that channel is taken the text is moved up (text.channel changes) to
+    the first channel that is free with a free one under it. placed holds
+    the texts and boxes placed so far and keep the channel of the clips'
+    meta strip. None when there is no room.
+    """
+    def free(channel):
+        if channel < 1 or channel == keep or not index.is_free(channel, text.start, text.end, ('text', row)):
+            return False
+        return not any(start <= text.end and end >= text.start for start, end in placed.get(channel, []))
+
+    for channel in range(text.channel, MAX_CHANNEL+1):
+        if free(channel) and free(channel-1):
+            text.channel = channel
+            placed.setdefault(channel, []).append((text.start, text.end))
+            placed.setdefault(channel-1, []).append((text.start, text.end))
+            return channel-1
+    return None
+
+def image_entry(image):
+    return {'type': 'IMAGE', 'name': os.path.basename(image.file), 'filepath': image.file,
+            'channel': image.channel, 'frame_start': image.start, 'end': image.end+1,
+            'props': {'frame_final_duration': image.end-image.start+1,
+                      'transform.offset_x': image.x, 'transform.offset_y': image.y,
+                      'transform.scale_x': image.scale_x, 'transform.scale_y': image.scale_y}}
+
+# the column an overlay row is told apart by, next to its start frame
+ROW_LABELS = {'sound': 'file', 'color': 'color', 'text': 'text', 'image': 'file'}
+
+def row_key(kind, row, seen):
+    """
+    Identity of an overlay row from what it shows and where it starts, so
+    a strip keeps its key when rows are inserted or removed above it. Rows
+    that share both are numbered in sheet order, seen counts them.
+    """
+    label = f"{kind}|{getattr(row, ROW_LABELS[kind])}|{row.start}"
+    count = seen[label] = seen.get(label, 0) + 1
+    digest = hashlib.md5(f"{label}|{count}".encode('utf-8')).hexdigest()[:12]
+    return f"{kind}:{digest}"
+
+# overlays in the order final() builds them
+ENTRIES = (('sound', sound_entry), ('color', color_entry), ('text', text_entry), ('image', image_entry))
+
+# compiling
+##################################
+
+def prepare_media(excel, sheet, timeline):
+    """
+    Probes the clip and sound files of timeline and builds the missing clip
+    proxies, returns the MediaIndex and ProxyStore a plan is compiled with
+    """
+    video_folder_path = os.path.dirname(excel) + os.sep + sheet
+    clip_files = [os.path.join(video_folder_path, f) for f in timeline.clips.visible()['file']]
+    with stage('probe'):
+        media = MediaIndex(media_index_path(excel))
+        media.probe(clip_files + timeline.audios.visible()['file'])
+    # proxies are kept between runs, only new footage gets one built
+    with stage('proxies'):
+        proxies = ProxyStore(proxy_store_path(excel))
+        proxies.build(clip_files)
+    return media, proxies
+
+def compile_timeline(timeline, video_folder_path, media=None, proxies=None):
+    """
+    Plan of a parsed timeline. Without media the clips are chained with the
+    sheet ranges and a DEFAULT_FPS fade and the plan has no fps, the scene
+    then takes the frame rate of the first movie strip. Without proxies
+    none are used.
+    """
+    with stage('channels'):
+        timeline, moves = allocate_channels(timeline)
+    for kind, row, old, new in moves:
+        log.warning(f"{kind} row {row+1} overlaps another strip on channel {old}, moved to channel {new}")
+
+    fps = footage_fps(timeline.clips, video_folder_path, media)
+    clips, end = clip_entries(timeline.clips, video_folder_path, media, proxies, fps)
+    index = TimelineIndex(timeline)
+    visible = timeline.clips.visible()
+    keep = int(visible['channel'].min()) if len(visible) else None
+    placed = {}
+    seen = {}
+    strips = []
+    sections = timeline.sections()
+    for kind, make in ENTRIES:
+        for n, row in enumerate(sections[kind]):
+            # hidden rows count too, hiding a row doesn't rename its twins
+            key = row_key(kind, row, seen)
+            if row.show != True:
+                continue
+            box = None
+            if kind == 'text' and row.group and row.box:
+                channel = row.channel
+                box = box_channel(index, placed, row, n, keep)
+                if box is None:
+                    log.warning(f"text row {n+1} has no room for its box")
+                elif row.channel != channel:
+                    log.warning(f"text row {n+1} moved up to channel {row.channel}, its box takes channel {box}")
+            entry = make(row)
+            entry['hash'] = entry_hash(entry)
+            entry['key'] = key
+            strips.append(entry)
+            end = max(end, entry['end'])
+            if box is not None:
+                box = box_entry(row, box)
+                box['hash'] = entry_hash(box)
+                box['key'] = 'box' + key[len(kind):]
+                strips.append(box)
+    return {'version': PLAN_VERSION,
+            'clips': {'key': 'clip', 'hash': entry_hash(clips), 'strips': clips},
+            'strips': strips,
+            'frame_end': end,
+            'fps': fps,
+            'rows': {kind: len(section) for kind, section in sections.items()}}
+
+def compile_plan(excel, sheet, media=None, proxies=None, fps=None):
+    """
+    Reads a sheet and compiles its plan. fps is the scene frame rate, the
+    'auto' sound gains are measured at it when the footage wasn't probed.
+    """
+    video_folder_path = os.path.dirname(excel) + os.sep + sheet
+    timeline = cached_parse(excel, sheet, 'final', read_sheet)
+    # the rate the scene will run at, apply_plan sets it to the footage's
+    scene_rate = footage_fps(timeline.clips, video_folder_path, media) or fps or DEFAULT_FPS
+    with stage('loudness'):
+        timeline = auto_gain(timeline, video_folder_path, media, LoudnessIndex(loudness_index_path(excel)), scene_rate)
+    with stage('compile'):
+        plan = compile_timeline(timeline, video_folder_path, media, proxies)
+    if proxies is not None:
+        # the proxies the plan uses were marked used, keeps them from eviction
+        proxies.save()
+    plan['excel'] = os.path.abspath(excel)
+    plan['sheet'] = sheet
+    return plan
+
+def save_plan(plan, path):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(plan, f, indent=1)
+    os.replace(tmp, path)
+
+def load_plan(path):
+    with open(path, encoding='utf-8') as f:
+        plan = json.load(f)
+    if plan.get('version') != PLAN_VERSION:
+        raise ValueError(f"{path} is a version {plan.get('version')} plan, expected {PLAN_VERSION}")
+    return plan
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m RiteBite.plan',
+                                     description='Compile a sheet of a RiteBite workbook to a JSON plan')
+    parser.add_argument('workbook')
+    parser.add_argument('sheet')
+    parser.add_argument('-o', '--output', help='plan file (default: print to stdout)')
+    parser.add_argument('--probe', action='store_true', help='probe the media and build proxies first')
+    args = parser.parse_args(argv)
+
+    excel = os.path.abspath(args.workbook)
+    font_directory = os.path.dirname(excel) + os.sep + "fonts"
+    if os.path.isdir(font_directory):
+        add_font_dir(font_directory)
+    media = proxies = None
+    if args.probe:
+        media, proxies = prepare_media(excel, args.sheet, cached_parse(excel, args.sheet, 'final', read_sheet))
+    plan = compile_plan(excel, args.sheet, media, proxies)
+    if args.output:
+        save_plan(plan, args.output)
+    else:
+        json.dump(plan, sys.stdout, indent=1)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Offline pre-mix of a plan's sound. Every clip sound and sound row is
+decoded once with ffmpeg, trimmed, faded and scaled by its volume with
+NumPy and summed into one WAV, which replaces all the SOUND strips of the
+plan with a single one. Playback and render then read one file instead of
+mixing the strips live.
+
+Mixes are kept in .ritebite/premix next to the workbook, named after a
+hash of everything that goes into them, so an unchanged sheet reuses its
+mix and an edit to any sound builds a new one.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .cache import CACHE_FOLDER
+from .plan import entry_hash
+from .probe import file_stamp
+from .proxies import FFMPEG
+from .profiling import stage
+
+log = logging.getLogger(__name__)
+
+SAMPLE_RATE = 48000
+CHANNELS = 2
+
+def premix_folder(excel):
+    return os.path.join(os.path.dirname(excel), CACHE_FOLDER, 'premix')
+
+def sound_parts(plan):
+    """
+    Where every SOUND entry of plan plays: timeline start frame, source
+    offset and length in frames, volume and fade in frames
+    """
+    parts = []
+    for entry in plan['clips']['strips'] + plan['strips']:
+        if entry['type'] != 'SOUND':
+            continue
+        props = entry['props']
+        offset = props.get('frame_offset_start', 0)
+        start = props.get('frame_start', entry['frame_start']) + offset
+        parts.append({'file': entry['filepath'], 'start': start, 'offset': offset,
+                      'frames': props['frame_final_duration'], 'volume': float(props.get('volume', 1.0)),
+                      'fade': entry.get('fade', 0), 'optional': entry.get('optional', False)})
+    return parts
+
+def mix_hash(parts, fps):
+    stamps = {}
+    for part in parts:
+        try:
+            stamps[part['file']] = file_stamp(part['file'])
+        except OSError:
+            stamps[part['file']] = None
+    fields = json.dumps({'parts': parts, 'stamps': stamps, 'fps': fps, 'rate': SAMPLE_RATE}, sort_keys=True)
+    return hashlib.md5(fields.encode('utf-8')).hexdigest()
+
+def decode(path, offset, duration):
+    """
+    duration seconds of the sound of path from offset as float32 samples,
+    shape (samples, CHANNELS), resampled to SAMPLE_RATE
+    """
+    cmd = [FFMPEG, '-v', 'error', '-ss', f"{offset:.6f}", '-t', f"{duration:.6f}", '-i', path,
+           '-vn', '-map', '0:a:0', '-f', 'f32le', '-ac', str(CHANNELS), '-ar', str(SAMPLE_RATE), '-']
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return np.frombuffer(result.stdout, dtype=np.float32).reshape(-1, CHANNELS)
+
+def envelope(count, volume, fade):
+    """
+    Gain of every sample, rising from 0 over the first fade samples the
+    way the keyframed fade of start_end.add_fade does
+    """
+    gain = np.full(count, volume, dtype=np.float32)
+    fade = min(fade, count)
+    if fade > 0:
+        t = np.linspace(0.0, 1.0, fade, endpoint=False, dtype=np.float32)
+        # the two keyframes ease in and out
+        gain[:fade] *= t * t * (3 - 2 * t)
+    return gain
+
+def mix(parts, fps, workers=None):
+    """
+    The mix of parts as int16 samples, starting on the first frame any of
+    them plays
+    """
+    first = min(part['start'] for part in parts)
+    last = max(part['start'] + part['frames'] for part in parts)
+    buffer = np.zeros((int(round((last - first) / fps * SAMPLE_RATE)), CHANNELS), dtype=np.float32)
+
+    def decode_part(part):
+        try:
+            return decode(part['file'], part['offset'] / fps, part['frames'] / fps)
+        except subprocess.CalledProcessError:
+            if not part['optional']:
+                raise
+            log.info(f"{part['file']} has no sound")
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        decoded = list(pool.map(decode_part, parts))
+    for part, samples in zip(parts, decoded):
+        if samples is None:
+            continue
+        at = int(round((part['start'] - first) / fps * SAMPLE_RATE))
+        samples = samples[:len(buffer) - at]
+        gain = envelope(len(samples), part['volume'], int(round(part['fade'] / fps * SAMPLE_RATE)))
+        buffer[at:at + len(samples)] += samples * gain[:, None]
+    return (np.clip(buffer, -1.0, 1.0) * 32767).astype(np.int16)
+
+def write_wav(path, samples):
+    tmp = path + '.tmp'
+    with wave.open(tmp, 'wb') as f:
+        f.setnchannels(CHANNELS)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(samples.tobytes())
+    os.replace(tmp, path)
+
+def premix_plan(plan, folder, fps, workers=None):
+    """
+    plan with its SOUND entries replaced by one entry playing their mix,
+    built in folder or reused from it. plan is returned unchanged when it
+    has no sound or the mix can't be made, the strips then mix live.
+    """
+    parts = sound_parts(plan)
+    if not parts:
+        return plan
+    if shutil.which(FFMPEG) is None:
+        log.warning("ffmpeg not found, the sound is mixed live")
+        return plan
+    digest = mix_hash(parts, fps)
+    prefix = plan.get('sheet', 'mix')
+    name = f"{prefix}_{digest}.wav"
+    path = os.path.join(folder, name)
+    if not os.path.exists(path):
+        with stage('premix'):
+            try:
+                samples = mix(parts, fps, workers)
+            except (OSError, subprocess.CalledProcessError) as e:
+                log.warning(f"Pre-mix failed, the sound is mixed live\n{getattr(e, 'stderr', None) or e}")
+                return plan
+            os.makedirs(folder, exist_ok=True)
+            write_wav(path, samples)
+        # one mix per sheet is kept, the older ones are stale
+        for old in os.listdir(folder):
+            if old != name and re.fullmatch(re.escape(prefix) + r'_[0-9a-f]{32}\.wav', old):
+                os.remove(os.path.join(folder, old))
+        log.info(f"Pre-mixed {len(parts)} sounds into {path}")
+
+    first = min(part['start'] for part in parts)
+    last = max(part['start'] + part['frames'] for part in parts)
+    clips = [entry for entry in plan['clips']['strips'] if entry['type'] != 'SOUND']
+    strips = [entry for entry in plan['strips'] if entry['type'] != 'SOUND']
+    channel = min(max([entry['channel'] for entry in clips + strips] + [0]) + 1, 128)
+    entry = {'type': 'SOUND', 'name': 'premix', 'filepath': path, 'channel': channel,
+             'frame_start': first, 'end': last,
+             'props': {'frame_final_duration': last - first}}
+    entry['hash'] = entry_hash(entry)
+    entry['key'] = 'premix'
+    return dict(plan, clips=dict(plan['clips'], hash=entry_hash(clips), strips=clips), strips=strips + [entry])
@@ -0,0 +1,183 @@
+"""
+Persistent index of what ffprobe knows about the media a sheet uses: fps,
+frame count, resolution, codecs with their profile, level and timescale,
+and the audio stream layout. Entries are keyed by path and checked against
+the file mtime and size, so a file is only probed again after it changes.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import CACHE_FOLDER
+
+log = logging.getLogger(__name__)
+
+FFPROBE = os.environ.get('RITEBITE_FFPROBE') or shutil.which('ffprobe') or 'ffprobe'
+# entries of an older version lack fields and are probed again
+INDEX_VERSION = 2
+
+def media_index_path(excel):
+    return os.path.join(os.path.dirname(excel), CACHE_FOLDER, 'media.json')
+
+def file_stamp(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+def frame_rate(rate):
+    """
+    '50/1' or '30000/1001' -> float, None when ffprobe had no rate
+    """
+    num, _, den = (rate or '0/0').partition('/')
+    try:
+        num, den = float(num), float(den or 1)
+    except ValueError:
+        return None
+    if num == 0 or den == 0:
+        return None
+    return num / den
+
+def timescale(time_base):
+    """
+    '1/12800' -> 12800, the ticks a second of the stream's timestamps
+    """
+    den = (time_base or '').partition('/')[2]
+    return int(den) if den.isdigit() and int(den) else None
+
+def parse_probe(data):
+    streams = data.get('streams', [])
+    video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+    duration = float(data.get('format', {}).get('duration') or 0)
+    info = {
+        'duration': duration,
+        'fps': None,
+        'frames': None,
+        'width': None,
+        'height': None,
+        'codec': None,
+        'pix_fmt': None,
+        'rate': None,
+        'profile': None,
+        'level': None,
+        'timescale': None,
+        'audio': [
+            {'codec': s.get('codec_name'), 'channels': s.get('channels'), 'sample_rate': int(s.get('sample_rate') or 0)}
+            for s in streams if s.get('codec_type') == 'audio'],
+    }
+    if video is not None:
+        fps = frame_rate(video.get('r_frame_rate')) or frame_rate(video.get('avg_frame_rate'))
+        frames = video.get('nb_frames')
+        if frames is None and fps:
+            frames = round(float(video.get('duration') or duration) * fps)
+        info.update({
+            'fps': fps,
+            'frames': int(frames) if frames is not None else None,
+            'width': video.get('width'),
+            'height': video.get('height'),
+            'codec': video.get('codec_name'),
+            'pix_fmt': video.get('pix_fmt'),
+            'rate': video.get('r_frame_rate'),
+            'profile': video.get('profile'),
+            'level': video.get('level'),
+            'timescale': timescale(video.get('time_base')),
+        })
+    return info
+
+def run_ffprobe(path):
+    cmd = [FFPROBE, '-v', 'error', '-print_format', 'json', '-show_streams', '-show_format', path]
+    out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    return parse_probe(json.loads(out))
+
+def run_keyframes(path):
+    """
+    Times of the keyframes of the first video stream, from the packet flags
+    so nothing has to be decoded
+    """
+    cmd = [FFPROBE, '-v', 'error', '-select_streams', 'v:0', '-show_entries', 'packet=pts_time,flags',
+           '-of', 'csv=p=0', path]
+    out = subprocess.run(cmd, capture_output=True, check=True).stdout.decode('utf-8', errors='replace')
+    times = []
+    for line in out.splitlines():
+        pts, _, flags = line.partition(',')
+        if 'K' in flags and pts not in ('', 'N/A'):
+            times.append(float(pts))
+    return sorted(times)
+
+class MediaIndex:
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def get(self, path):
+        """
+        Probe info of a file, None when it isn't indexed or has changed
+        """
+        entry = self.entries.get(os.path.abspath(path))
+        if entry is None:
+            return None
+        try:
+            if entry.get('version') != INDEX_VERSION or entry['stamp'] != file_stamp(path):
+                return None
+        except OSError:
+            return None
+        return entry['info']
+
+    def probe(self, paths, workers=None):
+        """
+        Probes every file of paths missing from the index. Each probe is an
+        ffprobe process, the pool only keeps os.cpu_count() of them running.
+        """
+        missing = sorted({os.path.abspath(p) for p in paths if os.path.exists(p) and self.get(p) is None})
+        if not missing:
+            return
+        if shutil.which(FFPROBE) is None:
+            log.warning(f"{FFPROBE} not found, can't probe {len(missing)} media files")
+            return
+
+        def probe_one(path):
+            try:
+                return path, file_stamp(path), run_ffprobe(path)
+            except (OSError, ValueError, subprocess.CalledProcessError) as e:
+                log.warning(f"Failed to probe {path}\n{e}")
+                return path, None, None
+
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            for path, stamp, info in pool.map(probe_one, missing):
+                if info is not None:
+                    self.entries[path] = {'version': INDEX_VERSION, 'stamp': stamp, 'info': info}
+        self.save()
+
+    def keyframes(self, path):
+        """
+        Keyframe times of an indexed file, listed the first time they are
+        asked for and kept in its entry (call save() afterwards). None when
+        the file isn't indexed or can't be read.
+        """
+        if self.get(path) is None:
+            return None
+        entry = self.entries[os.path.abspath(path)]
+        if 'keyframes' not in entry:
+            try:
+                entry['keyframes'] = run_keyframes(path)
+            except (OSError, subprocess.CalledProcessError) as e:
+                log.warning(f"Failed to list the keyframes of {path}\n{e}")
+                return None
+        return entry['keyframes']
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log.warning(f"Could not write media index {self.path}\n{e}")
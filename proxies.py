@@ -0,0 +1,160 @@
+"""
+Persistent proxy store. Proxies are MJPEG AVIs like the ones Blender builds
+into BL_proxy, but they are keyed by a hash of the source content and the
+proxy size, built with ffmpeg in parallel and kept between runs. When the
+store grows past its budget the least recently used proxies are evicted.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import CACHE_FOLDER
+
+log = logging.getLogger(__name__)
+
+FFMPEG = os.environ.get('RITEBITE_FFMPEG') or shutil.which('ffmpeg') or 'ffmpeg'
+# bytes the store may use before old proxies are evicted
+PROXY_BUDGET = int(os.environ.get('RITEBITE_PROXY_BUDGET', 20 * 1024**3))
+PROXY_SIZES = (25, 50, 75, 100)
+SAMPLE = 1024 * 1024
+
+def proxy_store_path(excel):
+    return os.path.join(os.path.dirname(excel), CACHE_FOLDER, 'proxies')
+
+def content_hash(path):
+    """
+    Hash of the file size and three 1MB samples (start, middle, end). Camera
+    files are too big to hash whole on every run and these differ as soon
+    as the footage does.
+    """
+    size = os.path.getsize(path)
+    md5 = hashlib.md5(str(size).encode('utf-8'))
+    with open(path, 'rb') as f:
+        for offset in sorted({0, max(0, size//2 - SAMPLE//2), max(0, size - SAMPLE)}):
+            f.seek(offset)
+            md5.update(f.read(SAMPLE))
+    return md5.hexdigest()
+
+def build_proxy(source, target, size):
+    tmp = target + '.tmp.avi'
+    cmd = [FFMPEG, '-v', 'error', '-y', '-i', source,
+           '-vf', f"scale=trunc(iw*{size}/200)*2:-2", '-c:v', 'mjpeg', '-q:v', '3', '-an', tmp]
+    subprocess.run(cmd, capture_output=True, check=True)
+    os.replace(tmp, target)
+
+class ProxyStore:
+    def __init__(self, folder, budget=PROXY_BUDGET):
+        self.folder = folder
+        self.budget = budget
+        self.index_path = os.path.join(folder, 'index.json')
+        # 'hashes': abspath -> [mtime_ns, size, content hash]
+        # 'proxies': '<hash>_<size>' -> {'bytes', 'used'}
+        self.index = {'hashes': {}, 'proxies': {}}
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def source_hash(self, path):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        cached = self.index['hashes'].get(path)
+        if cached is not None and cached[:2] == [st.st_mtime_ns, st.st_size]:
+            return cached[2]
+        digest = content_hash(path)
+        self.index['hashes'][path] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+    def proxy_file(self, key):
+        return os.path.join(self.folder, key + '.avi')
+
+    def get(self, path, size=50):
+        """
+        Path of the proxy of a source file, None when it hasn't been built.
+        Marks the proxy as used.
+        """
+        try:
+            key = f"{self.source_hash(path)}_{size}"
+        except OSError:
+            return None
+        entry = self.index['proxies'].get(key)
+        if entry is None or not os.path.exists(self.proxy_file(key)):
+            return None
+        entry['used'] = time.time()
+        return self.proxy_file(key)
+
+    def build(self, paths, size=50, workers=None):
+        """
+        Builds the missing proxies of paths, one ffmpeg process per file and
+        at most os.cpu_count() at a time, then evicts down to the budget
+        """
+        if size not in PROXY_SIZES:
+            raise ValueError(f"proxy size must be one of {PROXY_SIZES}")
+        jobs = {}
+        for path in {os.path.abspath(p) for p in paths if os.path.exists(p)}:
+            key = f"{self.source_hash(path)}_{size}"
+            if self.get(path, size) is None and key not in jobs:
+                jobs[key] = path
+        if jobs and shutil.which(FFMPEG) is None:
+            log.warning(f"{FFMPEG} not found, can't build {len(jobs)} proxies")
+            jobs = {}
+        if jobs:
+            os.makedirs(self.folder, exist_ok=True)
+
+            def build_one(key):
+                try:
+                    build_proxy(jobs[key], self.proxy_file(key), size)
+                    return key, True
+                except (OSError, subprocess.CalledProcessError) as e:
+                    log.warning(f"Failed to build proxy of {jobs[key]}\n{e}")
+                    return key, False
+
+            log.info(f"Building {len(jobs)} proxies")
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+                for key, ok in pool.map(build_one, sorted(jobs)):
+                    if ok:
+                        self.index['proxies'][key] = {'bytes': os.path.getsize(self.proxy_file(key)), 'used': time.time()}
+        self.evict()
+        self.save()
+
+    def evict(self):
+        """
+        Drops least recently used proxies until the store fits its budget
+        """
+        proxies = self.index['proxies']
+        total = sum(entry['bytes'] for entry in proxies.values())
+        for key in sorted(proxies, key=lambda k: proxies[k]['used']):
+            if total <= self.budget:
+                break
+            total -= proxies[key]['bytes']
+            del proxies[key]
+            try:
+                os.remove(self.proxy_file(key))
+            except OSError:
+                pass
+
+    def save(self):
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            tmp = self.index_path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            log.warning(f"Could not write proxy index {self.index_path}\n{e}")
+
+def use_proxy(strip, proxy_file, size=50):
+    """
+    Points a movie strip at a proxy from the store
+    """
+    strip.use_proxy = True
+    setattr(strip.proxy, f"build_{size}", True)
+    strip.proxy.use_proxy_custom_file = True
+    strip.proxy.filepath = proxy_file
@@ -0,0 +1,516 @@
+"""
+Chunked headless rendering. The frame range is split into chunks, each
+chunk is rendered by its own `blender -b` process from a saved copy of the
+file, and the chunks are joined with ffmpeg's concat demuxer without
+re-encoding the video. The audio is mixed down once for the whole range
+and muxed in at the end, so chunk joins never cut into it.
+
+render_preview() goes through the same workers with draft settings: a
+lower resolution, a fast h264 encode and
+optionally every Nth frame or only the frames around the cuts, written
+next to the real output as <name>_preview.mp4.
+
+render_cached() splits the timeline into segments at the cuts instead and
+keeps every rendered segment under a hash of what shows in it, and the
+mixdown under a hash of the sound strips, so after a small edit only the
+segments it touches are rendered again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+from .cache import CACHE_FOLDER
+from .proxies import FFMPEG
+from .profiling import stage, start_profile, finish_profile
+
+log = logging.getLogger(__name__)
+
+BLENDER = os.environ.get('RITEBITE_BLENDER') or bpy.app.binary_path or 'blender'
+
+# runs inside every worker, after the saved copy is loaded, and renders
+# each of its frame ranges to its own file
+WORKER_SCRIPT = """
+import bpy
+scene = bpy.context.scene
+scene.render.ffmpeg.audio_codec = 'NONE'
+scene.render.threads_mode = 'FIXED'
+scene.render.threads = {threads}
+{settings}
+for n, (start, end) in enumerate({ranges!r}):
+    scene.frame_start = start
+    scene.frame_end = end
+    scene.render.filepath = {filepath!r} + f"{{n:04d}}_"
+    bpy.ops.render.render(animation=True)
+"""
+
+# renders a whole saved file, sound included
+FILE_SCRIPT = """
+import bpy
+scene = bpy.context.scene
+scene.render.filepath = {filepath!r}
+scene.render.threads_mode = 'FIXED'
+scene.render.threads = {threads}
+{settings}
+bpy.ops.render.render(animation=True)
+"""
+
+# draft quality: smaller frames and a fast low quality h264. The footage is
+# still decoded at full size, renders don't read the sequencer proxies.
+PREVIEW_SETTINGS = """
+scene.render.resolution_percentage = {percentage}
+scene.frame_step = {stride}
+scene.render.image_settings.file_format = 'FFMPEG'
+scene.render.ffmpeg.format = 'MPEG4'
+scene.render.ffmpeg.codec = 'H264'
+scene.render.ffmpeg.constant_rate_factor = 'LOW'
+scene.render.ffmpeg.ffmpeg_preset = 'REALTIME'
+"""
+PREVIEW_PERCENTAGE = 50
+# frames rendered on each side of a cut in a cuts only preview
+PREVIEW_MARGIN = 12
+
+def frame_chunks(start, end, count, step=1):
+    """
+    Splits start..end (inclusive) into at most count contiguous ranges,
+    each a whole number of steps long so every step-th frame is kept
+    """
+    total = -(-(end - start + 1) // step)
+    count = max(1, min(count, total))
+    size, extra = divmod(total, count)
+    chunks = []
+    for n in range(count):
+        length = (size + (1 if n < extra else 0)) * step
+        chunks.append((start, min(end, start + length - 1)))
+        start += length
+    return chunks
+
+def split_list(items, count):
+    """
+    Splits items into at most count contiguous groups
+    """
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    groups = []
+    start = 0
+    for n in range(count):
+        length = size + (1 if n < extra else 0)
+        groups.append(items[start:start + length])
+        start += length
+    return groups
+
+def render_chunk(blend, ranges, filepath, threads, settings=''):
+    script = WORKER_SCRIPT.format(ranges=ranges, filepath=filepath, threads=threads, settings=settings)
+    cmd = [BLENDER, '-b', blend, '--python-expr', script]
+    subprocess.run(cmd, capture_output=True, check=True)
+    # blender appends the frame range and extension to movie file names
+    folder, prefix = os.path.split(filepath)
+    outputs = sorted(f for f in os.listdir(folder) if f.startswith(prefix))
+    if len(outputs) < len(ranges):
+        raise RuntimeError(f"frames {ranges[0][0]}-{ranges[-1][1]} rendered {len(outputs)} of {len(ranges)} files")
+    return [os.path.join(folder, f) for f in outputs]
+
+def render_file(blend, output, threads, settings=''):
+    script = FILE_SCRIPT.format(filepath=output, threads=threads, settings=settings)
+    subprocess.run([BLENDER, '-b', blend, '--python-expr', script], capture_output=True, check=True)
+    return output
+
+def concat_quote(path):
+    return "'" + path.replace("'", "'\\''") + "'"
+
+def join_chunks(chunks, audio, output, work=None):
+    list_file = os.path.join(work or os.path.dirname(chunks[0]), 'chunks.txt')
+    with open(list_file, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(f"file {concat_quote(chunk)}\n")
+    cmd = [FFMPEG, '-v', 'error', '-y', '-f', 'concat', '-safe', '0', '-i', list_file]
+    if audio is not None:
+        cmd += ['-i', audio, '-map', '0:v', '-map', '1:a', '-c:a', 'aac', '-b:a', '320k', '-shortest']
+    cmd += ['-c:v', 'copy', output]
+    subprocess.run(cmd, capture_output=True, check=True)
+
+def has_audio(scene):
+    sequence_editor = scene.sequence_editor
+    return sequence_editor is not None and any(s.type == 'SOUND' for s in sequence_editor.sequences_all)
+
+def cut_frames(scene):
+    """
+    Frames where one clip hands over to the next
+    """
+    sequence_editor = scene.sequence_editor
+    if sequence_editor is None:
+        return []
+    starts = sorted({int(s.frame_final_start) for s in sequence_editor.sequences_all if s.type == 'MOVIE'})
+    return starts[1:]
+
+def cut_ranges(scene, margin=PREVIEW_MARGIN):
+    """
+    Frame ranges margin frames around every cut, overlapping ones merged
+    """
+    ranges = []
+    for cut in cut_frames(scene):
+        start = max(scene.frame_start, cut - margin)
+        end = min(scene.frame_end, cut + margin)
+        if start > end:
+            continue
+        if ranges and start <= ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], max(end, ranges[-1][1]))
+        else:
+            ranges.append((start, end))
+    return ranges
+
+def save_copy(work):
+    blend = os.path.join(work, 'timeline.blend')
+    with stage('save'):
+        bpy.ops.wm.save_as_mainfile(filepath=blend, copy=True)
+    return blend
+
+def mix_down(scene, work):
+    """
+    The sound of the whole scene as a WAV in work, None when it has none
+    """
+    if not has_audio(scene):
+        return None
+    mixdown = os.path.join(work, 'audio.wav')
+    with stage('mixdown'):
+        bpy.ops.sound.mixdown(filepath=mixdown, container='WAV', codec='PCM', format='S16')
+    return mixdown
+
+def render_files(blend, ranges, work, workers, settings=''):
+    """
+    Renders every frame range to its own file with workers blender
+    processes, returns the files in range order
+    """
+    threads = max(1, os.cpu_count() // workers)
+    groups = split_list(ranges, workers)
+    log.info(f"Rendering {len(ranges)} ranges with {len(groups)} workers")
+    jobs = [(blend, group, os.path.join(work, f"chunk_{n:04d}_"), threads, settings) for n, group in enumerate(groups)]
+    with stage('render chunks'), ThreadPoolExecutor(max_workers=workers) as pool:
+        return [f for chunk in pool.map(lambda job: render_chunk(*job), jobs) for f in chunk]
+
+def render_ranges(ranges, output, workers, settings='', audio=True):
+    """
+    Renders the frame ranges of the current scene with workers blender
+    processes and joins them into output, with the mixed down sound when
+    audio is set
+    """
+    scene = bpy.context.scene
+    work = tempfile.mkdtemp(prefix='ritebite_render_', dir=os.path.dirname(output) or None)
+    try:
+        blend = save_copy(work)
+        mixdown = mix_down(scene, work) if audio else None
+        files = render_files(blend, ranges, work, workers, settings)
+        with stage('join'):
+            join_chunks(files, mixdown, output, work)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    log.info(f"Rendered {output}")
+    return output
+
+def render_chunked(output=None, workers=None, chunks=None, report=None):
+    """
+    Renders the current scene to output (defaults to the scene output
+    path) with workers blender processes over chunks frame ranges. The
+    stage timings are written to report when given. Returns the output path.
+    """
+    scene = bpy.context.scene
+    output = output or scene.render.filepath
+    workers = workers or os.cpu_count()
+    chunks = chunks or workers
+    start_profile('render')
+    render_ranges(frame_chunks(scene.frame_start, scene.frame_end, chunks), output, workers)
+    finish_profile(report)
+    return output
+
+def preview_path(output):
+    return os.path.splitext(output)[0] + '_preview.mp4'
+
+def preview_settings(percentage=PREVIEW_PERCENTAGE, stride=1):
+    settings = PREVIEW_SETTINGS.format(percentage=percentage, stride=stride)
+    if stride > 1:
+        # skipped frames would leave the sound running ahead of the picture
+        settings += "scene.render.ffmpeg.audio_codec = 'NONE'\n"
+    return settings
+
+def render_preview(output=None, percentage=PREVIEW_PERCENTAGE, stride=1, cuts_only=False, workers=None, report=None):
+    """
+    Renders a draft of the current scene next to the scene output (name
+    ending in _preview) at percentage of the resolution with a fast encode.
+    stride keeps every stride-th frame, cuts_only only the frames around
+    the cuts. Both drop the sound, it wouldn't line up. Returns the output
+    path.
+    """
+    scene = bpy.context.scene
+    output = output or preview_path(scene.render.filepath)
+    workers = workers or os.cpu_count()
+    start_profile('preview')
+    ranges = cut_ranges(scene) if cuts_only else []
+    if not ranges:
+        ranges = frame_chunks(scene.frame_start, scene.frame_end, workers, stride)
+    render_ranges(ranges, output, workers, preview_settings(percentage, stride),
+                  audio=stride == 1 and not cuts_only)
+    finish_profile(report)
+    return output
+
+# segment cache
+##################################
+
+# bytes of rendered segments kept before the least recently used go
+SEGMENT_BUDGET = int(os.environ.get('RITEBITE_SEGMENT_BUDGET', 10 * 1024**3))
+# longest segment, so an edit inside a long shot doesn't re-render all of it
+SEGMENT_LENGTH = 250
+# strip properties that don't change a rendered frame
+UI_PROPERTIES = {'rna_type', 'lock', 'color_tag', 'use_proxy', 'proxy', 'sequences', 'sequences_all'}
+# strip properties holding timeline frames, replaced by the part of the
+# strip inside the segment. The auto numbered name changes on every rebuild.
+FRAME_PROPERTIES = ('name', 'frame_start', 'frame_final_start', 'frame_final_end', 'frame_final_duration',
+                    'frame_offset_start', 'frame_offset_end')
+FCURVE_PATH = re.compile(r'sequences_all\["(.+?)"\]\.(.+)')
+
+def segment_ranges(scene, length=SEGMENT_LENGTH):
+    """
+    The scene frame range split at the cuts and then into pieces of at
+    most length frames
+    """
+    bounds = [scene.frame_start] + [f for f in cut_frames(scene) if scene.frame_start < f <= scene.frame_end]
+    bounds.append(scene.frame_end + 1)
+    ranges = []
+    for start, stop in zip(bounds, bounds[1:]):
+        for piece in range(start, stop, length):
+            ranges.append((piece, min(stop, piece + length) - 1))
+    return ranges
+
+def rna_values(struct, depth=2):
+    """
+    {property: value} of the RNA properties of struct. Nested structs and
+    collections are followed down to depth, IDs and strips are named.
+    """
+    values = {}
+    for prop in struct.bl_rna.properties:
+        name = prop.identifier
+        if name in UI_PROPERTIES or name.startswith(('select', 'show_')):
+            continue
+        value = getattr(struct, name, None)
+        if prop.type == 'POINTER':
+            if value is None or depth == 0 or hasattr(value, 'name'):
+                values[name] = getattr(value, 'name', None)
+            else:
+                values[name] = rna_values(value, depth - 1)
+        elif prop.type == 'COLLECTION':
+            if depth > 0:
+                values[name] = [rna_values(item, depth - 1) for item in value]
+        elif isinstance(value, (set, frozenset)):
+            values[name] = sorted(value)
+        elif hasattr(value, '__len__') and not isinstance(value, str):
+            values[name] = list(value)
+        else:
+            values[name] = value
+    return values
+
+def source_files(strip):
+    files = []
+    if getattr(strip, 'filepath', None):
+        files.append(strip.filepath)
+    if getattr(strip, 'sound', None) is not None:
+        files.append(strip.sound.filepath)
+    if strip.type == 'IMAGE':
+        files += [os.path.join(strip.directory, e.filename) for e in strip.elements]
+    if strip.type == 'TEXT' and strip.font is not None:
+        files.append(strip.font.filepath)
+    return files
+
+def file_stamp(path):
+    path = os.path.abspath(bpy.path.abspath(path))
+    try:
+        st = os.stat(path)
+    except OSError:
+        return [path, None, None]
+    return [path, st.st_mtime_ns, st.st_size]
+
+def strip_fcurves(scene):
+    """
+    strip name -> [(property, [(frame, value), ...]), ...] of the scene's
+    animation, where the fades live
+    """
+    curves = {}
+    action = scene.animation_data.action if scene.animation_data is not None else None
+    if action is None:
+        return curves
+    for fcurve in action.fcurves:
+        match = FCURVE_PATH.search(fcurve.data_path)
+        if match is not None:
+            points = [tuple(point.co) for point in fcurve.keyframe_points]
+            curves.setdefault(match.group(1), []).append((match.group(2), fcurve.array_index, points))
+    return curves
+
+def output_settings(scene):
+    render = scene.render
+    return {'size': [render.resolution_x, render.resolution_y, render.resolution_percentage],
+            'fps': [render.fps, render.fps_base], 'format': render.image_settings.file_format,
+            'ffmpeg': rna_values(render.ffmpeg, 0),
+            'view': [scene.view_settings.view_transform, scene.view_settings.look,
+                     scene.view_settings.exposure, scene.view_settings.gamma,
+                     scene.display_settings.display_device]}
+
+def strip_values(strip, curves, start, end):
+    """
+    Properties, keyframes and source files of a strip. Its timeline frames
+    are only kept as the part of it inside start..end and the source frame
+    that part begins on, counted from start.
+    """
+    values = rna_values(strip)
+    for name in FRAME_PROPERTIES:
+        values.pop(name, None)
+    first = max(strip.frame_final_start, start)
+    values['window'] = [first - start, min(strip.frame_final_end, end + 1) - start, first - strip.frame_start]
+    values['fcurves'] = [(path, index, [(x - start, y) for x, y in points])
+                         for path, index, points in curves.get(strip.name, [])]
+    values['sources'] = [file_stamp(path) for path in source_files(strip)]
+    return values
+
+def rendered_strips(strips):
+    """
+    (strip, meta) of the unmuted strips that draw something. META strips
+    are containers, their children are listed instead with the meta they
+    sit in, and the children of a muted meta are left out.
+    """
+    parents = {}
+    for strip in strips:
+        if strip.type == 'META':
+            for child in strip.sequences:
+                parents[child.name] = strip
+    found = []
+    for strip in strips:
+        if strip.type == 'META' or strip.mute:
+            continue
+        meta = parents.get(strip.name)
+        muted = False
+        while meta is not None and not muted:
+            muted = meta.mute
+            meta = parents.get(meta.name)
+        if not muted:
+            found.append((strip, parents.get(strip.name)))
+    return found
+
+def segment_hash(strips, curves, start, end, settings):
+    """
+    Digest of everything that shows in frames start..end: the output
+    settings and the properties, keyframes and source files of every strip
+    on screen then, with frames counted from the segment start so a segment
+    that only moved along the timeline is still found. Segments are
+    rendered without sound, sound strips go into sound_hash() instead.
+    """
+    found = []
+    for strip, meta in rendered_strips(strips):
+        if strip.type == 'SOUND' or strip.frame_final_end <= start or strip.frame_final_start > end:
+            continue
+        values = strip_values(strip, curves, start, end)
+        if meta is not None:
+            # the meta blends its children as one strip on its own channel
+            values['meta'] = [meta.channel, meta.blend_type, meta.blend_alpha]
+        found.append(values)
+    found.sort(key=lambda values: (values.get('meta', [0])[0], values['channel'], values['window']))
+    fields = json.dumps([end - start, settings, found], sort_keys=True, default=str)
+    return hashlib.md5(fields.encode('utf-8')).hexdigest()
+
+def sound_hash(scene, strips, curves):
+    """
+    Digest of everything the mixdown of the scene is made from: its frame
+    range, rate and audio settings and every sound strip
+    """
+    found = [strip_values(strip, curves, scene.frame_start, scene.frame_end)
+             for strip, _ in rendered_strips(strips) if strip.type == 'SOUND']
+    found.sort(key=lambda values: (values['channel'], values['window']))
+    render = scene.render
+    settings = [scene.frame_start, scene.frame_end, render.fps, render.fps_base, scene.audio_volume,
+                render.ffmpeg.audio_mixrate, render.ffmpeg.audio_channels]
+    fields = json.dumps([settings, found], sort_keys=True, default=str)
+    return hashlib.md5(fields.encode('utf-8')).hexdigest()
+
+def cached_mix_down(scene, cache, strips, curves):
+    """
+    mix_down() kept in cache by sound_hash(), so an edit that doesn't
+    touch the sound reuses the last mixdown. None when there is no sound.
+    """
+    if not has_audio(scene):
+        return None
+    path = os.path.join(cache, f"audio_{sound_hash(scene, strips, curves)}.wav")
+    if os.path.exists(path):
+        # marks the mixdown as used for the eviction
+        os.utime(path)
+        return path
+    with stage('mixdown'):
+        bpy.ops.sound.mixdown(filepath=path + '.tmp.wav', container='WAV', codec='PCM', format='S16')
+    os.replace(path + '.tmp.wav', path)
+    return path
+
+def evict_segments(folder, budget=SEGMENT_BUDGET):
+    """
+    Drops least recently used segments until the cache fits its budget
+    """
+    try:
+        entries = [(st.st_mtime, st.st_size, path) for path in
+                   (os.path.join(folder, f) for f in os.listdir(folder)) for st in [os.stat(path)]]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        total -= size
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def render_cached(output=None, workers=None, cache=None, report=None):
+    """
+    Renders the current scene to output like render_chunked(), but the
+    timeline is cut into segments (at the cuts, at most SEGMENT_LENGTH
+    frames) that are kept in cache by a hash of their inputs. Only segments
+    that aren't there yet are rendered, then all of them are joined without
+    re-encoding. cache defaults to .ritebite/segments next to the output.
+    """
+    scene = bpy.context.scene
+    output = output or scene.render.filepath
+    workers = workers or os.cpu_count()
+    cache = cache or os.path.join(os.path.dirname(output), CACHE_FOLDER, 'segments')
+    start_profile('render')
+    with stage('hash'):
+        settings = output_settings(scene)
+        strips = list(scene.sequence_editor.sequences_all) if scene.sequence_editor is not None else []
+        curves = strip_fcurves(scene)
+        extension = scene.render.file_extension
+        segments = [(start, end, os.path.join(cache, segment_hash(strips, curves, start, end, settings) + extension))
+                    for start, end in segment_ranges(scene)]
+    dirty = [(start, end, path) for start, end, path in segments if not os.path.exists(path)]
+    log.info(f"{len(dirty)} of {len(segments)} segments changed")
+
+    os.makedirs(cache, exist_ok=True)
+    work = tempfile.mkdtemp(prefix='ritebite_render_', dir=os.path.dirname(output) or None)
+    try:
+        if dirty:
+            blend = save_copy(work)
+            rendered = render_files(blend, [(start, end) for start, end, _ in dirty], work, workers)
+            for (_, _, path), file in zip(dirty, rendered):
+                shutil.move(file, path)
+        for _, _, path in segments:
+            # marks the segment as used for the eviction
+            os.utime(path)
+        mixdown = cached_mix_down(scene, cache, strips, curves)
+        with stage('join'):
+            join_chunks([path for _, _, path in segments], mixdown, output, work)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    evict_segments(cache)
+    log.info(f"Rendered {output}")
+    finish_profile(report)
+    return output
@@ -1,97 +1,348 @@
-import bpy
-from .start_end import final
-from .start_end import clear
-from .start_end import clear_all
-
-from bpy.props import (StringProperty,
-                       PointerProperty,
-                       )
-from bpy.types import (Panel,
-                       PropertyGroup,
-                       )
-                       
-class RBClearOperator(bpy.types.Operator):
-    bl_idname = "wm.clear"
-    bl_label = "clear"
-    def execute(self, context):
-        clear()
-        return {'FINISHED'}
-
-class RBFinalOperator(bpy.types.Operator):
-    bl_idname = "wm.final"
-    bl_label = "final"
-    def execute(self, context):
-        final(bpy.context.scene.ritebite.excel, bpy.context.scene.ritebite.sheet)
-        return {'FINISHED'}
-
-class RBClearAllOperator(bpy.types.Operator):
-    bl_idname = "wm.clearall"
-    bl_label = "clearall"
-    def execute(self, context):
-        clear_all(bpy.context.scene.ritebite.excel, bpy.context.scene.ritebite.sheet)
-        return {'FINISHED'}
-
-class RiteBiteProperties(PropertyGroup):
-
-    excel: StringProperty(
-        name="Excel",
-        description=":",
-        default="ssss",
-        maxlen=1024,
-        )
-
-    sheet: StringProperty(
-        name="Sheet",
-        description=":",
-        default="sss",
-        maxlen=1024,
-        )
-
-
-class VIEW3D_PT_my_custom_panel(bpy.types.Panel):  # class naming convention ‘CATEGORY_PT_name’
-
-    # where to add the panel in the UI
-    bl_space_type = "SEQUENCE_EDITOR"  # 3D Viewport area (find list of values here https://docs.blender.org/api/current/bpy_types_enum_items/space_type_items.html#rna-enum-space-type-items)
-    bl_region_type = "UI"  # Sidebar region (find list of values here https://docs.blender.org/api/current/bpy_types_enum_items/region_type_items.html#rna-enum-region-type-items)
-
-    bl_category = "RiteBite"  # found in the Sidebar
-    bl_label = "RiteBite"  # found at the top of the Panel
-
-    def draw(self, context):
-        """define the layout of the panel"""
-        scene = context.scene
-        ritebite = scene.ritebite
-        row = self.layout.row()
-        row.prop(ritebite, "excel")
-        row = self.layout.row()
-        row.prop(ritebite, "sheet")
-
-        row = self.layout.row()
-        row.operator(RBFinalOperator.bl_idname, text="Create")
-
-        layout = self.layout
-        layout.row().separator()
-
-        row = self.layout.row()
-        row.operator(RBClearOperator.bl_idname, text="Clear")
-        row = self.layout.row()
-        row.operator(RBClearAllOperator.bl_idname, text="Clear All")
-
-def register():
-    bpy.utils.register_class(RBClearOperator)
-    bpy.utils.register_class(RBClearAllOperator)
-    bpy.utils.register_class(RBFinalOperator)
-    bpy.utils.register_class(RiteBiteProperties)
-    bpy.utils.register_class(VIEW3D_PT_my_custom_panel)
-    bpy.types.Scene.ritebite = PointerProperty(type=RiteBiteProperties)
-
-def unregister():
-    bpy.utils.unregister_class(RBClearOperator)
-    bpy.utils.unregister_class(RBClearAllOperator)
-    bpy.utils.unregister_class(RBFinalOperator)
-    bpy.utils.unregister_class(RiteBiteProperties)
-    bpy.utils.unregister_class(VIEW3D_PT_my_custom_panel)
-    del bpy.types.Scene.ritebite
-
-if __name__ == "__main__":
-    register()
+import os
+import threading
+import time
+import bpy
+from .start_end import final, begin_final, compile_final, apply_steps, finish_final, scene_fps
+from .start_end import clear
+from .start_end import clear_all
+from .cut import cut_and_render
+from .cache import CACHE_FOLDER
+from .render import render_cached, render_preview, PREVIEW_PERCENTAGE
+from .profiling import summary, profile_path, stage
+from . import profiling
+
+from bpy.props import (StringProperty,
+                       IntProperty,
+                       FloatProperty,
+                       BoolProperty,
+                       PointerProperty,
+                       )
+from bpy.types import (Panel,
+                       PropertyGroup,
+                       )
+                       
+class RBClearOperator(bpy.types.Operator):
+    bl_idname = "wm.clear"
+    bl_label = "clear"
+    def execute(self, context):
+        clear()
+        return {'FINISHED'}
+
+# seconds of strip building per timer tick, the UI stays responsive in between
+TIME_SLICE = 0.05
+
+class RBFinalOperator(bpy.types.Operator):
+    """
+    Builds the sheet. From the panel the sheet is read and compiled on a
+    background thread and the strips are built a time slice per timer tick,
+    Esc stops the build and keeps the strips made so far. Scripts and
+    background runs get the plain blocking final().
+    """
+    bl_idname = "wm.final"
+    bl_label = "final"
+
+    running = False
+    # compile thread of the last modal build, it can't be stopped and
+    # outlives a cancelled build while it writes the .ritebite caches
+    compiling = None
+
+    @classmethod
+    def busy(cls):
+        return cls.running or (cls.compiling is not None and cls.compiling.is_alive())
+
+    def execute(self, context):
+        if RBFinalOperator.busy():
+            self.report({'WARNING'}, "A sheet is still being built, try again in a moment")
+            return {'CANCELLED'}
+        try:
+            ritebite = bpy.context.scene.ritebite
+            final(ritebite.excel, ritebite.sheet, ritebite.premix)
+        except ValueError as e:
+            # bad cells in the sheet
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if bpy.app.background:
+            return self.execute(context)
+        if RBFinalOperator.running:
+            self.report({'WARNING'}, "A sheet is already being built")
+            return {'CANCELLED'}
+        if RBFinalOperator.busy():
+            self.report({'WARNING'}, "The last sheet is still being read, try again in a moment")
+            return {'CANCELLED'}
+        ritebite = context.scene.ritebite
+        self._excel = ritebite.excel
+        self._sheet = ritebite.sheet
+        self._fps = scene_fps()
+        self._premix = ritebite.premix
+        try:
+            begin_final(self._excel, self._sheet)
+        except OSError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        self._result = {}
+        self._steps = None
+        self._thread = threading.Thread(target=self.compile, daemon=True)
+        self._thread.start()
+        RBFinalOperator.compiling = self._thread
+        RBFinalOperator.running = True
+        ritebite.progress = 0.0
+        ritebite.status = "Reading sheet"
+        self._timer = context.window_manager.event_timer_add(0.05, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def compile(self):
+        # background thread, no bpy in here
+        try:
+            self._result['plan'] = compile_final(self._excel, self._sheet, self._fps, self._premix)
+        except Exception as e:
+            self._result['error'] = e
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self.stop(context, "Cancelled", {'WARNING'}, "Create cancelled, the strips built so far were kept")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        ritebite = context.scene.ritebite
+        try:
+            if self._steps is None:
+                if self._thread.is_alive():
+                    return {'PASS_THROUGH'}
+                if 'error' in self._result:
+                    raise self._result['error']
+                self._steps = apply_steps(self._result['plan'])
+                ritebite.status = "Building strips"
+
+            deadline = time.perf_counter() + TIME_SLICE
+            with stage('apply'):
+                # at least one step per tick, however long it takes
+                while True:
+                    done, total = next(self._steps)
+                    ritebite.progress = done / total
+                    if time.perf_counter() >= deadline:
+                        break
+        except StopIteration:
+            self.stop(context, "Done")
+            return {'FINISHED'}
+        except Exception as e:
+            # bad cells read fine on their own, anything else needs its type
+            message = str(e) if isinstance(e, ValueError) else f"{type(e).__name__}: {e}"
+            self.stop(context, "Failed", {'ERROR'}, message)
+            return {'CANCELLED'}
+        self.redraw(context)
+        return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        # Blender ends the modal itself, e.g. when another file is opened
+        self.stop(context, "Cancelled")
+
+    def stop(self, context, status, level=None, message=None):
+        """
+        The one way out of a modal build, whatever ended it: the timer,
+        the strip generator, the running flag and the profile are cleaned
+        up and message is reported
+        """
+        try:
+            context.window_manager.event_timer_remove(self._timer)
+            if self._steps is not None:
+                # runs the generator's cleanup, the scene end follows what was built
+                self._steps.close()
+        finally:
+            RBFinalOperator.running = False
+            finish_final(self._excel)
+            context.scene.ritebite.status = status
+        if message:
+            self.report(level, message)
+        self.redraw(context)
+
+    def redraw(self, context):
+        for area in context.screen.areas:
+            if area.type == 'SEQUENCE_EDITOR':
+                area.tag_redraw()
+
+class RBClearAllOperator(bpy.types.Operator):
+    bl_idname = "wm.clearall"
+    bl_label = "clearall"
+    def execute(self, context):
+        clear_all(bpy.context.scene.ritebite.excel, bpy.context.scene.ritebite.sheet)
+        return {'FINISHED'}
+
+class RBRenderOperator(bpy.types.Operator):
+    bl_idname = "wm.render_chunked"
+    bl_label = "render"
+    def execute(self, context):
+        ritebite = bpy.context.scene.ritebite
+        # segments are kept next to the workbook, like the other caches
+        cache = os.path.join(os.path.dirname(ritebite.excel), CACHE_FOLDER, 'segments')
+        render_cached(workers=ritebite.workers or None, cache=cache, report=profile_path(ritebite.excel, 'render'))
+        return {'FINISHED'}
+
+class RBCutOperator(bpy.types.Operator):
+    bl_idname = "wm.quick_cut"
+    bl_label = "quick cut"
+    def execute(self, context):
+        ritebite = bpy.context.scene.ritebite
+        output = cut_and_render(ritebite.excel, ritebite.sheet, workers=ritebite.workers or None)
+        self.report({'INFO'}, f"Cut written to {output}")
+        return {'FINISHED'}
+
+class RBPreviewOperator(bpy.types.Operator):
+    bl_idname = "wm.render_preview"
+    bl_label = "preview"
+    def execute(self, context):
+        ritebite = bpy.context.scene.ritebite
+        output = render_preview(percentage=ritebite.preview_percentage, stride=ritebite.preview_stride,
+                                cuts_only=ritebite.preview_cuts, workers=ritebite.workers or None,
+                                report=profile_path(ritebite.excel, 'preview'))
+        self.report({'INFO'}, f"Preview written to {output}")
+        return {'FINISHED'}
+
+class RiteBiteProperties(PropertyGroup):
+
+    excel: StringProperty(
+        name="Excel",
+        description=":",
+        default="ssss",
+        maxlen=1024,
+        )
+
+    sheet: StringProperty(
+        name="Sheet",
+        description=":",
+        default="sss",
+        maxlen=1024,
+        )
+
+    progress: FloatProperty(
+        name="Progress",
+        description="How much of the sheet has been built",
+        default=0.0,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+        )
+
+    status: StringProperty(
+        name="Status",
+        description="What the build is doing",
+        default="",
+        )
+
+    workers: IntProperty(
+        name="Workers",
+        description="Blender processes used to render, 0 uses every core",
+        default=0,
+        min=0,
+        )
+
+    preview_percentage: IntProperty(
+        name="Size",
+        description="Resolution percentage of the preview",
+        default=PREVIEW_PERCENTAGE,
+        min=10,
+        max=100,
+        subtype='PERCENTAGE',
+        )
+
+    preview_stride: IntProperty(
+        name="Stride",
+        description="Render every Nth frame of the preview",
+        default=1,
+        min=1,
+        )
+
+    preview_cuts: BoolProperty(
+        name="Cuts only",
+        description="Only render the frames around the cuts",
+        default=False,
+        )
+
+    premix: BoolProperty(
+        name="Pre-mix sound",
+        description="Mix all the sound into one track when creating, instead of live",
+        default=False,
+        )
+
+
+class VIEW3D_PT_my_custom_panel(bpy.types.Panel):  # class naming convention ‘CATEGORY_PT_name’
+
+    # where to add the panel in the UI
+    bl_space_type = "SEQUENCE_EDITOR"  # 3D Viewport area (find list of values here https://docs.blender.org/api/current/bpy_types_enum_items/space_type_items.html#rna-enum-space-type-items)
+    bl_region_type = "UI"  # Sidebar region (find list of values here https://docs.blender.org/api/current/bpy_types_enum_items/region_type_items.html#rna-enum-region-type-items)
+
+    bl_category = "RiteBite"  # found in the Sidebar
+    bl_label = "RiteBite"  # found at the top of the Panel
+
+    def draw(self, context):
+        """define the layout of the panel"""
+        scene = context.scene
+        ritebite = scene.ritebite
+        row = self.layout.row()
+        row.prop(ritebite, "excel")
+        row = self.layout.row()
+        row.prop(ritebite, "sheet")
+
+        row = self.layout.row()
+        row.enabled = not RBFinalOperator.running
+        row.prop(ritebite, "premix")
+        row.operator(RBFinalOperator.bl_idname, text="Create")
+        if RBFinalOperator.running:
+            row = self.layout.row()
+            row.enabled = False
+            row.prop(ritebite, "progress", text=ritebite.status, slider=True)
+            row = self.layout.row()
+            row.label(text="Esc to cancel")
+
+        row = self.layout.row()
+        row.prop(ritebite, "workers")
+        row.operator(RBRenderOperator.bl_idname, text="Render")
+        row.operator(RBCutOperator.bl_idname, text="Quick cut")
+
+        row = self.layout.row()
+        row.prop(ritebite, "preview_percentage")
+        row.prop(ritebite, "preview_stride")
+        row = self.layout.row()
+        row.prop(ritebite, "preview_cuts")
+        row.operator(RBPreviewOperator.bl_idname, text="Preview")
+
+        if profiling.last_report is not None:
+            row = self.layout.row()
+            row.label(text=summary(profiling.last_report))
+
+        layout = self.layout
+        layout.row().separator()
+
+        row = self.layout.row()
+        row.operator(RBClearOperator.bl_idname, text="Clear")
+        row = self.layout.row()
+        row.operator(RBClearAllOperator.bl_idname, text="Clear All")
+
+def register():
+    bpy.utils.register_class(RBClearOperator)
+    bpy.utils.register_class(RBClearAllOperator)
+    bpy.utils.register_class(RBFinalOperator)
+    bpy.utils.register_class(RBRenderOperator)
+    bpy.utils.register_class(RBPreviewOperator)
+    bpy.utils.register_class(RBCutOperator)
+    bpy.utils.register_class(RiteBiteProperties)
+    bpy.utils.register_class(VIEW3D_PT_my_custom_panel)
+    bpy.types.Scene.ritebite = PointerProperty(type=RiteBiteProperties)
+
+def unregister():
+    bpy.utils.unregister_class(RBClearOperator)
+    bpy.utils.unregister_class(RBClearAllOperator)
+    bpy.utils.unregister_class(RBFinalOperator)
+    bpy.utils.unregister_class(RBRenderOperator)
+    bpy.utils.unregister_class(RBPreviewOperator)
+    bpy.utils.unregister_class(RBCutOperator)
+    bpy.utils.unregister_class(RiteBiteProperties)
+    bpy.utils.unregister_class(VIEW3D_PT_my_custom_panel)
+    del bpy.types.Scene.ritebite
+
+if __name__ == "__main__":
+    register()
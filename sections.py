@@ -0,0 +1,127 @@
+"""
+Splits a sheet into its 'clip', 'text', 'image', 'color' and 'sound'
+sections and converts each section column in one go.
+"""
+
+import numpy as np
+
+SECTIONS = ('clip', 'text', 'image', 'color', 'sound')
+
+def volume(value):
+    """
+    A 'sound' cell: a gain, or 'auto' for one worked out from the loudness,
+    kept as NaN so the column stays numeric
+    """
+    if isinstance(value, str) and value.strip().lower() == 'auto':
+        return float('nan')
+    return float(value)
+
+# (field, type) of every column in a section, in sheet order
+CLIP_COLUMNS  = [('file', str), ('start', int), ('end', int), ('sound', volume), ('effect', str), ('channel', int), ('show', bool)]
+TEXT_COLUMNS  = [('text', str), ('start', int), ('end', int), ('font', str), ('size', float), ('x', float), ('y', float), ('color', str), ('shadow', bool), ('box', bool), ('box_color', str), ('bold', bool), ('italic', bool), ('channel', int), ('show', bool)]
+IMAGE_COLUMNS = [('file', str), ('start', int), ('end', int), ('x', float), ('y', float), ('scale_x', float), ('scale_y', float), ('channel', int), ('show', bool)]
+COLOR_COLUMNS = [('color', str), ('start', int), ('end', int), ('x', float), ('y', float), ('scale_x', float), ('scale_y', float), ('channel', int), ('show', bool)]
+SOUND_COLUMNS = [('file', str), ('start', int), ('end', int), ('sound', volume), ('channel', int), ('show', bool)]
+
+def column_name(col):
+    """
+    0 -> 'A', 27 -> 'AB'
+    """
+    name = ''
+    col += 1
+    while col:
+        col, rem = divmod(col - 1, 26)
+        name = chr(ord('A') + rem) + name
+    return name
+
+def to_table(rows):
+    """
+    Packs the rows into a 2D object array, padding short rows with None
+    """
+    rows = list(rows)
+    width = max((len(row) for row in rows), default=0)
+    table = np.full((len(rows), width), None, dtype=object)
+    for n, row in enumerate(rows):
+        table[n, :len(row)] = row
+    return table
+
+def split_sections(table):
+    """
+    Returns (kind, first, stop) for every section of the sheet, where rows
+    first..stop-1 hold the section data. A section starts after its header
+    row and runs up to the next row with a blank first cell.
+    """
+    if table.size == 0:
+        return []
+    first = table[:, 0]
+    blank = np.equal(first, None)
+    headers = np.flatnonzero(np.logical_or.reduce([first == kind for kind in SECTIONS]))
+    blanks = np.flatnonzero(blank)
+    stops = blanks[np.minimum(np.searchsorted(blanks, headers), len(blanks) - 1)] if len(blanks) else np.full(len(headers), len(first))
+    stops = np.where(stops > headers, stops, len(first))
+    sections = []
+    end = 0
+    for header, stop in zip(headers.tolist(), stops.tolist()):
+        # a header inside the previous section is data, the old walker
+        # never looked at it either
+        if header < end:
+            continue
+        sections.append((first[header], header + 1, stop))
+        end = stop
+    return sections
+
+def bad_cell(values, first, col, field, kind, kind_of):
+    convert = float if kind_of is int else kind_of
+    for n, value in enumerate(values):
+        try:
+            if value is None:
+                raise ValueError
+            convert(value)
+        except (TypeError, ValueError):
+            return ValueError(f"row {first + n + 1}, column {column_name(col)} ({kind} {field}): cannot read {value!r} as {kind_of.__name__}")
+    return ValueError(f"column {column_name(col)} ({kind} {field}) could not be read")
+
+def numeric(values):
+    """
+    values with the text cells that hold a number ('01', '1e0', a csv keeps
+    them as text) converted to float, other cells as they are
+    """
+    converted = values.copy()
+    for n, value in enumerate(values):
+        if isinstance(value, str):
+            try:
+                converted[n] = float(value)
+            except ValueError:
+                pass
+    return converted
+
+def read_columns(table, kind, first, stop, columns):
+    """
+    Converts the cells of one section to typed python lists, one per field.
+    Bad cells raise a ValueError naming the sheet row and column.
+    """
+    if table.shape[1] < len(columns):
+        table = np.concatenate([table, np.full((table.shape[0], len(columns) - table.shape[1]), None, dtype=object)], axis=1)
+    data = {}
+    for col, (field, kind_of) in enumerate(columns):
+        values = table[first:stop, col]
+        try:
+            if kind_of is bool:
+                data[field] = (numeric(values) == 1).tolist()
+            elif kind_of is str:
+                if np.equal(values, None).any():
+                    raise ValueError
+                data[field] = values.astype(str).tolist()
+            elif kind_of is volume:
+                auto = np.array([isinstance(v, str) and v.strip().lower() == 'auto' for v in values], dtype=bool)
+                typed = np.where(auto, 0, values).astype(np.float64)
+                typed[auto] = np.nan
+                data[field] = typed.tolist()
+            else:
+                typed = values.astype(np.float64)
+                if kind_of is int:
+                    typed = typed.astype(np.int64)
+                data[field] = typed.tolist()
+        except (TypeError, ValueError):
+            raise bad_cell(values, first, col, field, kind, kind_of) from None
+    return data
@@ -0,0 +1,168 @@
+"""
+Streaming row reader for the editing sheets. Rows are yielded one at a time
+as lists of str / int / float cells with None for blank cells, the same
+shape pd.read_excel(header=None).values.tolist() gave us but without
+loading pandas (or the whole sheet) into memory.
+"""
+
+import csv
+import os
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+# csv cells read as numbers, zero padded digits and exponents stay text
+CSV_NUMBER = re.compile(r'-?(0|[1-9][0-9]*)(\.[0-9]+)?')
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def is_blank(cell):
+    return cell is None
+
+def to_number(text):
+    value = float(text)
+    if value.is_integer():
+        return int(value)
+    return value
+
+def column_index(ref):
+    """
+    'A1' -> 0, 'O27' -> 14
+    """
+    index = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        index = index*26 + ord(ch.upper()) - ord('A') + 1
+    return index - 1
+
+def read_shared_strings(book):
+    strings = []
+    try:
+        f = book.open('xl/sharedStrings.xml')
+    except KeyError:
+        return strings
+    with f:
+        for event, elem in ET.iterparse(f):
+            if local_name(elem.tag) == 'si':
+                strings.append(''.join(t.text or '' for t in elem.iter() if local_name(t.tag) == 't'))
+                elem.clear()
+    return strings
+
+def sheet_names(excel):
+    """
+    Names of the sheets of a workbook in tab order, a .csv is one sheet
+    named after the file
+    """
+    ext = os.path.splitext(excel)[1].lower()
+    if ext == '.csv':
+        return [os.path.splitext(os.path.basename(excel))[0]]
+    if ext == '.xls':
+        import pandas as pd
+        return pd.ExcelFile(excel).sheet_names
+    with zipfile.ZipFile(excel) as book:
+        return [elem.get('name') for elem in ET.fromstring(book.read('xl/workbook.xml')).iter() if local_name(elem.tag) == 'sheet']
+
+def find_sheet_xml(book, sheet):
+    """
+    Maps a sheet name to its worksheet part through workbook.xml and its
+    relationships
+    """
+    rel_id = None
+    for elem in ET.fromstring(book.read('xl/workbook.xml')).iter():
+        if local_name(elem.tag) == 'sheet' and elem.get('name') == sheet:
+            rel_id = next(v for k, v in elem.attrib.items() if local_name(k) == 'id')
+            break
+    if rel_id is None:
+        raise ValueError(f"Worksheet named '{sheet}' not found")
+    for elem in ET.fromstring(book.read('xl/_rels/workbook.xml.rels')).iter():
+        if local_name(elem.tag) == 'Relationship' and elem.get('Id') == rel_id:
+            target = elem.get('Target')
+            if target.startswith('/'):
+                return target[1:]
+            return posixpath.normpath(posixpath.join('xl', target))
+    raise ValueError(f"Worksheet named '{sheet}' has no part in the workbook")
+
+def cell_value(cell, strings):
+    kind = cell.get('t', 'n')
+    if kind == 'inlineStr':
+        return ''.join(t.text or '' for t in cell.iter() if local_name(t.tag) == 't')
+    value = None
+    for child in cell:
+        if local_name(child.tag) == 'v':
+            value = child.text
+    if value is None or value == '':
+        return None
+    if kind == 's':
+        return strings[int(value)]
+    if kind in ('str', 'e'):
+        return value
+    if kind == 'b':
+        return int(value)
+    return to_number(value)
+
+def read_xlsx_rows(excel, sheet):
+    with zipfile.ZipFile(excel) as book:
+        strings = read_shared_strings(book)
+        part = find_sheet_xml(book, sheet)
+        width = 0
+        next_row = 1
+        with book.open(part) as f:
+            for event, elem in ET.iterparse(f):
+                name = local_name(elem.tag)
+                if name == 'dimension':
+                    ref = elem.get('ref', '').split(':')[-1]
+                    width = column_index(ref) + 1 if ref else 0
+                elif name == 'row':
+                    number = int(elem.get('r', next_row))
+                    # rows without any cell are not written to the sheet
+                    while next_row < number:
+                        yield [None]*width
+                        next_row += 1
+                    row = [None]*width
+                    for n, cell in enumerate(c for c in elem if local_name(c.tag) == 'c'):
+                        col = column_index(cell.get('r')) if cell.get('r') else n
+                        if col >= len(row):
+                            row += [None]*(col + 1 - len(row))
+                        row[col] = cell_value(cell, strings)
+                    next_row = number + 1
+                    elem.clear()
+                    yield row
+
+def csv_cell(text):
+    """
+    Only plain decimals become numbers, so colors like 00000000 or 1e000000
+    and zero padded file names keep their text. Numeric columns convert
+    the text cells themselves.
+    """
+    if text == '':
+        return None
+    if CSV_NUMBER.fullmatch(text.strip()):
+        return to_number(text)
+    return text
+
+def read_csv_rows(path):
+    # the csv files exported by Excel start with a BOM
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.reader(f):
+            yield [csv_cell(c) for c in row]
+
+def read_xls_rows(excel, sheet):
+    # the old binary format is only readable through pandas
+    import pandas as pd
+    for row in pd.read_excel(excel, sheet, header=None).values.tolist():
+        yield [None if isinstance(c, float) and c != c else c for c in row]
+
+def read_rows(excel, sheet):
+    """
+    Yields the rows of a sheet lazily. .csv files have a single sheet so
+    sheet is ignored for them.
+    """
+    ext = os.path.splitext(excel)[1].lower()
+    if ext == '.csv':
+        return read_csv_rows(excel)
+    if ext == '.xls':
+        return read_xls_rows(excel, sheet)
+    return read_xlsx_rows(excel, sheet)
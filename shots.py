@@ -0,0 +1,220 @@
+"""
+Shot boundary index of the source videos, to start a 'clip' section from
+instead of scrubbing every file by hand. Each file is decoded once at a
+tiny grey resolution and every frame is compared with the one before it:
+the mean pixel difference catches hard cuts, the grey histogram distance
+keeps camera moves and flashes from looking like one. Frames where both
+jump are cut candidates.
+
+The candidates of a file are kept in .ritebite/shots next to the workbook,
+checked against the file mtime and size, and files are indexed one per
+worker process. draft_rows() turns the shots into clip rows:
+
+    python -m RiteBite.shots Editing.xlsx Nimona -o nimona_clips.csv
+"""
+
+import argparse
+import csv
+import glob
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+
+from .cache import CACHE_FOLDER
+from . import profiling  # noqa: F401, sets up the add-on's logger
+from .probe import MediaIndex, media_index_path, file_stamp
+from .proxies import FFMPEG
+from .sections import CLIP_COLUMNS
+from .workers import run_jobs, read_chunks
+
+# run as python -m RiteBite.shots this module is __main__, keep it under the
+# add-on's logger so it gets its format and RITEBITE_LOG_LEVEL
+log = logging.getLogger(f"{__package__}.shots" if __name__ == "__main__" else __name__)
+
+INDEX_VERSION = 1
+# decode size, enough to tell shots apart
+WIDTH = 64
+HEIGHT = 36
+BINS = 32
+# a frame is a candidate when both distances pass these
+DIFF_THRESHOLD = 0.08
+HIST_THRESHOLD = 0.25
+# candidates closer than this to the previous one are flashes, not cuts
+MIN_SHOT = 12
+# frames decoded and compared at a time
+CHUNK_FRAMES = 2000
+SOURCE_PATTERNS = ('*.MOV', '*.mov', '*.MP4', '*.mp4')
+
+def shots_folder(excel):
+    return os.path.join(os.path.dirname(excel), CACHE_FOLDER, 'shots')
+
+def index_file(folder, path):
+    digest = hashlib.md5(os.path.abspath(path).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(folder, f"{os.path.basename(path)}_{digest}.json")
+
+def decode_chunks(path, chunk=CHUNK_FRAMES):
+    """
+    The frames of path as (frames, HEIGHT, WIDTH) uint8 grey arrays of up
+    to chunk frames
+    """
+    cmd = [FFMPEG, '-v', 'error', '-i', path, '-an', '-vf', f"scale={WIDTH}:{HEIGHT}:flags=area",
+           '-pix_fmt', 'gray', '-f', 'rawvideo', '-']
+    size = WIDTH * HEIGHT
+    for data in read_chunks(cmd, size * chunk):
+        if len(data) >= size:
+            yield np.frombuffer(data[:len(data) // size * size], dtype=np.uint8).reshape(-1, HEIGHT, WIDTH)
+
+def distances(frames):
+    """
+    (difference, histogram) distance of every frame to the one before,
+    both 0..1 and 0 for the first frame
+    """
+    count = len(frames)
+    pixels = frames.reshape(count, -1)
+    diff = np.zeros(count)
+    diff[1:] = np.abs(np.diff(pixels.astype(np.int16), axis=0)).mean(axis=1) / 255
+    # one bincount over all frames, each frame's bins offset by its index
+    bins = (pixels >> (8 - int(np.log2(BINS)))).astype(np.int64) + np.arange(count)[:, None] * BINS
+    hist = np.bincount(bins.ravel(), minlength=count * BINS).reshape(count, BINS) / pixels.shape[1]
+    hist_dist = np.zeros(count)
+    hist_dist[1:] = 0.5 * np.abs(np.diff(hist, axis=0)).sum(axis=1)
+    return diff, hist_dist
+
+def find_cuts(diff, hist_dist, min_shot=MIN_SHOT):
+    """
+    1-based first frames of the shots after the first one
+    """
+    candidates = np.flatnonzero((diff > DIFF_THRESHOLD) & (hist_dist > HIST_THRESHOLD))
+    cuts = []
+    for frame in candidates.tolist():
+        if frame - (cuts[-1] if cuts else 0) >= min_shot:
+            cuts.append(frame)
+    return [frame + 1 for frame in cuts]
+
+def index_shots(path):
+    """
+    The index entry of one file, runs in a worker process
+    """
+    diffs, hists = [], []
+    previous = None
+    for frames in decode_chunks(path):
+        # each chunk is compared against the last frame of the one before
+        if previous is not None:
+            frames = np.concatenate([previous, frames])
+        diff, hist_dist = distances(frames)
+        skip = 0 if previous is None else 1
+        diffs.append(diff[skip:])
+        hists.append(hist_dist[skip:])
+        previous = frames[-1:]
+    diff = np.concatenate(diffs) if diffs else np.zeros(0)
+    hist_dist = np.concatenate(hists) if hists else np.zeros(0)
+    cuts = find_cuts(diff, hist_dist)
+    return {'version': INDEX_VERSION, 'stamp': file_stamp(path), 'frames': len(diff), 'cuts': cuts,
+            'scores': [[round(float(diff[c-1]), 3), round(float(hist_dist[c-1]), 3)] for c in cuts]}
+
+def load_index(folder, path):
+    """
+    The stored index of a file, None when there is none or the file changed
+    """
+    try:
+        with open(index_file(folder, path), encoding='utf-8') as f:
+            entry = json.load(f)
+        if entry.get('version') == INDEX_VERSION and entry['stamp'] == file_stamp(path):
+            return entry
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def save_index(folder, path, entry):
+    try:
+        os.makedirs(folder, exist_ok=True)
+        target = index_file(folder, path)
+        with open(target + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(target + '.tmp', target)
+    except OSError as e:
+        log.warning(f"Could not write shot index of {path}\n{e}")
+
+def build_indexes(folder, paths, workers=None):
+    """
+    {path: index entry} of paths, indexing the files that have none or
+    changed, one file per worker
+    """
+    indexes = {path: load_index(folder, path) for path in paths}
+    missing = [path for path, entry in indexes.items() if entry is None]
+    if not missing:
+        return indexes
+    if shutil.which(FFMPEG) is None:
+        log.warning(f"{FFMPEG} not found, can't index {len(missing)} files")
+        return {path: entry for path, entry in indexes.items() if entry is not None}
+
+    for (path,), entry, error in run_jobs(index_shots, [(path,) for path in missing],
+                                          (subprocess.CalledProcessError, ValueError), workers):
+        if error is not None:
+            log.warning(f"Failed to index {path}\n{getattr(error, 'stderr', None) or error}")
+            continue
+        indexes[path] = entry
+        save_index(folder, path, entry)
+        log.info(f"{os.path.basename(path)}: {len(entry['cuts'])} cuts in {entry['frames']} frames")
+    return {path: entry for path, entry in indexes.items() if entry is not None}
+
+def draft_rows(indexes, video_folder_path, frames=None, min_shot=MIN_SHOT):
+    """
+    'clip' section rows, header included, with one row per shot of every
+    indexed file in name order. frames overrides the decoded frame count
+    per path (the probed one is exact where the decode may drop a frame).
+    """
+    names = [name for name, _ in CLIP_COLUMNS]
+    rows = [['clip'] + names[1:]]
+    for path in sorted(indexes):
+        entry = indexes[path]
+        last = (frames or {}).get(path) or entry['frames']
+        starts = [1] + entry['cuts']
+        ends = [cut - 1 for cut in entry['cuts']] + [last]
+        for start, end in zip(starts, ends):
+            if end - start + 1 < min_shot:
+                continue
+            rows.append([os.path.relpath(path, video_folder_path), start, end, 1, 'NO', 1, 1])
+    return rows
+
+def source_files(video_folder_path):
+    files = set()
+    for pattern in SOURCE_PATTERNS:
+        files.update(glob.glob(os.path.join(video_folder_path, pattern)))
+    return sorted(files)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m RiteBite.shots',
+                                     description='Index the shots of a sheet\'s videos and draft its clip rows')
+    parser.add_argument('workbook')
+    parser.add_argument('sheet')
+    parser.add_argument('files', nargs='*', help='videos to index (default: every video in the sheet folder)')
+    parser.add_argument('-o', '--output', help='CSV file for the draft rows (default: print to stdout)')
+    parser.add_argument('--workers', type=int, help='files indexed at the same time')
+    args = parser.parse_args(argv)
+
+    excel = os.path.abspath(args.workbook)
+    video_folder_path = os.path.dirname(excel) + os.sep + args.sheet
+    paths = [os.path.join(video_folder_path, f) for f in args.files] or source_files(video_folder_path)
+    if not paths:
+        log.error(f"No videos found in {video_folder_path}")
+        return 1
+    media = MediaIndex(media_index_path(excel))
+    media.probe(paths)
+    frames = {path: (media.get(path) or {}).get('frames') for path in paths}
+    rows = draft_rows(build_indexes(shots_folder(excel), paths, args.workers), video_folder_path, frames)
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+    else:
+        csv.writer(sys.stdout).writerows(rows)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Fast path for clips only cuts: instead of building a timeline and
+rendering it, every clip is cut straight out of its source with ffmpeg.
+The whole GOPs between the first and last keyframe inside a clip are
+stream copied, only the partial GOPs at its ends are re-encoded, and the
+pieces are joined with the concat demuxer. The sound of every clip is
+trimmed sample exact, its volume applied, and muxed in once.
+
+This only works when every clip has been probed and shares codec,
+profile, level, size, frame rate, pixel format and timescale with the
+others, the re-encoded pieces are made to match them. fast_cut() returns
+False otherwise, or when the joined file doesn't have the frames and
+duration it should, and the caller renders the usual way.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from .plan import clip_range
+from .probe import FFPROBE, frame_rate, run_ffprobe
+from .proxies import FFMPEG
+from .profiling import stage
+from .render import concat_quote
+
+log = logging.getLogger(__name__)
+
+# codecs the partial GOPs can be re-encoded to, so they join the copied ones
+ENCODERS = {'h264': 'libx264', 'hevc': 'libx265'}
+# quality of the re-encoded partial GOPs, close enough to the camera files
+# that the seams don't show
+ENCODE_CRF = '16'
+# ffprobe profile -> encoder profile, other profiles can't be matched
+PROFILES = {'h264': {'Constrained Baseline': 'baseline', 'Baseline': 'baseline', 'Main': 'main', 'High': 'high',
+                     'High 10': 'high10', 'High 4:2:2': 'high422', 'High 4:4:4 Predictive': 'high444'},
+            'hevc': {'Main': 'main', 'Main 10': 'main10'}}
+AUDIO_RATE = 48000
+
+def split_clip(start, end, keyframes, fps):
+    """
+    [(mode, start, end), ...] times of the pieces of a clip: 'copy' for the
+    whole GOPs from the first to the last keyframe inside start..end and
+    'encode' for what is left at either end
+    """
+    half = 0.5 / fps
+    inside = [k for k in keyframes if start - half <= k <= end + half]
+    if len(inside) < 2:
+        return [('encode', start, end)]
+    first, last = inside[0], inside[-1]
+    pieces = []
+    if first - start > half:
+        pieces.append(('encode', start, first))
+    pieces.append(('copy', max(first, start), last))
+    if end - last > half:
+        pieces.append(('encode', last, end))
+    return pieces
+
+def plan_fast_cut(clips, video_folder_path, media):
+    """
+    The pieces of every visible clip plus the shared video format, None
+    (and the reason logged) when the clips can't be stream copied
+    """
+    if shutil.which(FFMPEG) is None or shutil.which(FFPROBE) is None:
+        log.info("ffmpeg or ffprobe not found, no stream copy")
+        return None
+    visible = [clip for clip in clips if clip.show == 1]
+    if not visible:
+        return None
+    formats = set()
+    plan = []
+    for clip in visible:
+        path = os.path.join(video_folder_path, clip.file)
+        info = media.get(path)
+        if info is None or info['codec'] not in ENCODERS or not info['fps']:
+            log.info(f"{clip.file} can't be stream copied")
+            return None
+        if info['profile'] not in PROFILES[info['codec']] or not info['level'] or not info['timescale'] or not info['pix_fmt']:
+            log.info(f"The {info['profile']} profile, level or timescale of {clip.file} can't be matched, no stream copy")
+            return None
+        formats.add((info['codec'], info['width'], info['height'], info['rate'] or str(info['fps']), info['pix_fmt'],
+                     info['profile'], info['level'], info['timescale']))
+        keyframes = media.keyframes(path)
+        if not keyframes:
+            log.info(f"No keyframes found in {clip.file}")
+            return None
+        start, end, count = clip_range(clip, info)
+        clip_start = (start - 1) / info['fps']
+        clip_end = end / info['fps']
+        plan.append({'file': path, 'start': clip_start, 'end': clip_end, 'frames': count, 'volume': float(clip.sound),
+                     'audio': bool(info['audio']), 'pieces': split_clip(clip_start, clip_end, keyframes, info['fps'])})
+    media.save()
+    if len(formats) != 1:
+        log.info("The clips differ in codec, profile, level, size, frame rate, pixel format or timescale, no stream copy")
+        return None
+    return plan, formats.pop()
+
+def encode_level(codec, level):
+    """
+    ffprobe level -> encoder level, h264 counts tenths and hevc thirtieths
+    """
+    return f"{level / 10:.1f}" if codec == 'h264' else f"{level / 30:.1f}"
+
+def piece_command(mode, source, start, end, target, video_format):
+    """
+    Cuts one piece, re-encoded pieces get the profile, level and pixel
+    format of the copied ones and every piece the same timescale
+    """
+    codec, _, _, rate, pix_fmt, profile, level, timescale = video_format
+    cmd = [FFMPEG, '-v', 'error', '-y', '-ss', f"{start:.6f}", '-i', source, '-t', f"{end - start:.6f}",
+           '-map', '0:v:0', '-an']
+    if mode == 'copy':
+        cmd += ['-c:v', 'copy', '-avoid_negative_ts', 'make_zero']
+    else:
+        cmd += ['-c:v', ENCODERS[codec], '-preset', 'veryfast', '-crf', ENCODE_CRF, '-r', rate,
+                '-pix_fmt', pix_fmt, '-profile:v', PROFILES[codec][profile]]
+        if codec == 'h264':
+            cmd += ['-level', encode_level(codec, level)]
+        else:
+            cmd += ['-x265-params', f"level-idc={encode_level(codec, level)}"]
+    return cmd + ['-video_track_timescale', str(timescale), target]
+
+def mux_command(plan, list_file, output, timescale):
+    """
+    Joins the video pieces and mixes the trimmed clip sounds, silence for
+    clips without any, under them
+    """
+    cmd = [FFMPEG, '-v', 'error', '-y', '-f', 'concat', '-safe', '0', '-i', list_file]
+    filters = []
+    for n, clip in enumerate(plan):
+        duration = f"{clip['end'] - clip['start']:.6f}"
+        if clip['audio']:
+            cmd += ['-ss', f"{clip['start']:.6f}", '-t', duration, '-i', clip['file']]
+        else:
+            cmd += ['-f', 'lavfi', '-t', duration, '-i', f"anullsrc=r={AUDIO_RATE}:cl=stereo"]
+        filters.append(f"[{n+1}:a:0]aresample={AUDIO_RATE},volume={clip['volume']}[a{n}]")
+    inputs = ''.join(f"[a{n}]" for n in range(len(plan)))
+    filters.append(f"{inputs}concat=n={len(plan)}:v=0:a=1[a]")
+    cmd += ['-filter_complex', ';'.join(filters), '-map', '0:v', '-map', '[a]',
+            '-c:v', 'copy', '-video_track_timescale', str(timescale), '-c:a', 'aac', '-b:a', '320k', output]
+    return cmd
+
+def check_output(path, plan, fps):
+    """
+    True when the joined file at path has the frames and duration of the
+    clips, a frame either way per clip for the seams
+    """
+    try:
+        info = run_ffprobe(path)
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        log.warning(f"Could not probe the stream copy {path}\n{e}")
+        return False
+    frames = sum(clip['frames'] for clip in plan)
+    duration = sum(clip['end'] - clip['start'] for clip in plan)
+    if info['frames'] is None or abs(info['frames'] - frames) > len(plan):
+        log.warning(f"The stream copy has {info['frames']} frames instead of {frames}")
+        return False
+    if abs(info['duration'] - duration) > len(plan) / fps:
+        log.warning(f"The stream copy lasts {info['duration']:.3f}s instead of {duration:.3f}s")
+        return False
+    return True
+
+def fast_cut(clips, video_folder_path, media, output, workers=None):
+    """
+    Writes the cut of clips to output by stream copy. Returns False when
+    the clips don't allow it, ffmpeg fails or the result doesn't check
+    out, output is then left alone.
+    """
+    with stage('keyframes'):
+        planned = plan_fast_cut(clips, video_folder_path, media)
+    if planned is None:
+        return False
+    plan, video_format = planned
+    copied = sum(end - start for clip in plan for mode, start, end in clip['pieces'] if mode == 'copy')
+    total = sum(clip['end'] - clip['start'] for clip in plan)
+    log.info(f"Stream copying {copied:.1f}s of {total:.1f}s, re-encoding the rest")
+
+    work = tempfile.mkdtemp(prefix='ritebite_cut_', dir=os.path.dirname(output) or None)
+    try:
+        jobs = []
+        for n, clip in enumerate(plan):
+            for m, (mode, start, end) in enumerate(clip['pieces']):
+                target = os.path.join(work, f"piece_{n:04d}_{m}.mp4")
+                jobs.append((target, piece_command(mode, clip['file'], start, end, target, video_format)))
+        list_file = os.path.join(work, 'pieces.txt')
+        with open(list_file, 'w', encoding='utf-8') as f:
+            for target, _ in jobs:
+                f.write(f"file {concat_quote(target)}\n")
+        with stage('stream copy'), ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            list(pool.map(lambda job: subprocess.run(job[1], capture_output=True, check=True), jobs))
+            subprocess.run(mux_command(plan, list_file, output + '.tmp.mp4', video_format[7]), capture_output=True, check=True)
+        if not check_output(output + '.tmp.mp4', plan, frame_rate(video_format[3])):
+            log.warning("Stream copy doesn't match the clips, rendering instead")
+            os.remove(output + '.tmp.mp4')
+            return False
+        os.replace(output + '.tmp.mp4', output)
+    except (OSError, subprocess.CalledProcessError) as e:
+        log.warning(f"Stream copy failed, rendering instead\n{getattr(e, 'stderr', None) or e}")
+        return False
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    log.info(f"Wrote {output}")
+    return True
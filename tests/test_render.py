@@ -0,0 +1,69 @@
+"""
+Segment cache hashing of render.py, run against the bpy stand-in of
+benchmark.py:
+
+    python -m pytest tests
+"""
+
+import importlib
+import os
+import sys
+import types
+
+FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if os.path.dirname(FOLDER) not in sys.path:
+    sys.path.insert(0, os.path.dirname(FOLDER))
+PACKAGE = os.path.basename(FOLDER)
+
+benchmark = importlib.import_module(PACKAGE + '.benchmark')
+if 'bpy' not in sys.modules:
+    benchmark.install_stand_in()
+render = importlib.import_module(PACKAGE + '.render')
+
+SETTINGS = {'size': [1920, 1080, 100], 'fps': [25, 1.0]}
+
+class FakeStrip:
+    """
+    Strip with just enough RNA for rna_values()
+    """
+    def __init__(self, **values):
+        self.__dict__.update(values)
+        self.bl_rna = types.SimpleNamespace(properties=[types.SimpleNamespace(identifier=name, type='INT')
+                                                        for name in values])
+
+def strip(kind, name, start, length, channel, **values):
+    return FakeStrip(name=name, type=kind, mute=False, channel=channel, frame_start=start,
+                     frame_final_start=start, frame_final_end=start + length, frame_final_duration=length,
+                     frame_offset_start=0, frame_offset_end=0, blend_type='ALPHA_OVER', blend_alpha=1.0,
+                     **values)
+
+def text(start, name='text', content='title'):
+    return strip('TEXT', name, start, 100, 5, text=content, font=None)
+
+def meta(length, children):
+    return strip('META', 'clips', 0, length, 2, sequences=children)
+
+def test_shifted_segment_is_a_cache_hit():
+    before = render.segment_hash([text(100)], {}, 100, 149, SETTINGS)
+    # rebuilt with another name and moved along the timeline
+    after = render.segment_hash([text(150, name='text.001')], {}, 150, 199, SETTINGS)
+    assert before == after
+
+def test_edited_strip_misses():
+    before = render.segment_hash([text(100)], {}, 100, 149, SETTINGS)
+    after = render.segment_hash([text(100, content='other title')], {}, 100, 149, SETTINGS)
+    assert before != after
+
+def test_meta_length_does_not_touch_other_segments():
+    movie = strip('MOVIE', 'clip', 0, 100, 1, filepath='clip.mov')
+    later = strip('MOVIE', 'clip.001', 100, 100, 1, filepath='clip.mov')
+    short = [meta(200, [movie, later]), movie, later]
+    longer_clip = strip('MOVIE', 'clip.001', 100, 400, 1, filepath='clip.mov')
+    longer = [meta(500, [movie, longer_clip]), movie, longer_clip]
+    assert render.segment_hash(short, {}, 0, 99, SETTINGS) == render.segment_hash(longer, {}, 0, 99, SETTINGS)
+
+def test_muted_meta_hides_its_children():
+    movie = strip('MOVIE', 'clip', 0, 100, 1, filepath='clip.mov')
+    muted = meta(100, [movie])
+    muted.mute = True
+    assert render.segment_hash([muted, movie], {}, 0, 99, SETTINGS) == render.segment_hash([], {}, 0, 99, SETTINGS)
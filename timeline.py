@@ -0,0 +1,171 @@
+"""
+Columnar model of a parsed sheet. Each element type is a Section that keeps
+one column per field (numpy arrays for numbers and flags, lists for text),
+so whole-timeline transforms are single array operations. Iterating a
+Section yields light __slots__ records for the strip builders.
+"""
+
+import numpy as np
+
+FRAME_WIDTH = 1920
+FRAME_HEIGHT = 1080
+
+class Record:
+    __slots__ = ()
+    # fields kept as python lists of str, the rest are numpy columns
+    strings = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __str__(self):
+        return ','.join(str(v) for v in self.values())
+
+class Text(Record):
+    __slots__ = ('text', 'start', 'end', 'font', 'size', 'x', 'y', 'color', 'shadow', 'box', 'box_color', 'bold', 'italic', 'channel', 'group', 'show')
+    strings = ('text', 'font', 'color', 'box_color')
+
+class Image(Record):
+    __slots__ = ('file', 'start', 'end', 'x', 'y', 'scale_x', 'scale_y', 'channel', 'show')
+    strings = ('file',)
+
+class Color(Record):
+    __slots__ = ('color', 'start', 'end', 'x', 'y', 'scale_x', 'scale_y', 'channel', 'show')
+    strings = ('color',)
+
+class Clip(Record):
+    __slots__ = ('file', 'start', 'end', 'sound', 'effect', 'channel', 'show')
+    strings = ('file', 'effect')
+
+class Audio(Record):
+    __slots__ = ('file', 'start', 'end', 'sound', 'channel', 'show')
+    strings = ('file',)
+
+def to_pixels_x(x):
+    """
+    Sheet x (0..1 from the left) to a strip offset from the frame centre
+    """
+    return FRAME_WIDTH*x - FRAME_WIDTH/2.0
+
+def to_pixels_y(y):
+    """
+    Sheet y (0..1 from the top) to a strip offset from the frame centre
+    """
+    return FRAME_HEIGHT/2.0 - FRAME_HEIGHT*y
+
+class Section:
+    """
+    The rows of one element type, stored column by column
+    """
+    __slots__ = ('record', 'columns')
+
+    def __init__(self, record, columns=None):
+        self.record = record
+        self.columns = {}
+        columns = columns or {}
+        for name in record.__slots__:
+            values = columns.get(name, [])
+            if name in record.strings:
+                self.columns[name] = list(values)
+            else:
+                self.columns[name] = np.asarray(values)
+
+    def __len__(self):
+        return len(self.columns[self.record.__slots__[0]])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __iter__(self):
+        names = self.record.__slots__
+        values = [self.columns[n] if n in self.record.strings else self.columns[n].tolist() for n in names]
+        for row in zip(*values):
+            yield self.record(*row)
+
+    def replace(self, **columns):
+        """
+        Copy of the section with some columns swapped out
+        """
+        return Section(self.record, {**self.columns, **columns})
+
+    def select(self, mask):
+        """
+        Rows picked by a boolean mask or an index array
+        """
+        index = np.flatnonzero(mask) if np.asarray(mask).dtype == bool else np.asarray(mask, dtype=np.int64)
+        return Section(self.record, {
+            name: [col[i] for i in index.tolist()] if name in self.record.strings else col[index]
+            for name, col in self.columns.items()})
+
+    def concat(self, other):
+        # an empty section has no dtypes yet, don't let it turn ints to floats
+        if not len(self):
+            return other
+        if not len(other):
+            return self
+        return Section(self.record, {
+            name: col + other.columns[name] if name in self.record.strings else np.concatenate([col, other.columns[name]])
+            for name, col in self.columns.items()})
+
+    def visible(self):
+        return self.select(self.columns['show'].astype(bool))
+
+    def shift(self, frames):
+        return self.replace(start=self.columns['start'] + frames, end=self.columns['end'] + frames)
+
+KINDS = ('clip', 'text', 'image', 'color', 'sound')
+
+class Timeline:
+    """
+    Every element of a sheet, one Section per element type. This is what
+    the sheet parser produces and what the strip builders consume.
+    """
+    __slots__ = ('clips', 'texts', 'images', 'colors', 'audios')
+
+    def __init__(self, clips=None, texts=None, images=None, colors=None, audios=None):
+        self.clips  = clips  if clips  is not None else Section(Clip)
+        self.texts  = texts  if texts  is not None else Section(Text)
+        self.images = images if images is not None else Section(Image)
+        self.colors = colors if colors is not None else Section(Color)
+        self.audios = audios if audios is not None else Section(Audio)
+
+    def sections(self):
+        return dict(zip(KINDS, (self.clips, self.texts, self.images, self.colors, self.audios)))
+
+    def add(self, kind, section):
+        """
+        Appends a parsed section, a sheet may repeat a section type
+        """
+        name = {'clip': 'clips', 'text': 'texts', 'image': 'images', 'color': 'colors', 'sound': 'audios'}[kind]
+        setattr(self, name, getattr(self, name).concat(section))
+
+    def __len__(self):
+        return sum(len(section) for section in self.sections().values())
+
+    def visible(self):
+        """
+        Only the rows whose show flag is set
+        """
+        return Timeline(*(section.visible() for section in self.sections().values()))
+
+    def shift(self, frames):
+        """
+        Moves every overlay (text, image, color and sound rows) by frames.
+        Clips are not touched, their start/end are frames of the source
+        video and they are chained one after another.
+        """
+        return Timeline(self.clips, self.texts.shift(frames), self.images.shift(frames),
+                        self.colors.shift(frames), self.audios.shift(frames))
+
+    def scale_positions(self, scale_x, scale_y):
+        """
+        Scales every overlay position about the frame centre
+        """
+        texts = self.texts.replace(x=0.5 + (self.texts['x'] - 0.5)*scale_x, y=0.5 + (self.texts['y'] - 0.5)*scale_y)
+        images = self.images.replace(x=self.images['x']*scale_x, y=self.images['y']*scale_y)
+        colors = self.colors.replace(x=self.colors['x']*scale_x, y=self.colors['y']*scale_y)
+        return Timeline(self.clips, texts, images, colors, self.audios)
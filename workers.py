@@ -0,0 +1,64 @@
+"""
+Helpers shared by the media analysis modules (loudness, shots, peaks):
+running a function over many jobs in worker processes, and reading the raw
+output of an ffmpeg decode a chunk at a time.
+
+Inside Blender the jobs run on threads instead. Forking would copy the
+whole Blender process, sometimes from the modal Create's compile thread.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+log = logging.getLogger(__name__)
+
+def in_blender():
+    return 'bpy' in sys.modules
+
+def run_jobs(function, jobs, errors=(), workers=None):
+    """
+    [(job, result, error)] of function(*job) for every job, in job order.
+    A job that raised one of errors has its exception as error and None as
+    result, anything else is raised. function must be a module level
+    function so it can be sent to a worker process.
+    """
+    def run(executor):
+        with executor(max_workers=workers or os.cpu_count()) as pool:
+            futures = [pool.submit(function, *job) for job in jobs]
+            results = []
+            for job, future in zip(jobs, futures):
+                try:
+                    results.append((job, future.result(), None))
+                except errors as e:
+                    results.append((job, None, e))
+            return results
+
+    if not jobs:
+        return []
+    if not in_blender():
+        try:
+            return run(ProcessPoolExecutor)
+        except (BrokenProcessPool, OSError) as e:
+            # frozen or embedded interpreters can't always start workers
+            log.info(f"No worker processes ({e}), running on threads")
+    return run(ThreadPoolExecutor)
+
+def read_chunks(cmd, size):
+    """
+    The stdout of cmd (an ffmpeg decode to a pipe) in chunks of size bytes,
+    the last one shorter, so a long file never sits in memory whole.
+    Raises CalledProcessError with ffmpeg's stderr when it fails.
+    """
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        while True:
+            data = proc.stdout.read(size)
+            if not data:
+                break
+            yield data
+        stderr = proc.stderr.read()
+        if proc.wait():
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)